@@ -150,7 +150,8 @@ async def application_exception_handler(request: Request, exc: ApplicationExcept
         content={
             "detail": exc.message,
             "type": "application_error",
-            "details": exc.details,
+            # Copied only when there is something to copy; most errors carry no details
+            "details": dict(exc.details) if exc.details else {},
         },
     )
 
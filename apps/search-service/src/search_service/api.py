@@ -63,6 +63,15 @@ class SearchRequest(BaseModel):
     k: int = Field(default=10, ge=1, le=100, description="Number of results to return")
 
 
+class BatchSearchRequest(BaseModel):
+    """Request to search several query vectors against one index."""
+
+    library_id: str
+    config_id: str
+    query_vectors: list[list[float]] = Field(min_length=1, max_length=256)
+    k: int = Field(default=10, ge=1, le=100, description="Number of results to return per query")
+
+
 class SearchResult(BaseModel):
     """Single search result."""
 
@@ -79,6 +88,12 @@ class SearchResponse(BaseModel):
     total: int
 
 
+class BatchSearchResponse(BaseModel):
+    """Response from batch search endpoint, one entry per query in request order."""
+
+    responses: list[SearchResponse]
+
+
 class IndexStats(BaseModel):
     """Statistics for a single index."""
 
@@ -96,12 +111,47 @@ class StatsResponse(BaseModel):
     total_embeddings: int
 
 
-def create_search_app(index_manager: VectorIndexManager, database_url: str) -> FastAPI:
+async def fetch_chunk_content(pool: asyncpg.Pool, embedding_ids: list[str]) -> dict[str, tuple[str, str | None]]:
+    """Map embedding id -> (chunk_id, content) for the given embeddings."""
+    rows = await pool.fetch(
+        """
+        SELECT e.id as embedding_id, e.chunk_id, c.content
+        FROM embeddings e
+        JOIN chunks c ON e.chunk_id = c.id
+        WHERE e.id::text = ANY($1::text[])
+        """,
+        embedding_ids,
+    )
+    return {str(row["embedding_id"]): (str(row["chunk_id"]), row["content"]) for row in rows}
+
+
+def build_search_response(
+    embedding_ids: list[str], distances: list[float], content_map: dict[str, tuple[str, str | None]]
+) -> SearchResponse:
+    """Construct results maintaining order from search."""
+    results = []
+    for embedding_id, distance in zip(embedding_ids, distances, strict=False):
+        chunk_id, content = content_map.get(embedding_id, ("", None))
+        results.append(
+            SearchResult(
+                embedding_id=embedding_id,
+                chunk_id=chunk_id,
+                distance=distance,
+                content=content,
+            )
+        )
+    return SearchResponse(results=results, total=len(results))
+
+
+def create_search_app(
+    index_manager: VectorIndexManager, database_url: str, db_pool: asyncpg.Pool | None = None
+) -> FastAPI:
     """Create FastAPI application for search service.
 
     Args:
         index_manager: Vector index manager singleton
         database_url: PostgreSQL connection string
+        db_pool: Shared connection pool; if None, the app creates (and closes) its own
 
     Returns:
         FastAPI application
@@ -114,6 +164,11 @@ def create_search_app(index_manager: VectorIndexManager, database_url: str) -> F
         """Manage application lifespan."""
         nonlocal pool
         logger.info("Starting search service API...")
+        if db_pool is not None:
+            pool = db_pool
+            logger.info("Using shared database pool")
+            yield
+            return
         pool = await asyncpg.create_pool(database_url, min_size=2, max_size=10)
         logger.info("Database pool ready")
         yield
@@ -226,38 +281,42 @@ def create_search_app(index_manager: VectorIndexManager, database_url: str) -> F
                 return SearchResponse(results=[], total=0)
 
             # Enrich with chunk content from database
-            rows = await pool.fetch(
-                """
-                SELECT e.id as embedding_id, e.chunk_id, c.content
-                FROM embeddings e
-                JOIN chunks c ON e.chunk_id = c.id
-                WHERE e.id::text = ANY($1::text[])
-                """,
-                embedding_ids,
-            )
-
-            # Build result mapping
-            content_map = {str(row["embedding_id"]): (str(row["chunk_id"]), row["content"]) for row in rows}
-
-            # Construct results maintaining order from search
-            results = []
-            for embedding_id, distance in zip(embedding_ids, distances, strict=False):
-                chunk_id, content = content_map.get(embedding_id, ("", None))
-                results.append(
-                    SearchResult(
-                        embedding_id=embedding_id,
-                        chunk_id=chunk_id,
-                        distance=distance,
-                        content=content,
-                    )
-                )
-
-            return SearchResponse(results=results, total=len(results))
+            content_map = await fetch_chunk_content(pool, embedding_ids)
+            return build_search_response(embedding_ids, distances, content_map)
 
         except Exception as e:
             logger.error("Search failed: %s", str(e))
             raise HTTPException(status_code=500, detail=f"Search failed: {e!s}") from e
 
+    @app.post("/search/batch", response_model=BatchSearchResponse)
+    async def search_batch(request: BatchSearchRequest) -> BatchSearchResponse:
+        """Batch vector similarity search endpoint.
+
+        All queries are scored in one blocked matrix-matrix pass over the index, and
+        chunk content for every hit is fetched with a single query.
+        """
+        if not pool:
+            msg = "Database pool not initialized"
+            raise HTTPException(status_code=503, detail=msg)
+
+        try:
+            hits = index_manager.search_batch(
+                library_id=request.library_id,
+                config_id=request.config_id,
+                query_vectors=request.query_vectors,
+                k=request.k,
+            )
+
+            all_ids = list({embedding_id for embedding_ids, _ in hits for embedding_id in embedding_ids})
+            content_map = await fetch_chunk_content(pool, all_ids) if all_ids else {}
+            return BatchSearchResponse(
+                responses=[build_search_response(ids, distances, content_map) for ids, distances in hits]
+            )
+
+        except Exception as e:
+            logger.error("Batch search failed: %s", str(e))
+            raise HTTPException(status_code=500, detail=f"Batch search failed: {e!s}") from e
+
     @app.get("/stats", response_model=StatsResponse)
     async def stats() -> StatsResponse:
         """Index statistics endpoint."""
@@ -3,30 +3,166 @@
 Supported strategies and complexity (n vectors, d dims, k results):
 - FLAT (brute-force exact):
   - Time: O(n·d) per query; Space: O(n·d)
-  - Simple, exact results; no preprocessing.
+  - Exact results; COSINE rows are normalized once at insert time.
 - IVF-Flat (coarse quantization, exact within probed lists):
   - Build: centroids (nlist) + posting lists
   - Query: probe nprobe closest centroids; exact on candidates only
   - Time: O(nlist·d + nprobe·(n/nlist)·d) expected; Space: O(n·d + nlist·d + n)
   - Sublinear for suitable nlist/nprobe; no external deps.
+- SQ8 (FLAT over int8 scalar-quantized unit vectors, COSINE only):
+  - Time: O(n·d) per query, but reads 1 byte per dim instead of 4
+  - Space: O(n·d) bytes + O(n) per-row scales; small recall loss from rounding.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import math
+import multiprocessing
+import os
+import threading
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 from vdb_core.domain.value_objects import VectorIndexingStrategy, VectorSimilarityMetric
 
+if TYPE_CHECKING:
+    import asyncpg
+
 logger = logging.getLogger(__name__)
 
+# Vectors may arrive as Python lists (JSON) or as arrays from batch paths
+VectorLike = Sequence[float] | NDArray[np.floating]
+MatrixLike = Sequence[Sequence[float]] | NDArray[np.floating]
+
+# (library_id, config_id, dimensions, strategy, metric) of a run of bootstrap rows
+_BootstrapKey = tuple[str, str, int, str, VectorSimilarityMetric]
+
+# A JSONB vector as the driver returns it: JSON text, or an already-decoded list
+RawVector = str | bytes | list[float]
+
+# (key, embedding_ids, raw vectors) queued between bootstrap fetch and parse
+_BootstrapGroup = tuple[_BootstrapKey, list[str], list[RawVector]]
+
+
+def _as_float32(vector: VectorLike, dimensions: int) -> NDArray[np.float32]:
+    """Return ``vector`` as a contiguous 1-D float32 array, copying only when needed.
+
+    Float32 C-contiguous arrays are passed through as-is; lists are converted once.
+    """
+    vec = np.ascontiguousarray(vector, dtype=np.float32)
+    if vec.ndim != 1 or vec.shape[0] != dimensions:
+        got = vec.shape[0] if vec.ndim == 1 else vec.shape
+        msg = f"Vector dimension mismatch: expected {dimensions}, got {got}"
+        raise ValueError(msg)
+    return vec
+
+
+def _as_float32_matrix(matrix: MatrixLike, dimensions: int, rows: int) -> NDArray[np.float32]:
+    """Return ``matrix`` as a contiguous (rows, dimensions) float32 array."""
+    block = np.ascontiguousarray(matrix, dtype=np.float32)
+    if block.shape != (rows, dimensions):
+        msg = f"Vector block shape mismatch: expected ({rows}, {dimensions}), got {block.shape}"
+        raise ValueError(msg)
+    return block
+
+
+def _norm(vector: NDArray[np.float32]) -> float:
+    """Euclidean norm of a 1-D vector; skips ``np.linalg.norm``'s ord/axis dispatch."""
+    return math.sqrt(float(vector @ vector))
+
+
+def _row_norms(rows: NDArray[np.float32]) -> NDArray[np.float32]:
+    """Per-row Euclidean norms as a (rows, 1) column, ready to broadcast-divide."""
+    return np.sqrt(np.einsum("ij,ij->i", rows, rows))[:, np.newaxis]
+
+
+def _grow_rows(buffer: NDArray[Any] | None, size: int, shape: tuple[int, ...], dtype: DTypeLike) -> NDArray[Any]:
+    """Allocate an empty ``shape`` array and copy the first ``size`` rows of ``buffer`` in."""
+    grown = np.empty(shape, dtype=dtype)
+    if buffer is not None:
+        grown[:size] = buffer[:size]
+    return grown
+
+
+def _parse_vector_block(
+    raw_vectors: list[RawVector], dimensions: int
+) -> tuple[NDArray[np.float32], list[tuple[int, str]]]:
+    """Parse JSONB vectors into one float32 matrix; runs in a bootstrap worker process.
+
+    Returns the matrix of well-formed rows (in order) and ``(position, error)`` for
+    each rejected row, so the caller can log it against its embedding id.
+    """
+    matrix = np.empty((len(raw_vectors), dimensions), dtype=np.float32)
+    rejected: list[tuple[int, str]] = []
+    n = 0
+    for pos, raw in enumerate(raw_vectors):
+        try:
+            # json.loads takes str or bytes without a decode copy
+            vector = json.loads(raw) if isinstance(raw, (str, bytes)) else raw
+            if len(vector) != dimensions:
+                msg = f"Vector dimension mismatch: expected {dimensions}, got {len(vector)}"
+                raise ValueError(msg)
+            matrix[n] = vector
+        except (TypeError, ValueError) as e:
+            rejected.append((pos, str(e)))
+            continue
+        n += 1
+    return matrix[:n], rejected
+
+
+def _available_cpus() -> int:
+    """Count the CPUs this process may run on (its affinity mask, not every host core)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _top_k(scores: NDArray[np.float32], k: int) -> NDArray[np.intp]:
+    """Return indices of the ``k`` highest scores, best first.
+
+    ``argpartition`` selects the winners in O(n) without ordering them; only those
+    k are then sorted, so selection costs O(n + k log k) instead of a full sort.
+    """
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(scores, -k)[-k:]
+    return top[np.argsort(scores[top])[::-1]]
+
+
 class VectorIndex:
-    """In-memory vector index using NumPy."""
+    """In-memory vector index using NumPy.
+
+    Vectors live in a preallocated ``(capacity, dimensions)`` buffer that doubles
+    when full, so n inserts copy O(n·d) bytes in total; ``self.vectors`` is a view
+    of its first n rows.
+
+    When ``persist_dir`` is set, vectors live in a file-backed ``np.memmap`` instead
+    of anonymous memory, so the OS page cache decides what stays resident and an
+    index can outgrow RAM. The brute-force scan reads rows sequentially, which is
+    the access pattern the page cache handles best.
+    """
+
+    _INITIAL_CAPACITY = 16
+    _BATCH_BLOCK_ROWS = 16384
+    _MMAP_FILENAME = "vectors.f32"
+    _MMAP_MIN_ROWS = 1024
 
     def __init__(
-        self, dimensions: int, strategy: str, metric: VectorSimilarityMetric = VectorSimilarityMetric.L2
+        self,
+        dimensions: int,
+        strategy: str,
+        metric: VectorSimilarityMetric = VectorSimilarityMetric.L2,
+        persist_dir: Path | None = None,
     ) -> None:
         """
         Initialize vector index.
@@ -35,19 +171,84 @@ class VectorIndex:
             dimensions: Vector dimensions
             strategy: Indexing strategy (FLAT, HNSW, IVF, PQ)
             metric: Similarity metric to use
+            persist_dir: Directory for a memmap-backed vector file (in-memory if None)
 
         """
         self.dimensions = dimensions
         self.strategy = strategy
         self.metric = metric
+        self.persist_dir = persist_dir
 
-        # Store vectors as numpy array
-        self.vectors: NDArray[np.float32] | None = None  # Shape: (n_vectors, dimensions)
+        # Growth buffers; rows [0, _size) are stored vectors (see vectors/sq_norms)
+        self._buffer: NDArray[np.float32] | None = None  # Shape: (capacity, dimensions)
+        self._sq_norm_buffer: NDArray[np.float32] | None = None  # Shape: (capacity,)
+        self._size = 0
+        self._capacity = 0
         self.embedding_ids: list[str] = []  # Embedding IDs in same order as vectors
         self.id_to_index: dict[str, int] = {}  # embedding_id -> index mapping
         self.tombstones: set[int] = set()  # Indices of removed vectors
 
-    def add(self, embedding_id: str, vector: list[float]) -> None:
+        if persist_dir is not None:
+            persist_dir.mkdir(parents=True, exist_ok=True)
+            # Postgres is the source of truth: start from an empty file and let
+            # bootstrap/indexing repopulate it.
+            (persist_dir / self._MMAP_FILENAME).unlink(missing_ok=True)
+
+    @property
+    def vectors(self) -> NDArray[np.float32] | None:
+        """Stored vectors, shape (n_vectors, dimensions); a view of the growth buffer."""
+        if self._buffer is None:
+            return None
+        return self._buffer[: self._size]
+
+    @property
+    def sq_norms(self) -> NDArray[np.float32] | None:
+        """Squared L2 norm of each stored vector, shape (n_vectors,), computed at insert time."""
+        if self._sq_norm_buffer is None:
+            return None
+        return self._sq_norm_buffer[: self._size]
+
+    def _reserve(self, extra: int) -> None:
+        """Ensure capacity for ``extra`` more rows, doubling the buffers when full."""
+        needed = self._size + extra
+        if needed <= self._capacity:
+            return
+        capacity = max(needed, 2 * self._capacity, self._INITIAL_CAPACITY)
+        if self.persist_dir is not None:
+            self._buffer = self._grow_mmap(self.persist_dir, max(capacity, self._MMAP_MIN_ROWS))
+            capacity = self._buffer.shape[0]
+        else:
+            self._buffer = _grow_rows(self._buffer, self._size, (capacity, self.dimensions), np.float32)
+        self._sq_norm_buffer = _grow_rows(self._sq_norm_buffer, self._size, (capacity,), np.float32)
+        self._capacity = capacity
+
+    def _append_rows(self, rows: NDArray[np.float32]) -> None:
+        """Copy a (m, dimensions) block into the buffer and record its squared row norms."""
+        m = rows.shape[0]
+        self._reserve(m)
+        if self._buffer is None or self._sq_norm_buffer is None:
+            msg = "Vector buffer not allocated"
+            raise RuntimeError(msg)
+        stop = self._size + m
+        self._buffer[self._size : stop] = rows
+        # Cached once here so L2 search never re-reads V to get them
+        self._sq_norm_buffer[self._size : stop] = np.einsum("ij,ij->i", rows, rows)
+        self._size = stop
+
+    def _grow_mmap(self, persist_dir: Path, capacity: int) -> np.memmap:
+        """Extend the backing file to ``capacity`` rows and remap it.
+
+        Growing the file (ftruncate) keeps existing pages in place, so this costs a
+        remap rather than a copy of the stored vectors.
+        """
+        path = persist_dir / self._MMAP_FILENAME
+        if isinstance(self._buffer, np.memmap):
+            self._buffer.flush()
+        with path.open("ab") as f:
+            f.truncate(capacity * self.dimensions * np.dtype(np.float32).itemsize)
+        return np.memmap(path, dtype=np.float32, mode="r+", shape=(capacity, self.dimensions))
+
+    def add(self, embedding_id: str, vector: VectorLike) -> None:
         """Add vector to index.
 
         Args:
@@ -55,22 +256,43 @@ class VectorIndex:
             vector: Vector to add
 
         """
-        if len(vector) != self.dimensions:
-            msg = f"Vector dimension mismatch: expected {self.dimensions}, got {len(vector)}"
-            raise ValueError(msg)
-
-        vec_array = np.array(vector, dtype=np.float32).reshape(1, -1)  # Shape: (1, dimensions)
-
-        if self.vectors is None:
-            self.vectors = vec_array
-        else:
-            self.vectors = np.vstack([self.vectors, vec_array])
+        vec_array = _as_float32(vector, self.dimensions).reshape(1, -1)  # Shape: (1, dimensions)
+        self._append_rows(self._prepare_rows(vec_array))
 
         idx = len(self.embedding_ids)
         self.embedding_ids.append(embedding_id)
         self.id_to_index[embedding_id] = idx
 
-    def search(self, query_vector: list[float], k: int) -> tuple[list[str], list[float]]:
+    def add_many(self, embedding_ids: list[str], matrix: MatrixLike) -> None:
+        """Add a block of vectors with one copy into the growth buffer.
+
+        Args:
+            embedding_ids: UUIDs of the embeddings, one per row
+            matrix: (len(embedding_ids), dimensions) array or nested sequence
+
+        """
+        block = _as_float32_matrix(matrix, self.dimensions, len(embedding_ids))
+        self._append_rows(self._prepare_rows(block))
+        self._register_ids(embedding_ids)
+
+    def _prepare_rows(self, rows: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Return rows in their stored form: unit length for COSINE, as given otherwise.
+
+        Cosine only depends on direction, so normalizing once at insert time turns
+        every query into a single matvec with no per-row divide.
+        """
+        if self.metric != VectorSimilarityMetric.COSINE:
+            return rows
+        return rows / (_row_norms(rows) + 1e-12)
+
+    def _register_ids(self, embedding_ids: list[str]) -> int:
+        """Record ids for rows just appended; returns the first new row index."""
+        start = len(self.embedding_ids)
+        self.embedding_ids.extend(embedding_ids)
+        self.id_to_index.update(zip(embedding_ids, range(start, start + len(embedding_ids)), strict=True))
+        return start
+
+    def search(self, query_vector: VectorLike, k: int) -> tuple[list[str], list[float]]:
         """Search for k nearest neighbors.
 
         Args:
@@ -80,44 +302,111 @@ class VectorIndex:
         Returns:
             Tuple of (embedding_ids, scores)
         """
-        if self.vectors is None or len(self.embedding_ids) == 0:
+        if self.vectors is None or self.sq_norms is None or self.count == 0:
             return [], []
 
-        valid_indices = [i for i in range(len(self.embedding_ids)) if i not in self.tombstones]
-        if not valid_indices:
-            return [], []
-
-        query_array = np.array(query_vector, dtype=np.float32)  # Shape: (dimensions,)
+        # Every branch produces `scores` where higher is better, so top-k selection
+        # and tombstone masking are shared.
+        query_array = _as_float32(query_vector, self.dimensions)  # Shape: (dimensions,)
         if self.metric == VectorSimilarityMetric.L2:
-            raise NotImplementedError("L2 distance not implemented")
+            # ||q - v||^2 = ||q||^2 + ||v||^2 - 2 q.v: one matvec plus the cached
+            # ||v||^2. Rank on 2 q.v - ||v||^2 (||q||^2 is constant per query).
+            scores = 2.0 * (self.vectors @ query_array) - self.sq_norms
 
         elif self.metric == VectorSimilarityMetric.L1:
             raise NotImplementedError("L1 distance not implemented")
 
         elif self.metric == VectorSimilarityMetric.COSINE:
-            query_norm = query_array / np.linalg.norm(query_array)
-            # TODO: precomputing norms for all vectors and storing them?
-            vectors_norm = self.vectors[valid_indices] / np.linalg.norm(self.vectors[valid_indices], axis=1, keepdims=True)
-            scores = np.dot(vectors_norm, query_norm)
-            sorted_indices = np.argsort(scores)[::-1]
+            query_norm = query_array / _norm(query_array)
+            # Rows are stored unit length, so one BLAS matvec over the contiguous
+            # buffer is the cosine; no temporaries proportional to the matrix.
+            scores = self.vectors @ query_norm
 
         elif self.metric == VectorSimilarityMetric.DOT_PRODUCT:
-            raise NotImplementedError("Dot product not implemented")
+            scores = self.vectors @ query_array
 
         else:
             msg = f"Unknown similarity metric: {self.metric}"
             raise ValueError(msg)
 
+        # Scan every row in place and mask removed ones, rather than gathering the
+        # live rows into a copy of the matrix first
+        if self.tombstones:
+            scores[list(self.tombstones)] = -np.inf
+
         # Get top k results
-        k = min(k, len(valid_indices))
-        top_k_indices = sorted_indices[:k]
+        top_k_indices = _top_k(scores, min(k, self.count))
 
-        # Map back to embedding IDs and scores
-        result_ids = [self.embedding_ids[valid_indices[int(idx)]] for idx in top_k_indices]
-        result_scores = [scores[idx].item() for idx in top_k_indices]
+        # Map back to embedding IDs and scores: one gather for the k winners
+        result_ids = [self.embedding_ids[i] for i in top_k_indices.tolist()]
+        top_scores = scores.take(top_k_indices)
+        if self.metric == VectorSimilarityMetric.L2:
+            # Report Euclidean distance (lower is better), clamping rounding below zero
+            top_scores = np.sqrt(np.maximum(float(query_array @ query_array) - top_scores, 0.0))
+        result_scores = top_scores.tolist()
 
         return result_ids, result_scores
 
+    def search_batch(self, query_vectors: MatrixLike, k: int) -> list[tuple[list[str], list[float]]]:
+        """Search several queries at once.
+
+        Scores come from one (rows, q) matrix-matrix product per block of
+        ``_BATCH_BLOCK_ROWS`` stored rows, so each block is read once for all
+        queries while it is cache-resident, instead of once per query. Each block
+        keeps only its per-query top-k, which are merged at the end.
+
+        Args:
+            query_vectors: (n_queries, dimensions) query vectors
+            k: Number of results per query
+
+        Returns:
+            One (embedding_ids, scores) tuple per query, in query order
+        """
+        queries = _as_float32_matrix(query_vectors, self.dimensions, len(query_vectors))
+        n_queries = queries.shape[0]
+        if self.vectors is None or self.sq_norms is None or self.count == 0 or k <= 0:
+            return [([], []) for _ in range(n_queries)]
+
+        if self.metric == VectorSimilarityMetric.L1:
+            raise NotImplementedError("L1 distance not implemented")
+        if self.metric == VectorSimilarityMetric.COSINE:
+            queries = queries / _row_norms(queries)
+        elif self.metric not in (VectorSimilarityMetric.L2, VectorSimilarityMetric.DOT_PRODUCT):
+            msg = f"Unknown similarity metric: {self.metric}"
+            raise ValueError(msg)
+
+        k = min(k, self.count)
+        dead = np.fromiter(self.tombstones, dtype=np.intp, count=len(self.tombstones))
+        queries_t = np.ascontiguousarray(queries.T)  # (dimensions, n_queries)
+        n = self.vectors.shape[0]
+        block_rows: list[NDArray[np.intp]] = []
+        block_scores: list[NDArray[np.float32]] = []
+        for start in range(0, n, self._BATCH_BLOCK_ROWS):
+            stop = min(start + self._BATCH_BLOCK_ROWS, n)
+            scores = self.vectors[start:stop] @ queries_t  # (rows, n_queries), higher is better
+            if self.metric == VectorSimilarityMetric.L2:
+                scores = 2.0 * scores - self.sq_norms[start:stop, None]
+            scores[dead[(dead >= start) & (dead < stop)] - start] = -np.inf
+
+            k_block = min(k, stop - start)
+            top = np.argpartition(scores, -k_block, axis=0)[-k_block:]
+            block_rows.append(top + start)
+            block_scores.append(np.take_along_axis(scores, top, axis=0))
+
+        rows = np.concatenate(block_rows)
+        candidates = np.concatenate(block_scores)
+        q_sq = np.einsum("ij,ij->i", queries, queries)
+
+        results: list[tuple[list[str], list[float]]] = []
+        for j in range(n_queries):
+            order = _top_k(candidates[:, j], k)
+            top_scores = candidates[order, j]
+            if self.metric == VectorSimilarityMetric.L2:
+                # Report Euclidean distance (lower is better), clamping rounding below zero
+                top_scores = np.sqrt(np.maximum(q_sq[j] - top_scores, 0.0))
+            results.append(([self.embedding_ids[i] for i in rows[order, j].tolist()], top_scores.tolist()))
+        return results
+
     def remove(self, embedding_id: str) -> bool:
         """Remove vector from index.
 
@@ -128,157 +417,399 @@ class VectorIndex:
             True if removed, False if not found
 
         """
-        if embedding_id not in self.id_to_index:
+        idx_to_remove = self.id_to_index.pop(embedding_id, None)
+        if idx_to_remove is None:
             return False
-        idx_to_remove = self.id_to_index[embedding_id]
         self.tombstones.add(idx_to_remove)
-        # No mutation of self.embedding_ids or self.id_to_index, just tombstone.
+        # Rows and self.embedding_ids are left in place, just tombstoned; dropping the
+        # id makes a repeated remove report "not found" instead of removing twice.
         return True
 
+    def remove_many(self, embedding_ids: list[str]) -> int:
+        """Remove several vectors.
+
+        Args:
+            embedding_ids: UUIDs of embeddings to remove
+
+        Returns:
+            Number of embeddings removed (ids not in the index are skipped)
+
+        """
+        return sum(self.remove(embedding_id) for embedding_id in embedding_ids)
+
     @property
     def count(self) -> int:
         """Get number of vectors in index."""
         return len(self.embedding_ids) - len(self.tombstones)
 
 
+class SQ8Index(VectorIndex):
+    """FLAT index over int8 scalar-quantized unit vectors.
+
+    Each vector is normalized, then quantized symmetrically per row:
+    ``codes = round(v / scale)`` with ``scale = max|v| / 127``. Codes take a quarter
+    of the float32 footprint, so the brute-force scan moves a quarter of the bytes.
+    Scores are recovered as ``(codes @ q) * scale``; codes are widened to float32
+    one tile at a time so the BLAS matvec runs on an L2-resident block.
+
+    Notes:
+        - Implemented for COSINE similarity only.
+        - ``self.vectors`` is unused; codes and scales are the only storage. They grow
+          geometrically like the base buffer, and ``add``/``add_many`` are inherited:
+          rows arrive here already unit length and are quantized in ``_append_rows``.
+    """
+
+    _TILE_ROWS = 4096
+
+    def __init__(self, dimensions: int, metric: VectorSimilarityMetric) -> None:
+        super().__init__(dimensions, VectorIndexingStrategy.FLAT.value, metric)
+        if self.metric != VectorSimilarityMetric.COSINE:
+            msg = "SQ8Index currently supports COSINE only"
+            raise NotImplementedError(msg)
+        self._codes: NDArray[np.int8] | None = None  # (capacity, d)
+        self._scales: NDArray[np.float32] | None = None  # (capacity,)
+
+    @property
+    def codes(self) -> NDArray[np.int8] | None:
+        """Quantized rows, shape (n_vectors, dimensions)."""
+        if self._codes is None:
+            return None
+        return self._codes[: self._size]
+
+    @property
+    def scales(self) -> NDArray[np.float32] | None:
+        """Per-row dequantization scale, shape (n_vectors,)."""
+        if self._scales is None:
+            return None
+        return self._scales[: self._size]
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        if needed <= self._capacity:
+            return
+        capacity = max(needed, 2 * self._capacity, self._INITIAL_CAPACITY)
+        self._codes = _grow_rows(self._codes, self._size, (capacity, self.dimensions), np.int8)
+        self._scales = _grow_rows(self._scales, self._size, (capacity,), np.float32)
+        self._capacity = capacity
+
+    def _append_rows(self, rows: NDArray[np.float32]) -> None:
+        """Quantize a block of unit rows straight into the code buffer."""
+        m = rows.shape[0]
+        self._reserve(m)
+        if self._codes is None or self._scales is None:
+            msg = "Code buffer not allocated"
+            raise RuntimeError(msg)
+        stop = self._size + m
+        max_abs = np.max(np.abs(rows), axis=1)
+        scales = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+        self._codes[self._size : stop] = np.round(rows / scales[:, None])
+        self._scales[self._size : stop] = scales
+        self._size = stop
+
+    def search_batch(self, query_vectors: MatrixLike, k: int) -> list[tuple[list[str], list[float]]]:
+        """Search several queries at once against the int8 codes."""
+        # The float32 block GEMM does not apply to codes; tiles are re-widened per query
+        queries = _as_float32_matrix(query_vectors, self.dimensions, len(query_vectors))
+        return [self.search(query, k) for query in queries]
+
+    def search(self, query_vector: VectorLike, k: int) -> tuple[list[str], list[float]]:
+        """Search for k nearest neighbors against the int8 codes."""
+        codes, scales = self.codes, self.scales
+        if codes is None or scales is None or len(self.embedding_ids) == 0:
+            return [], []
+        k_eff = min(k, self.count)
+        if k_eff <= 0:
+            return [], []
+
+        q = _as_float32(query_vector, self.dimensions)
+        q = q / (_norm(q) + 1e-12)
+
+        # Widen one tile at a time into a single reused float32 scratch block
+        n = codes.shape[0]
+        scores = np.empty(n, dtype=np.float32)
+        tile = np.empty((min(self._TILE_ROWS, n), self.dimensions), dtype=np.float32)
+        for start in range(0, n, self._TILE_ROWS):
+            stop = min(start + self._TILE_ROWS, n)
+            block = tile[: stop - start]
+            np.copyto(block, codes[start:stop], casting="unsafe")
+            np.dot(block, q, out=scores[start:stop])
+        scores *= scales
+        if self.tombstones:
+            scores[list(self.tombstones)] = -np.inf
+
+        top_idx = _top_k(scores, k_eff)
+
+        result_ids = [self.embedding_ids[i] for i in top_idx.tolist()]
+        result_scores = scores.take(top_idx).tolist()
+        return result_ids, result_scores
+
+
 class IVFIndex(VectorIndex):
     """IVF-Flat index (coarse quantization + exact re-ranking on probed lists).
 
     Parameters:
         nlist: number of coarse centroids (lists)
         nprobe: number of lists to probe at query time
+        train_size: vectors to buffer before fitting centroids
+            (default ``max(nlist * 40, 10_000)``)
 
     Notes:
         - Implemented for COSINE similarity only.
-        - Centroids are initialized online and updated with incremental means.
-        - Vectors are stored in the base array; posting lists keep indices.
+        - Until ``train_size`` vectors have been added, search is exact (FLAT) over
+          the stored vectors. Centroids are then fitted once with spherical k-means
+          on everything buffered so far; later inserts are assigned online and
+          update their centroid with an incremental mean.
+        - Unit-normalized vectors are stored in the base array (raw vectors are not
+          kept); posting lists keep indices.
+        - Posting lists are growable int64 arrays with a parallel alive mask, so
+          removal flips a flag; a list is compacted once >25% of it is dead.
     """
 
+    _INITIAL_LIST_CAPACITY = 16
+    _COMPACT_DEAD_FRACTION = 0.25
+    _KMEANS_ITERATIONS = 10
+    _KMEANS_SEED = 0
+
     def __init__(
         self,
         dimensions: int,
         metric: VectorSimilarityMetric,
         nlist: int = 64,
         nprobe: int = 8,
+        persist_dir: Path | None = None,
+        train_size: int | None = None,
     ) -> None:
-        super().__init__(dimensions, VectorIndexingStrategy.IVF.value, metric)
+        super().__init__(dimensions, VectorIndexingStrategy.IVF.value, metric, persist_dir)
         if self.metric != VectorSimilarityMetric.COSINE:
             # TODO: Raise this by VecConfig AggRoot on creation.
             msg = "IVFIndex currently supports COSINE only"
             raise NotImplementedError(msg)
         self.nlist = max(1, int(nlist))
         self.nprobe = max(1, int(nprobe))
-        # Centroids and posting lists
+        default_train_size = max(self.nlist * 40, 10_000)
+        self.train_size = max(self.nlist, int(train_size) if train_size is not None else default_train_size)
+        # Centroids and posting lists (None until trained)
         self.centroids: NDArray[np.float32] | None = None  # (nlist_current, d)
-        self.lists: list[list[int]] = []  # posting lists hold indices into self.vectors
-        # Track index -> list id for fast removal
-        self.index_to_list: dict[int, int] = {}
+        self.list_ids: list[NDArray[np.int64]] = []  # posting lists hold indices into self.vectors
+        self.list_alive: list[NDArray[np.bool_]] = []  # parallel alive flags per posting slot
+        self.list_sizes: list[int] = []  # used slots per posting list (alive + dead)
+        self.list_dead: list[int] = []  # dead slots per posting list
+        # Track index -> (list id, slot) for O(1) removal
+        self.index_to_slot: dict[int, tuple[int, int]] = {}
         # Running counts for centroid incremental update
         self.list_counts: list[int] = []
 
-    def _ensure_centroid(self, vec: NDArray[np.float32]) -> int:
-        """Ensure we have a centroid to assign to; grow until nlist initialized."""
-        if self.centroids is None or len(self.lists) < self.nlist:
-            # Initialize new centroid with normalized vector
-            v = vec / (np.linalg.norm(vec) + 1e-12)
-            self.centroids = v.reshape(1, -1) if self.centroids is None else np.vstack([self.centroids, v])
-            self.lists.append([])
-            self.list_counts.append(0)
-            return len(self.lists) - 1
-        return -1
-
-    def _assign_list(self, vec: NDArray[np.float32]) -> int:
-        if self.centroids is None or len(self.lists) == 0:
+    def _train(self) -> None:
+        """Fit centroids with spherical k-means over the stored vectors, then fill posting lists.
+
+        Stored vectors are unit length, so assignment is an argmax over one
+        (n, nlist) similarity matmul; each centroid is the re-normalized sum of its
+        members, computed for all clusters with one sort + ``np.add.reduceat``.
+        """
+        if self.vectors is None:
+            msg = "No vectors to train on"
+            raise RuntimeError(msg)
+        vectors = self.vectors
+        n = vectors.shape[0]
+        rng = np.random.default_rng(self._KMEANS_SEED)
+        centroids = vectors[rng.choice(n, size=self.nlist, replace=False)].copy()
+
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+        for _ in range(self._KMEANS_ITERATIONS):
+            counts = np.bincount(assign, minlength=self.nlist)
+            nonempty = np.flatnonzero(counts)
+            starts = np.cumsum(counts) - counts
+            sums = np.zeros_like(centroids)
+            sums[nonempty] = np.add.reduceat(vectors[np.argsort(assign, kind="stable")], starts[nonempty], axis=0)
+            # Re-seed empty clusters from random vectors so every list stays usable
+            empty = np.flatnonzero(counts == 0)
+            if empty.size:
+                sums[empty] = vectors[rng.choice(n, size=empty.size, replace=False)]
+            centroids = sums / (_row_norms(sums) + 1e-12)
+            new_assign = np.argmax(vectors @ centroids.T, axis=1)
+            if np.array_equal(new_assign, assign):
+                break
+            assign = new_assign
+
+        self.centroids = centroids.astype(np.float32, copy=False)
+        counts = np.bincount(assign, minlength=self.nlist)
+        self.list_counts = counts.tolist()
+        self.list_ids = []
+        self.list_alive = []
+        self.list_sizes = []
+        self.list_dead = []
+        for list_id in range(self.nlist):
+            members = np.flatnonzero(assign == list_id)
+            if self.tombstones:
+                members = members[~np.isin(members, list(self.tombstones))]
+            size = members.shape[0]
+            capacity = max(self._INITIAL_LIST_CAPACITY, 2 * size)
+            ids = np.empty(capacity, dtype=np.int64)
+            ids[:size] = members
+            alive = np.zeros(capacity, dtype=np.bool_)
+            alive[:size] = True
+            self.list_ids.append(ids)
+            self.list_alive.append(alive)
+            self.list_sizes.append(size)
+            self.list_dead.append(0)
+            for slot, idx in enumerate(members.tolist()):
+                self.index_to_slot[idx] = (list_id, slot)
+
+        logger.info("Trained IVF centroids: nlist=%s on %s vectors", self.nlist, n)
+
+    def _assign_list(self, v: NDArray[np.float32]) -> int:
+        if self.centroids is None or len(self.list_sizes) == 0:
             msg = "Centroids not initialized"
             raise RuntimeError(msg)
-        v = vec / (np.linalg.norm(vec) + 1e-12)
-        sims = self.centroids @ v
-        return int(np.argmax(sims))
+        # argmax over centroid similarities is scale-invariant, so any positive
+        # multiple of the vector works; callers pass the unit vector they already have.
+        return int(np.argmax(self.centroids @ v))
 
-    def _update_centroid(self, list_id: int, vec: NDArray[np.float32]) -> None:
+    def _update_centroid(self, list_id: int, v: NDArray[np.float32]) -> None:
         if self.centroids is None:
             msg = "Centroids not initialized"
             raise RuntimeError(msg)
         cnt = self.list_counts[list_id]
-        v = vec / (np.linalg.norm(vec) + 1e-12)
         # Incremental mean in cosine space (re-normalize to unit length)
         new_center = (self.centroids[list_id] * cnt + v) / (cnt + 1)
-        self.centroids[list_id] = new_center / (np.linalg.norm(new_center) + 1e-12)
+        self.centroids[list_id] = new_center / (_norm(new_center) + 1e-12)
         self.list_counts[list_id] = cnt + 1
 
-    def add(self, embedding_id: str, vector: list[float]) -> None:
-        if len(vector) != self.dimensions:
-            msg = f"Vector dimension mismatch: expected {self.dimensions}, got {len(vector)}"
-            raise ValueError(msg)
-        vec = np.array(vector, dtype=np.float32)
+    def _append_to_list(self, list_id: int, idx: int) -> None:
+        """Append a vector index to a posting list, doubling its buffers when full."""
+        size = self.list_sizes[list_id]
+        if size == self.list_ids[list_id].shape[0]:
+            capacity = 2 * size
+            ids = np.empty(capacity, dtype=np.int64)
+            ids[:size] = self.list_ids[list_id]
+            alive = np.zeros(capacity, dtype=np.bool_)
+            alive[:size] = self.list_alive[list_id]
+            self.list_ids[list_id] = ids
+            self.list_alive[list_id] = alive
+        self.list_ids[list_id][size] = idx
+        self.list_alive[list_id][size] = True
+        self.list_sizes[list_id] = size + 1
+        self.index_to_slot[idx] = (list_id, size)
+
+    def _compact_list(self, list_id: int) -> None:
+        """Drop dead slots from a posting list and re-point the survivors' slots."""
+        size = self.list_sizes[list_id]
+        ids = self.list_ids[list_id]
+        alive = self.list_alive[list_id]
+        kept = ids[:size][alive[:size]]
+        n_kept = kept.shape[0]
+        ids[:n_kept] = kept
+        alive[:n_kept] = True
+        alive[n_kept:size] = False
+        self.list_sizes[list_id] = n_kept
+        self.list_dead[list_id] = 0
+        for slot, idx in enumerate(kept.tolist()):
+            self.index_to_slot[idx] = (list_id, slot)
+
+    def add(self, embedding_id: str, vector: VectorLike) -> None:
+        """Add vector to index, assigning it to its nearest centroid once trained."""
+        vec = _as_float32(vector, self.dimensions)
+        # Normalize once; storage, centroid seeding, assignment and update all use the
+        # unit vector, so search never has to re-normalize candidates.
+        unit = vec / (_norm(vec) + 1e-12)
 
         # Append to storage first (base class arrays)
-        if self.vectors is None:
-            self.vectors = vec.reshape(1, -1)
-        else:
-            self.vectors = np.vstack([self.vectors, vec.reshape(1, -1)])
+        self._append_rows(unit.reshape(1, -1))
         idx = len(self.embedding_ids)
         self.embedding_ids.append(embedding_id)
         self.id_to_index[embedding_id] = idx
 
-        # Initialize centroids until nlist is reached
-        centroid_id = self._ensure_centroid(vec)
-        if centroid_id == -1:
-            centroid_id = self._assign_list(vec)
-        self.lists[centroid_id].append(idx)
-        self.index_to_list[idx] = centroid_id
-        self._update_centroid(centroid_id, vec)
+        # Buffer until there is enough data to fit centroids, then train once
+        if self.centroids is None:
+            if len(self.embedding_ids) >= self.train_size:
+                self._train()
+            return
+
+        centroid_id = self._assign_list(unit)
+        self._append_to_list(centroid_id, idx)
+        self._update_centroid(centroid_id, unit)
+
+    def add_many(self, embedding_ids: list[str], matrix: MatrixLike) -> None:
+        """Add a block of vectors; rows are assigned with one (m, nlist) matmul.
+
+        Assignment uses the centroids as they were before the block, then each
+        centroid's incremental mean is updated row by row.
+        """
+        block = _as_float32_matrix(matrix, self.dimensions, len(embedding_ids))
+        units = block / (_row_norms(block) + 1e-12)
+        self._append_rows(units)
+        start = self._register_ids(embedding_ids)
+
+        if self.centroids is None:
+            if len(self.embedding_ids) >= self.train_size:
+                self._train()
+            return
+
+        assign = np.argmax(units @ self.centroids.T, axis=1)
+        for offset, centroid_id in enumerate(assign.tolist()):
+            self._append_to_list(centroid_id, start + offset)
+            self._update_centroid(centroid_id, units[offset])
 
     def remove(self, embedding_id: str) -> bool:
+        """Remove vector from index and from its inverted list."""
         if embedding_id not in self.id_to_index:
             return False
         idx = self.id_to_index[embedding_id]
-        # Remove from posting list
-        list_id = self.index_to_list.get(idx)
-        if list_id is not None:
-            try:
-                self.lists[list_id].remove(idx)
-            except ValueError:
-                pass
-            self.index_to_list.pop(idx, None)
+        # Flag the posting slot dead; compact the list once enough slots are dead
+        slot = self.index_to_slot.pop(idx, None)
+        if slot is not None:
+            list_id, pos = slot
+            self.list_alive[list_id][pos] = False
+            self.list_dead[list_id] += 1
+            if self.list_dead[list_id] > self._COMPACT_DEAD_FRACTION * self.list_sizes[list_id]:
+                self._compact_list(list_id)
         # Tombstone in base index
         removed = super().remove(embedding_id)
         # Do not rebuild lists/id mappings
         return removed
 
-    def search(self, query_vector: list[float], k: int) -> tuple[list[str], list[float]]:
+    def search_batch(self, query_vectors: MatrixLike, k: int) -> list[tuple[list[str], list[float]]]:
+        """Search several queries at once, probing the nearest inverted lists."""
+        if self.centroids is None or len(self.list_sizes) == 0:
+            # Untrained: exact blocked search over the stored unit vectors
+            return super().search_batch(query_vectors, k)
+        # Each query probes its own lists, so candidates are gathered per query
+        queries = _as_float32_matrix(query_vectors, self.dimensions, len(query_vectors))
+        return [self.search(query, k) for query in queries]
+
+    def search(self, query_vector: VectorLike, k: int) -> tuple[list[str], list[float]]:
+        """Search for k nearest neighbors, probing the nearest inverted lists."""
         if self.vectors is None or len(self.embedding_ids) == 0:
             return [], []
-        if self.centroids is None or len(self.lists) == 0:
+        if self.centroids is None or len(self.list_sizes) == 0:
             return super().search(query_vector, k)
 
-        q = np.array(query_vector, dtype=np.float32)
-        q = q / (np.linalg.norm(q) + 1e-12)
+        q = _as_float32(query_vector, self.dimensions)
+        q = q / (_norm(q) + 1e-12)
 
         sims = self.centroids @ q
         nprobe = min(self.nprobe, sims.shape[0])
         probe_ids = np.argpartition(sims, -nprobe)[-nprobe:]
 
-        candidate_indices: list[int] = []
+        probed: list[NDArray[np.int64]] = []
         for cid in probe_ids:
-            candidate_indices.extend(self.lists[int(cid)])
-        # Remove tombstoned candidates
-        candidate_indices = [i for i in candidate_indices if i not in self.tombstones]
-
-        if not candidate_indices:
+            c = int(cid)
+            size = self.list_sizes[c]
+            ids = self.list_ids[c][:size]
+            # Only lists with dead slots need the alive mask applied
+            probed.append(ids[self.list_alive[c][:size]] if self.list_dead[c] else ids)
+        candidate_indices = np.concatenate(probed)
+
+        if candidate_indices.shape[0] == 0:
             return [], []
 
-        cand_vecs = self.vectors[candidate_indices]
-        cand_norm = cand_vecs / (np.linalg.norm(cand_vecs, axis=1, keepdims=True) + 1e-12)
-        scores = cand_norm @ q
+        # Stored vectors are unit length, so the matvec is already the cosine
+        scores = self.vectors[candidate_indices] @ q
 
-        k_eff = min(k, len(candidate_indices))
-        top_idx = np.argpartition(scores, -k_eff)[-k_eff:]
-        order = np.argsort(scores[top_idx])[::-1]
-        top_idx = top_idx[order]
+        top_idx = _top_k(scores, k)
 
-        result_ids = [self.embedding_ids[candidate_indices[int(i)]] for i in top_idx]
-        result_scores = [float(scores[int(i)]) for i in top_idx]
+        result_ids = [self.embedding_ids[i] for i in candidate_indices[top_idx].tolist()]
+        result_scores = scores.take(top_idx).tolist()
         return result_ids, result_scores
 
 
@@ -290,16 +821,36 @@ class VectorIndexManager:
     """
 
     _instance: VectorIndexManager | None = None
+    _BOOTSTRAP_QUEUE_SIZE = 4
+    # Default parse processes: each is a spawned interpreter re-importing numpy, which only
+    # pays off for large bootstraps, so a handful is enough
+    _MAX_DEFAULT_PARSE_WORKERS = 4
+    _POOL_MIN_SIZE = 4
+    _POOL_MAX_SIZE = 16
 
-    def __init__(self, metric: VectorSimilarityMetric = VectorSimilarityMetric.L2) -> None:
+    def __init__(
+        self,
+        metric: VectorSimilarityMetric = VectorSimilarityMetric.L2,
+        *,
+        quantize: bool = False,
+        persist_dir: Path | None = None,
+    ) -> None:
         """Initialize index manager.
 
         Args:
             metric: Default similarity metric to use
+            quantize: Store FLAT COSINE indices as int8 codes (SQ8Index)
+            persist_dir: Root directory for memmap-backed float32 indices (in-memory if None)
 
         """
         self.metric = metric
-        self.indices: dict[tuple[str, str], VectorIndex] = {}  # (library_id, config_id) -> VectorIndex
+        self.quantize = quantize
+        self.persist_dir = persist_dir
+        # (library_id, config_id) -> VectorIndex. Readers use the published read-only snapshot;
+        # writers copy it under _indices_lock and swap in a new one (read-copy-update).
+        self.indices: Mapping[tuple[str, str], VectorIndex] = MappingProxyType({})
+        self._indices_lock = threading.Lock()
+        self._pool: asyncpg.Pool | None = None  # Created on first bootstrap without a caller pool
 
     def get_or_create_index(
         self,
@@ -324,10 +875,21 @@ class VectorIndexManager:
         """
         key = (library_id, config_id)
 
-        if key not in self.indices:
+        index = self.indices.get(key)
+        if index is not None:
+            return index
+
+        with self._indices_lock:
+            # Another writer may have published this key while we waited
+            index = self.indices.get(key)
+            if index is not None:
+                return index
+
             # Use provided metric or fall back to manager's default
             index_metric = metric if metric is not None else self.metric
-            self.indices[key] = self._create_index(dimensions, strategy, index_metric)
+            index_dir = self.persist_dir / library_id / config_id if self.persist_dir is not None else None
+            index = self._create_index(dimensions, strategy, index_metric, index_dir)
+            self.indices = MappingProxyType({**self.indices, key: index})
             logger.info(
                 "Created %s index with %s metric for library=%s, config=%s, dimensions=%s",
                 strategy,
@@ -337,10 +899,14 @@ class VectorIndexManager:
                 dimensions,
             )
 
-        return self.indices[key]
+        return index
 
     def _create_index(
-        self, dimensions: int, strategy: str, metric: VectorSimilarityMetric
+        self,
+        dimensions: int,
+        strategy: str,
+        metric: VectorSimilarityMetric,
+        persist_dir: Path | None = None,
     ) -> VectorIndex:
         """Create vector index based on strategy.
 
@@ -348,6 +914,7 @@ class VectorIndexManager:
             dimensions: Vector dimensions
             strategy: Indexing strategy string (flat, hnsw, ivf, pq)
             metric: Similarity metric to use for this index
+            persist_dir: Directory for the index's memmap-backed vectors (in-memory if None)
 
         Returns:
             Vector index
@@ -361,24 +928,27 @@ class VectorIndexManager:
         strategy_lower = strategy.lower()
 
         if strategy_lower == VectorIndexingStrategy.FLAT.value:
-            # Brute force exact search using PyTorch tensors
-            return VectorIndex(dimensions, strategy, metric)
+            if self.quantize and metric == VectorSimilarityMetric.COSINE:
+                # Brute force over int8 codes: 4x less memory traffic per scan
+                return SQ8Index(dimensions, metric)
+            # Brute force exact search using NumPy arrays
+            return VectorIndex(dimensions, strategy, metric, persist_dir)
 
         if strategy_lower == VectorIndexingStrategy.HNSW.value:
             # TODO: Implement HNSW (Hierarchical Navigable Small World) indexing
             # For now, use FLAT implementation
             logger.warning("HNSW not yet implemented - using FLAT for now")
-            return VectorIndex(dimensions, VectorIndexingStrategy.FLAT.value, metric)
+            return VectorIndex(dimensions, VectorIndexingStrategy.FLAT.value, metric, persist_dir)
 
         if strategy_lower == VectorIndexingStrategy.IVF.value:
             # IVF-Flat implementation (no external deps)
-            return IVFIndex(dimensions, metric)
+            return IVFIndex(dimensions, metric, persist_dir=persist_dir)
 
         if strategy_lower == VectorIndexingStrategy.PQ.value:
             # TODO: Implement PQ (Product Quantization) indexing
             # For now, use FLAT implementation
             logger.warning("PQ not yet implemented - using FLAT for now")
-            return VectorIndex(dimensions, VectorIndexingStrategy.FLAT.value, metric)
+            return VectorIndex(dimensions, VectorIndexingStrategy.FLAT.value, metric, persist_dir)
 
         msg = f"Unknown indexing strategy: {strategy}"
         raise ValueError(msg)
@@ -388,7 +958,7 @@ class VectorIndexManager:
         embedding_id: str,
         library_id: str,
         config_id: str,
-        vector: list[float],
+        vector: VectorLike,
         dimensions: int,
         strategy: str,
         metric: VectorSimilarityMetric | None = None,
@@ -408,6 +978,31 @@ class VectorIndexManager:
         index = self.get_or_create_index(library_id, config_id, dimensions, strategy, metric)
         index.add(embedding_id, vector)
 
+    def add_vectors(
+        self,
+        embedding_ids: list[str],
+        library_id: str,
+        config_id: str,
+        matrix: MatrixLike,
+        dimensions: int,
+        strategy: str,
+        metric: VectorSimilarityMetric | None = None,
+    ) -> None:
+        """Add a block of vectors to the appropriate index in one call.
+
+        Args:
+            embedding_ids: Embedding UUIDs, one per row of ``matrix``
+            library_id: Library UUID
+            config_id: VectorizationConfig UUID
+            matrix: (len(embedding_ids), dimensions) vectors
+            dimensions: Vector dimensions
+            strategy: Indexing strategy
+            metric: Similarity metric (optional, uses manager default if not provided)
+
+        """
+        index = self.get_or_create_index(library_id, config_id, dimensions, strategy, metric)
+        index.add_many(embedding_ids, matrix)
+
     def remove_vectors(
         self, library_id: str, config_id: str, embedding_ids: list[str]
     ) -> tuple[int, int]:
@@ -422,21 +1017,14 @@ class VectorIndexManager:
             Tuple of (removed_count, not_found_count)
 
         """
-        key = (library_id, config_id)
+        index = self.indices.get((library_id, config_id))
 
-        if key not in self.indices:
+        if index is None:
             logger.warning("No index found for library=%s, config=%s", library_id, config_id)
             return 0, len(embedding_ids)
 
-        index = self.indices[key]
-        removed = 0
-        not_found = 0
-
-        for embedding_id in embedding_ids:
-            if index.remove(embedding_id):
-                removed += 1
-            else:
-                not_found += 1
+        removed = index.remove_many(embedding_ids)
+        not_found = len(embedding_ids) - removed
 
         logger.info(
             "Removed %s embeddings from index (library=%s, config=%s), %s not found",
@@ -449,7 +1037,7 @@ class VectorIndexManager:
         return removed, not_found
 
     def search(
-        self, library_id: str, config_id: str, query_vector: list[float], k: int = 10
+        self, library_id: str, config_id: str, query_vector: VectorLike, k: int = 10
     ) -> tuple[list[str], list[float]]:
         """Search for similar vectors within a (library, config) index.
 
@@ -463,13 +1051,36 @@ class VectorIndexManager:
             Tuple of (embedding_ids, scores)
 
         """
-        key = (library_id, config_id)
+        index = self.indices.get((library_id, config_id))
 
-        if key not in self.indices:
+        if index is None:
             logger.warning("No index found for library=%s, config=%s", library_id, config_id)
             return [], []
 
-        return self.indices[key].search(query_vector, k)
+        return index.search(query_vector, k)
+
+    def search_batch(
+        self, library_id: str, config_id: str, query_vectors: MatrixLike, k: int = 10
+    ) -> list[tuple[list[str], list[float]]]:
+        """Search several query vectors against one (library, config) index.
+
+        Args:
+            library_id: Library UUID
+            config_id: VectorizationConfig UUID
+            query_vectors: (n_queries, dimensions) query vectors
+            k: Number of results per query
+
+        Returns:
+            One (embedding_ids, scores) tuple per query, in query order
+
+        """
+        index = self.indices.get((library_id, config_id))
+
+        if index is None:
+            logger.warning("No index found for library=%s, config=%s", library_id, config_id)
+            return [([], []) for _ in range(len(query_vectors))]
+
+        return index.search_batch(query_vectors, k)
 
     def get_stats(self) -> list[dict[str, object]]:
         """Get statistics for all indices.
@@ -489,81 +1100,176 @@ class VectorIndexManager:
             for (lib_id, cfg_id), idx in self.indices.items()
         ]
 
-    async def bootstrap_from_postgres(self, database_url: str, batch_size: int = 1000) -> int:
+    async def bootstrap_from_postgres(
+        self,
+        database_url: str,
+        batch_size: int = 1000,
+        parse_workers: int | None = None,
+        pool: asyncpg.Pool | None = None,
+    ) -> int:
         """Stream embeddings from postgres and build indices on cold start.
 
+        Rows arrive ordered by (library_id, config_id), so consecutive rows for the
+        same index are grouped (up to ``batch_size``) and added with one
+        ``add_vectors`` call instead of one ``add`` per row.
+
+        Fetching and parsing overlap: one task reads the cursor into a bounded
+        queue of raw groups while ``parse_workers`` coroutines hand each group's
+        JSON to a process pool and add the resulting matrix to its index.
+
         Args:
             database_url: PostgreSQL connection string
-            batch_size: Number of embeddings to fetch per batch
+            batch_size: Number of embeddings prefetched per cursor round-trip
+            parse_workers: Processes parsing JSONB vectors (defaults to the CPUs this
+                process may run on, at most ``_MAX_DEFAULT_PARSE_WORKERS``)
+            pool: Connection pool to read through; if None, the manager creates one
+                on first use and keeps it for later calls (see ``close``)
 
         Returns:
             Total number of embeddings indexed
 
         """
-        import json
+        logger.info("Starting bootstrap indexing from postgres...")
 
-        import asyncpg
+        if pool is None:
+            pool = await self._get_pool(database_url)
 
-        logger.info("Starting bootstrap indexing from postgres...")
+        workers = parse_workers or min(_available_cpus(), self._MAX_DEFAULT_PARSE_WORKERS)
+        queue: asyncio.Queue[_BootstrapGroup | None] = asyncio.Queue(maxsize=self._BOOTSTRAP_QUEUE_SIZE)
 
-        pool = await asyncpg.create_pool(database_url, min_size=1, max_size=5)
-        if not pool:
-            msg = "Failed to create postgres connection pool"
-            raise RuntimeError(msg)
+        # spawn, not fork: the parent already runs an event loop and driver threads
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            indexers = [asyncio.create_task(self._index_bootstrap_groups(queue, executor)) for _ in range(workers)]
+            try:
+                await self._fetch_bootstrap_groups(pool, batch_size, queue)
+            finally:
+                # One sentinel per indexer; let queued groups finish even if the fetch failed
+                for _ in indexers:
+                    await queue.put(None)
+                counts = await asyncio.gather(*indexers)
+            total_indexed = sum(counts)
+
+        logger.info("Bootstrap complete. Total indexed: %s", total_indexed)
+        return total_indexed
+
+    async def _get_pool(self, database_url: str) -> asyncpg.Pool:
+        """Return the manager's own connection pool, creating it on first use."""
+        import asyncpg
 
-        try:
-            offset = 0
-            total_indexed = 0
-
-            while True:
-                rows = await pool.fetch(
-                    """
-                    SELECT e.id, e.library_id, e.vectorization_config_id, e.vector, e.dimensions,
-                           vc.vector_indexing_strategy, vc.vector_similarity_metric
-                    FROM embeddings e
-                    JOIN vectorization_configs vc
-                      ON e.vectorization_config_id = vc.id
-                    ORDER BY e.library_id, e.vectorization_config_id
-                    LIMIT $1 OFFSET $2
-                    """,
-                    batch_size,
-                    offset,
-                )
+        if self._pool is None:
+            pool = await asyncpg.create_pool(
+                database_url, min_size=self._POOL_MIN_SIZE, max_size=self._POOL_MAX_SIZE
+            )
+            if not pool:
+                msg = "Failed to create postgres connection pool"
+                raise RuntimeError(msg)
+            self._pool = pool
+        return self._pool
+
+    async def close(self) -> None:
+        """Close the connection pool the manager created, if any."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def _fetch_bootstrap_groups(
+        self, pool: asyncpg.Pool, batch_size: int, queue: asyncio.Queue[_BootstrapGroup | None]
+    ) -> None:
+        """Read embeddings through a server-side cursor and queue runs of rows per index."""
+        # Stream rows through a server-side cursor on a prepared statement: the
+        # query is planned once and only `batch_size` records are held at a time.
+        async with pool.acquire() as conn:
+            stmt = await conn.prepare(
+                """
+                SELECT e.id, e.library_id, e.vectorization_config_id, e.vector, e.dimensions,
+                       vc.vector_indexing_strategy, vc.vector_similarity_metric
+                FROM embeddings e
+                JOIN vectorization_configs vc
+                  ON e.vectorization_config_id = vc.id
+                ORDER BY e.library_id, e.vectorization_config_id, e.id
+                """
+            )
 
-                if not rows:
-                    break
+            group_key: _BootstrapKey | None = None
+            group_ids: list[str] = []
+            group_vectors: list[RawVector] = []
 
-                # Index batch
-                for row in rows:
+            async with conn.transaction(readonly=True):
+                async for row in stmt.cursor(prefetch=batch_size):
                     try:
-                        # Parse JSONB vector
-                        vector = json.loads(row["vector"]) if isinstance(row["vector"], str) else row["vector"]
-
-                        # Parse similarity metric
-                        similarity_metric = VectorSimilarityMetric(row["vector_similarity_metric"])
-
-                        self.add_vector(
-                            embedding_id=str(row["id"]),
-                            library_id=str(row["library_id"]),
-                            config_id=str(row["vectorization_config_id"]),
-                            vector=vector,
-                            dimensions=row["dimensions"],
-                            strategy=row["vector_indexing_strategy"],
-                            metric=similarity_metric,
+                        key: _BootstrapKey = (
+                            str(row["library_id"]),
+                            str(row["vectorization_config_id"]),
+                            row["dimensions"],
+                            row["vector_indexing_strategy"],
+                            VectorSimilarityMetric(row["vector_similarity_metric"]),
                         )
-                        total_indexed += 1
 
                     except Exception as e:
                         logger.exception("Failed to index embedding %s: %s", row["id"], str(e))
-
-                offset += batch_size
-                logger.info("Indexed %s embeddings...", total_indexed)
-
-            logger.info("Bootstrap complete. Total indexed: %s", total_indexed)
-            return total_indexed
-
-        finally:
-            await pool.close()
+                        continue
+
+                    if key != group_key or len(group_ids) >= batch_size:
+                        if group_key is not None and group_ids:
+                            # Blocks while the queue is full, so parsing paces the fetch
+                            await queue.put((group_key, group_ids, group_vectors))
+                        group_key, group_ids, group_vectors = key, [], []
+
+                    group_ids.append(str(row["id"]))
+                    group_vectors.append(row["vector"])
+
+            if group_key is not None and group_ids:
+                await queue.put((group_key, group_ids, group_vectors))
+
+    async def _index_bootstrap_groups(
+        self, queue: asyncio.Queue[_BootstrapGroup | None], executor: ProcessPoolExecutor
+    ) -> int:
+        """Parse queued groups in ``executor`` and add them to their indices until a sentinel."""
+        loop = asyncio.get_running_loop()
+        indexed = 0
+        while (group := await queue.get()) is not None:
+            key, embedding_ids, raw_vectors = group
+            library_id, config_id, dimensions = key[:3]
+            try:
+                matrix, rejected = await loop.run_in_executor(executor, _parse_vector_block, raw_vectors, dimensions)
+            except Exception:
+                logger.exception(
+                    "Failed to parse %s embeddings for library=%s, config=%s", len(embedding_ids), library_id, config_id
+                )
+                continue
+
+            if rejected:
+                for pos, error in rejected:
+                    logger.error("Failed to index embedding %s: %s", embedding_ids[pos], error)
+                rejected_positions = {pos for pos, _ in rejected}
+                embedding_ids = [eid for pos, eid in enumerate(embedding_ids) if pos not in rejected_positions]
+
+            added = self._add_bootstrap_group(key, embedding_ids, matrix)
+            indexed += added
+            logger.info("Indexed %s embeddings (library=%s, config=%s)", added, library_id, config_id)
+        return indexed
+
+    def _add_bootstrap_group(self, key: _BootstrapKey, embedding_ids: list[str], matrix: MatrixLike) -> int:
+        """Add one group of bootstrap rows that share an index; returns rows indexed."""
+        if not embedding_ids:
+            return 0
+        library_id, config_id, dimensions, strategy, metric = key
+        try:
+            self.add_vectors(
+                embedding_ids=embedding_ids,
+                library_id=library_id,
+                config_id=config_id,
+                matrix=matrix,
+                dimensions=dimensions,
+                strategy=strategy,
+                metric=metric,
+            )
+        except Exception:
+            logger.exception(
+                "Failed to index %s embeddings for library=%s, config=%s", len(embedding_ids), library_id, config_id
+            )
+            return 0
+        return len(embedding_ids)
 
 
 class VectorIndexRegistry:
@@ -577,7 +1283,9 @@ class VectorIndexRegistry:
 
     def __init__(self) -> None:
         """Initialize empty registry."""
-        self._managers: dict[str, VectorIndexManager] = {}
+        # Read-only snapshot swapped on every mutation, so lookups never take the lock
+        self._managers: Mapping[str, VectorIndexManager] = MappingProxyType({})
+        self._lock = threading.Lock()
 
     def get_or_create_manager(
         self,
@@ -594,11 +1302,18 @@ class VectorIndexRegistry:
             VectorIndexManager for this config
 
         """
-        if config_id not in self._managers:
-            self._managers[config_id] = VectorIndexManager(metric=metric)
-            logger.info("Created VectorIndexManager for config %s with %s metric", config_id, metric.value)
+        manager = self._managers.get(config_id)
+        if manager is not None:
+            return manager
+
+        with self._lock:
+            manager = self._managers.get(config_id)
+            if manager is None:
+                manager = VectorIndexManager(metric=metric)
+                self._managers = MappingProxyType({**self._managers, config_id: manager})
+                logger.info("Created VectorIndexManager for config %s with %s metric", config_id, metric.value)
 
-        return self._managers[config_id]
+        return manager
 
     def get_manager(self, config_id: str) -> VectorIndexManager | None:
         """Get VectorIndexManager for a config, if it exists.
@@ -619,9 +1334,10 @@ class VectorIndexRegistry:
             config_id: VectorizationConfig ID
 
         """
-        if config_id in self._managers:
-            del self._managers[config_id]
-            logger.info("Removed VectorIndexManager for config %s", config_id)
+        with self._lock:
+            if config_id in self._managers:
+                self._managers = MappingProxyType({k: v for k, v in self._managers.items() if k != config_id})
+                logger.info("Removed VectorIndexManager for config %s", config_id)
 
     def get_stats(self) -> dict[str, list[dict[str, object]]]:
         """Get statistics for all managed indices.
@@ -0,0 +1,334 @@
+"""Tests for the search service's in-memory vector indices."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from search_service.vector_index import IVFIndex, SQ8Index, VectorIndex, VectorIndexManager
+from vdb_core.domain.value_objects import VectorIndexingStrategy, VectorSimilarityMetric
+
+
+@pytest.fixture
+def random_vectors() -> np.ndarray:
+    """Deterministic random vectors for ranking comparisons."""
+    rng = np.random.default_rng(42)
+    return rng.standard_normal((200, 32)).astype(np.float32)
+
+
+class TestVectorIndex:
+    """Test suite for the FLAT VectorIndex."""
+
+    def test_cosine_search_ranks_by_similarity(self) -> None:
+        """Test that the closest vector by angle comes first."""
+        index = VectorIndex(3, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE)
+        index.add("x", [1.0, 0.0, 0.0])
+        index.add("y", [0.0, 1.0, 0.0])
+        index.add("xy", [0.7071, 0.7071, 0.0])
+
+        ids, scores = index.search([2.0, 0.0, 0.0], k=3)
+
+        assert ids == ["x", "xy", "y"]
+        assert scores[0] == pytest.approx(1.0, abs=1e-6)
+        assert scores[2] == pytest.approx(0.0, abs=1e-6)
+
+    def test_removed_vectors_are_not_returned(self) -> None:
+        """Test that removed vectors are excluded from results and count."""
+        index = VectorIndex(2, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE)
+        index.add("a", [1.0, 0.0])
+        index.add("b", [0.0, 1.0])
+
+        assert index.remove("a") is True
+        assert index.remove("missing") is False
+
+        ids, _ = index.search([1.0, 0.0], k=2)
+        assert ids == ["b"]
+        assert index.count == 1
+
+    def test_remove_many_counts_each_id_once(self) -> None:
+        """Test that remove_many skips unknown and already-removed ids."""
+        index = VectorIndex(2, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE)
+        index.add("a", [1.0, 0.0])
+        index.add("b", [0.0, 1.0])
+        index.add("c", [1.0, 1.0])
+
+        assert index.remove_many(["a", "a", "missing", "b"]) == 2
+        assert index.count == 1
+        ids, _ = index.search([1.0, 0.0], k=3)
+        assert ids == ["c"]
+
+    def test_accepts_ndarray_without_aliasing(self) -> None:
+        """Test that ndarray inputs are accepted and not aliased by the index."""
+        index = VectorIndex(2, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE)
+        vec = np.array([1.0, 0.0], dtype=np.float32)
+        index.add("a", vec)
+        vec[:] = [0.0, 1.0]
+
+        ids, scores = index.search(np.array([1.0, 0.0]), k=1)
+
+        assert ids == ["a"]
+        assert scores[0] == pytest.approx(1.0)
+
+    def test_memmap_storage_matches_in_memory(self, tmp_path: Path, random_vectors: np.ndarray) -> None:
+        """Test that a memmap-backed index grows past its initial file and ranks identically."""
+        in_memory = VectorIndex(32, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE)
+        on_disk = VectorIndex(32, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE, tmp_path)
+        on_disk._MMAP_MIN_ROWS = 16
+        for i, vec in enumerate(random_vectors):
+            in_memory.add(str(i), vec)
+            on_disk.add(str(i), vec)
+
+        assert isinstance(on_disk.vectors, np.memmap)
+        assert (tmp_path / VectorIndex._MMAP_FILENAME).stat().st_size >= 200 * 32 * 4
+        assert on_disk.search(random_vectors[3], k=5) == in_memory.search(random_vectors[3], k=5)
+
+    def test_buffer_growth_preserves_rows(self, random_vectors: np.ndarray) -> None:
+        """Test that growing the preallocated buffer keeps every stored row intact."""
+        index = VectorIndex(32, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.DOT_PRODUCT)
+        for i, vec in enumerate(random_vectors):
+            index.add(f"id{i}", vec)
+
+        assert index.vectors is not None
+        assert index.vectors.shape == random_vectors.shape
+        np.testing.assert_array_equal(index.vectors, random_vectors)
+
+    def test_cosine_rows_are_stored_unit_length(self, random_vectors: np.ndarray) -> None:
+        """Test that a COSINE index normalizes rows once at insert time."""
+        index = VectorIndex(32, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE)
+        index.add_many([f"id{i}" for i in range(10)], random_vectors[:10])
+
+        assert index.vectors is not None
+        np.testing.assert_allclose(np.linalg.norm(index.vectors, axis=1), 1.0, rtol=1e-5)
+
+    def test_sq_norms_are_cached_on_add(self, random_vectors: np.ndarray) -> None:
+        """Test that squared row norms are stored at insert time and match the vectors."""
+        index = VectorIndex(32, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.DOT_PRODUCT)
+        for i, vec in enumerate(random_vectors[:10]):
+            index.add(f"id{i}", vec)
+
+        assert index.sq_norms is not None
+        expected = np.sum(random_vectors[:10] ** 2, axis=1)
+        np.testing.assert_allclose(index.sq_norms, expected, rtol=1e-5)
+
+    def test_l2_search_matches_brute_force(self, random_vectors: np.ndarray) -> None:
+        """Test that L2 search returns the nearest rows and their Euclidean distances."""
+        index = VectorIndex(32, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.L2)
+        index.add_many([f"id{i}" for i in range(200)], random_vectors)
+        index.remove("id3")
+        query = random_vectors[3] + 0.01
+
+        ids, scores = index.search(query, k=5)
+
+        distances = np.linalg.norm(random_vectors - query, axis=1)
+        distances[3] = np.inf
+        expected = np.argsort(distances)[:5]
+        assert ids == [f"id{i}" for i in expected]
+        np.testing.assert_allclose(scores, distances[expected], rtol=1e-4)
+
+    def test_dot_product_search_matches_brute_force(self, random_vectors: np.ndarray) -> None:
+        """Test that dot-product search ranks by the raw inner product."""
+        index = VectorIndex(32, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.DOT_PRODUCT)
+        index.add_many([f"id{i}" for i in range(200)], random_vectors)
+
+        ids, scores = index.search(random_vectors[0], k=5)
+
+        dots = random_vectors @ random_vectors[0]
+        expected = np.argsort(dots)[::-1][:5]
+        assert ids == [f"id{i}" for i in expected]
+        np.testing.assert_allclose(scores, dots[expected], rtol=1e-5)
+
+    def test_add_many_matches_single_adds(self, random_vectors: np.ndarray) -> None:
+        """Test that a block insert stores the same rows and ids as per-row adds."""
+        single = VectorIndex(32, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE)
+        for i, vec in enumerate(random_vectors):
+            single.add(f"id{i}", vec)
+        block = VectorIndex(32, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE)
+        block.add_many([f"id{i}" for i in range(50)], random_vectors[:50])
+        block.add_many([f"id{i}" for i in range(50, 200)], random_vectors[50:].tolist())
+
+        assert block.embedding_ids == single.embedding_ids
+        assert block.id_to_index == single.id_to_index
+        assert block.search(random_vectors[7], k=5) == single.search(random_vectors[7], k=5)
+
+    def test_add_many_rejects_mismatched_block(self, random_vectors: np.ndarray) -> None:
+        """Test that a block whose shape disagrees with the ids or dimensions raises."""
+        index = VectorIndex(32, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE)
+
+        with pytest.raises(ValueError, match="shape mismatch"):
+            index.add_many(["a", "b"], random_vectors[:3])
+
+    @pytest.mark.parametrize(
+        "metric",
+        [VectorSimilarityMetric.COSINE, VectorSimilarityMetric.L2, VectorSimilarityMetric.DOT_PRODUCT],
+    )
+    def test_search_batch_matches_single_searches(
+        self, random_vectors: np.ndarray, metric: VectorSimilarityMetric
+    ) -> None:
+        """Test that blocked batch search returns what per-query search returns."""
+        index = VectorIndex(32, VectorIndexingStrategy.FLAT.value, metric)
+        index._BATCH_BLOCK_ROWS = 48  # several blocks, last one partial
+        index.add_many([f"id{i}" for i in range(200)], random_vectors)
+        index.remove_many(["id0", "id50", "id199"])
+        queries = random_vectors[:6]
+
+        batch = index.search_batch(queries, k=7)
+
+        assert len(batch) == len(queries)
+        for query, (ids, scores) in zip(queries, batch, strict=True):
+            expected_ids, expected_scores = index.search(query, k=7)
+            assert ids == expected_ids
+            # GEMM vs GEMV rounding, amplified by the sqrt near zero for L2 self-matches
+            np.testing.assert_allclose(scores, expected_scores, rtol=1e-4, atol=1e-2)
+
+    def test_dimension_mismatch_raises(self) -> None:
+        """Test that vectors of the wrong dimension are rejected."""
+        index = VectorIndex(3, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE)
+
+        with pytest.raises(ValueError, match="dimension mismatch"):
+            index.add("a", [1.0, 0.0])
+
+
+class TestSQ8Index:
+    """Test suite for the int8 scalar-quantized index."""
+
+    def test_matches_float_ranking(self, random_vectors: np.ndarray) -> None:
+        """Test that quantized top-k matches the exact float32 top-k."""
+        exact = VectorIndex(32, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE)
+        quantized = SQ8Index(32, VectorSimilarityMetric.COSINE)
+        for i, vec in enumerate(random_vectors):
+            exact.add(str(i), vec.tolist())
+            quantized.add(str(i), vec.tolist())
+
+        query = random_vectors[7].tolist()
+        exact_ids, exact_scores = exact.search(query, k=5)
+        quantized_ids, quantized_scores = quantized.search(query, k=5)
+
+        assert quantized_ids[0] == exact_ids[0] == "7"
+        assert set(quantized_ids) == set(exact_ids)
+        assert quantized_scores == pytest.approx(exact_scores, abs=0.02)
+
+    def test_removed_vectors_are_not_returned(self) -> None:
+        """Test that tombstoned rows are masked out of quantized search."""
+        index = SQ8Index(2, VectorSimilarityMetric.COSINE)
+        index.add("a", [1.0, 0.0])
+        index.add("b", [0.0, 1.0])
+        index.remove("a")
+
+        ids, _ = index.search([1.0, 0.0], k=2)
+
+        assert ids == ["b"]
+
+    def test_add_many_matches_single_adds(self, random_vectors: np.ndarray) -> None:
+        """Test that block quantization produces the same codes as per-row adds."""
+        single = SQ8Index(32, VectorSimilarityMetric.COSINE)
+        for i, vec in enumerate(random_vectors):
+            single.add(f"id{i}", vec)
+        block = SQ8Index(32, VectorSimilarityMetric.COSINE)
+        block.add_many([f"id{i}" for i in range(200)], random_vectors)
+
+        np.testing.assert_array_equal(block.codes, single.codes)
+        np.testing.assert_allclose(block.scales, single.scales, rtol=1e-6)
+
+    def test_rejects_non_cosine_metric(self) -> None:
+        """Test that SQ8Index only supports COSINE."""
+        with pytest.raises(NotImplementedError):
+            SQ8Index(2, VectorSimilarityMetric.DOT_PRODUCT)
+
+
+class TestIVFIndex:
+    """Test suite for the IVF-Flat index."""
+
+    def test_finds_exact_match_when_probing_all_lists(self, random_vectors: np.ndarray) -> None:
+        """Test that probing every list returns the same top hit as FLAT search."""
+        index = IVFIndex(32, VectorSimilarityMetric.COSINE, nlist=8, nprobe=8, train_size=64)
+        for i, vec in enumerate(random_vectors):
+            index.add(str(i), vec.tolist())
+
+        ids, scores = index.search(random_vectors[11].tolist(), k=3)
+
+        assert ids[0] == "11"
+        assert scores[0] == pytest.approx(1.0, abs=1e-5)
+
+    def test_add_many_trains_and_assigns(self, random_vectors: np.ndarray) -> None:
+        """Test that block inserts train once past train_size and fill posting lists."""
+        index = IVFIndex(32, VectorSimilarityMetric.COSINE, nlist=4, nprobe=4, train_size=100)
+        index.add_many([f"id{i}" for i in range(120)], random_vectors[:120])
+        index.add_many([f"id{i}" for i in range(120, 200)], random_vectors[120:])
+
+        assert index.centroids is not None
+        assert sum(index.list_sizes) == 200
+        ids, _ = index.search(random_vectors[150], k=1)
+        assert ids == ["id150"]
+
+    def test_removal_compacts_posting_lists(self, random_vectors: np.ndarray) -> None:
+        """Test that removed vectors never come back, before and after compaction."""
+        index = IVFIndex(32, VectorSimilarityMetric.COSINE, nlist=4, nprobe=4, train_size=64)
+        for i, vec in enumerate(random_vectors):
+            index.add(str(i), vec.tolist())
+
+        removed = {str(i) for i in range(0, 200, 2)}
+        for embedding_id in removed:
+            assert index.remove(embedding_id) is True
+
+        ids, _ = index.search(random_vectors[0].tolist(), k=200)
+
+        assert len(ids) == 100
+        assert removed.isdisjoint(ids)
+        assert sum(index.list_sizes) - sum(index.list_dead) == 100
+
+    def test_search_is_exact_before_training(self, random_vectors: np.ndarray) -> None:
+        """Test that an untrained index falls back to exact search over all vectors."""
+        index = IVFIndex(32, VectorSimilarityMetric.COSINE, nlist=4, nprobe=1)
+        for i, vec in enumerate(random_vectors[:50]):
+            index.add(str(i), vec)
+
+        ids, _ = index.search(random_vectors[5], k=50)
+
+        assert index.centroids is None
+        assert len(ids) == 50
+        assert ids[0] == "5"
+
+    def test_training_clusters_all_buffered_vectors(self, random_vectors: np.ndarray) -> None:
+        """Test that training assigns every live buffered vector to exactly one list."""
+        index = IVFIndex(32, VectorSimilarityMetric.COSINE, nlist=4, nprobe=1, train_size=100)
+        for i, vec in enumerate(random_vectors[:99]):
+            index.add(str(i), vec)
+        index.remove("0")
+        index.add("99", random_vectors[99])
+
+        assert index.centroids is not None
+        assert np.allclose(np.linalg.norm(index.centroids, axis=1), 1.0, atol=1e-5)
+        assert sum(index.list_sizes) == 99
+        assert 0 not in index.index_to_slot
+
+
+class TestVectorIndexManager:
+    """Test suite for VectorIndexManager index creation."""
+
+    def test_quantize_creates_sq8_for_flat_cosine(self) -> None:
+        """Test that quantize=True selects SQ8Index for FLAT COSINE indices."""
+        manager = VectorIndexManager(metric=VectorSimilarityMetric.COSINE, quantize=True)
+
+        index = manager.get_or_create_index("lib", "cfg", 4, VectorIndexingStrategy.FLAT.value)
+
+        assert isinstance(index, SQ8Index)
+
+    def test_default_creates_float_index(self) -> None:
+        """Test that the default manager keeps float32 FLAT indices."""
+        manager = VectorIndexManager(metric=VectorSimilarityMetric.COSINE)
+
+        index = manager.get_or_create_index("lib", "cfg", 4, VectorIndexingStrategy.FLAT.value)
+
+        assert type(index) is VectorIndex
+
+    def test_index_map_is_swapped_not_mutated(self) -> None:
+        """Test that creating an index publishes a new snapshot and leaves old ones intact."""
+        manager = VectorIndexManager(metric=VectorSimilarityMetric.COSINE)
+        before = manager.indices
+
+        index = manager.get_or_create_index("lib", "cfg", 4, VectorIndexingStrategy.FLAT.value)
+
+        assert len(before) == 0
+        assert manager.indices[("lib", "cfg")] is index
+        assert manager.get_or_create_index("lib", "cfg", 4, VectorIndexingStrategy.FLAT.value) is index
+        with pytest.raises(TypeError):
+            manager.indices[("lib", "other")] = index  # type: ignore[index]
@@ -11,16 +11,18 @@ Clean Architecture:
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
 import threading
+from concurrent.futures import Future
 from datetime import UTC, datetime
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from vdb_core.infrastructure.message_bus.rabbitmq_message_bus import ExchangeType
@@ -33,8 +35,31 @@ class EventLogConsumer:
 
     Binds to wildcard routing key (#) to capture everything.
     Direct SQL writes for performance - no ORM overhead.
+
+    Writes run on one background asyncio loop that owns a single engine for the
+    consumer's lifetime; the pika thread only schedules them and acks (via
+    ``add_callback_threadsafe``) once each write has finished.
+
+    Rows are buffered and written with one executemany + commit per batch. A batch
+    is flushed when it holds ``_PREFETCH_COUNT`` rows (every unacked delivery) or
+    ``_FLUSH_INTERVAL_SECONDS`` after its first row, whichever comes first.
     """
 
+    _PREFETCH_COUNT = 50
+    _FLUSH_INTERVAL_SECONDS = 0.1
+    _POOL_SIZE = 10
+    _SHUTDOWN_TIMEOUT_SECONDS = 10
+
+    _INSERT_EVENT_LOG = text("""
+        INSERT INTO event_logs (
+            event_type, event_id, timestamp, routing_key,
+            data, document_id, library_id, pipeline_stage
+        ) VALUES (
+            :event_type, :event_id, :timestamp, :routing_key,
+            CAST(:data AS jsonb), :document_id, :library_id, :pipeline_stage
+        )
+    """)
+
     def __init__(self, rabbitmq_host: str, rabbitmq_port: int, database_url: str) -> None:
         """Initialize event log consumer.
 
@@ -49,11 +74,33 @@ class EventLogConsumer:
         self.database_url = database_url
         self._connection: pika.BlockingConnection | None = None
         self._channel: BlockingChannel | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._engine: AsyncEngine | None = None
+        self._async_session: sessionmaker[AsyncSession] | None = None
+
+        # Batch state, only touched from the writer loop thread
+        self._pending: list[dict[str, object]] = []
+        self._batch_done: asyncio.Future[None] | None = None
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    def _start_writer_loop(self) -> None:
+        """Start the background event loop and the engine it writes through."""
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name="event-log-writer", daemon=True)
+        self._loop_thread.start()
+
+        # Connections are opened lazily inside the writer loop, so the pool binds to it
+        self._engine = create_async_engine(self.database_url, echo=False, pool_pre_ping=True, pool_size=self._POOL_SIZE)
+        self._async_session = sessionmaker(self._engine, class_=AsyncSession, expire_on_commit=False)
 
     def start(self) -> None:
         """Start consuming all events."""
         logger.info("Starting EventLogConsumer (Infrastructure - Observability)")
 
+        self._start_writer_loop()
+
         connection_params = pika.ConnectionParameters(
             host=self.rabbitmq_host,
             port=self.rabbitmq_port,
@@ -82,8 +129,8 @@ class EventLogConsumer:
             routing_key="#",  # Wildcard - matches ALL routing keys!
         )
 
-        # High prefetch for logging throughput
-        self._channel.basic_qos(prefetch_count=50)
+        # High prefetch for logging throughput; also the batch size
+        self._channel.basic_qos(prefetch_count=self._PREFETCH_COUNT)
 
         logger.info("Listening for ALL events on 'vdb.events' exchange (routing_key=#)")
         self._channel.basic_consume(
@@ -106,103 +153,129 @@ class EventLogConsumer:
         body: bytes,
     ) -> None:
         """Log event to PostgreSQL."""
-        try:
-            event_data = json.loads(body.decode("utf-8"))
-            routing_key = method.routing_key
+        if self._loop is None or self._async_session is None:
+            msg = "Writer loop not started"
+            raise RuntimeError(msg)
 
-            # Write to database - run async code in a thread to avoid event loop conflicts
-            def run_async() -> None:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    # Create engine and session in this thread's event loop
-                    engine = create_async_engine(self.database_url, echo=False, pool_pre_ping=True)
-                    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        delivery_tag = method.delivery_tag
+        try:
+            event_data = json.loads(body)
 
-                    async def write_and_cleanup() -> None:
-                        try:
-                            await self._write_event_log(event_data, routing_key, async_session)
-                        finally:
-                            await engine.dispose()
+            # Hand the row to the background loop, which batches writes
+            future = asyncio.run_coroutine_threadsafe(self._log_event(event_data, method.routing_key), self._loop)
 
-                    loop.run_until_complete(write_and_cleanup())
-                finally:
-                    loop.close()
+        except Exception:
+            logger.exception("Error logging event")
+            # Don't requeue - logging failures shouldn't retry forever
+            channel.basic_ack(delivery_tag=delivery_tag)
+            return
 
-            thread = threading.Thread(target=run_async)
-            thread.start()
-            thread.join(timeout=10)  # 10 second timeout
+        # Always ack - logging failures shouldn't block pipeline
+        future.add_done_callback(functools.partial(self._ack_threadsafe, channel, delivery_tag))
 
-            # Always ack - logging failures shouldn't block pipeline
-            channel.basic_ack(delivery_tag=method.delivery_tag)
+    def _ack_threadsafe(self, channel: BlockingChannel, delivery_tag: int, _future: Future[None]) -> None:
+        """Ack from the writer thread by scheduling basic_ack on pika's own thread."""
+        if self._connection is None or not self._connection.is_open:
+            return
+        self._connection.add_callback_threadsafe(functools.partial(channel.basic_ack, delivery_tag=delivery_tag))
 
+    async def _log_event(self, event_data: dict, routing_key: str) -> None:
+        """Buffer one event row and wait until the batch holding it has been written."""
+        loop = asyncio.get_running_loop()
+        try:
+            row = self._event_row(event_data, routing_key)
         except Exception:
-            logger.exception("Error logging event")
-            # Don't requeue - logging failures shouldn't retry forever
-            channel.basic_ack(delivery_tag=method.delivery_tag)
+            logger.exception("Failed to build event log row")
+            return
+
+        if self._batch_done is None:
+            # First row of a new batch: flush it after at most _FLUSH_INTERVAL_SECONDS
+            self._batch_done = loop.create_future()
+            self._flush_timer = loop.call_later(self._FLUSH_INTERVAL_SECONDS, self._flush_pending)
+        done = self._batch_done
+        self._pending.append(row)
+        if len(self._pending) >= self._PREFETCH_COUNT:
+            # Every unacked delivery is buffered; nothing more arrives until we flush
+            self._flush_pending()
+
+        await done
+
+    def _flush_pending(self) -> None:
+        """Detach the buffered rows and write them in a background task."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        rows, done = self._pending, self._batch_done
+        self._pending, self._batch_done = [], None
+        if done is None:
+            return
+        task = asyncio.get_running_loop().create_task(self._write_event_logs(rows, done))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _write_event_logs(self, rows: list[dict[str, object]], done: asyncio.Future[None]) -> None:
+        """Write a batch of rows to event_logs with one executemany and one commit."""
+        if self._async_session is None:
+            msg = "Writer loop not started"
+            raise RuntimeError(msg)
+        try:
+            async with self._async_session() as session:
+                try:
+                    # Direct SQL insert (fastest - no ORM overhead); a list of
+                    # parameter sets runs as a single executemany round-trip
+                    await session.execute(self._INSERT_EVENT_LOG, rows)
+                    await session.commit()
+                except Exception:
+                    logger.exception("Failed to write %s event logs", len(rows))
+                    await session.rollback()
+        finally:
+            # Always release the waiters - logging failures shouldn't block pipeline
+            done.set_result(None)
+
+    def _event_row(self, event_data: dict, routing_key: str) -> dict[str, object]:
+        """Build the event_logs insert parameters for one event."""
+        # Extract common fields from event payload
+        data = event_data.get("data", {})
+
+        # Extract IDs (handle both plain strings and value objects)
+        document_id_data = data.get("document_id")
+        library_id_data = data.get("library_id")
+
+        document_id = (
+            (document_id_data.get("value") if isinstance(document_id_data, dict) else document_id_data)
+            if document_id_data
+            else None
+        )
 
-    async def _write_event_log(
-        self, event_data: dict, routing_key: str, async_session: sessionmaker[AsyncSession]
-    ) -> None:
-        """Write event to event_logs table via direct SQL."""
-        async with async_session() as session:
-            try:
-                # Extract common fields from event payload
-                data = event_data.get("data", {})
-
-                # Extract IDs (handle both plain strings and value objects)
-                document_id_data = data.get("document_id")
-                library_id_data = data.get("library_id")
-
-                document_id = (
-                    (document_id_data.get("value") if isinstance(document_id_data, dict) else document_id_data)
-                    if document_id_data
-                    else None
-                )
-
-                library_id = (
-                    (library_id_data.get("value") if isinstance(library_id_data, dict) else library_id_data)
-                    if library_id_data
-                    else None
-                )
-
-                # Infer pipeline stage from routing key
-                pipeline_stage = self._infer_stage(routing_key)
-
-                # Parse timestamp
-                timestamp_str = event_data.get("timestamp")
-                timestamp = datetime.fromisoformat(timestamp_str) if timestamp_str else datetime.now(UTC)
-
-                # Direct SQL insert (fastest - no ORM overhead)
-                stmt = text("""
-                    INSERT INTO event_logs (
-                        event_type, event_id, timestamp, routing_key,
-                        data, document_id, library_id, pipeline_stage
-                    ) VALUES (
-                        :event_type, :event_id, :timestamp, :routing_key,
-                        CAST(:data AS jsonb), :document_id, :library_id, :pipeline_stage
-                    )
-                """)
-
-                await session.execute(
-                    stmt,
-                    {
-                        "event_type": event_data.get("event_type", "Unknown"),
-                        "event_id": event_data.get("event_id"),
-                        "timestamp": timestamp,
-                        "routing_key": routing_key,
-                        "data": json.dumps(data),
-                        "document_id": document_id,
-                        "library_id": library_id,
-                        "pipeline_stage": pipeline_stage,
-                    },
-                )
-
-                await session.commit()
-
-            except Exception:
-                logger.exception("Failed to write event log")
-                await session.rollback()
+        library_id = (
+            (library_id_data.get("value") if isinstance(library_id_data, dict) else library_id_data)
+            if library_id_data
+            else None
+        )
+
+        # Parse timestamp
+        timestamp_str = event_data.get("timestamp")
+        timestamp = datetime.fromisoformat(timestamp_str) if timestamp_str else datetime.now(UTC)
+
+        return {
+            "event_type": event_data.get("event_type", "Unknown"),
+            "event_id": event_data.get("event_id"),
+            "timestamp": timestamp,
+            "routing_key": routing_key,
+            "data": json.dumps(data),
+            "document_id": document_id,
+            "library_id": library_id,
+            # Infer pipeline stage from routing key
+            "pipeline_stage": self._infer_stage(routing_key),
+        }
+
+    async def _close_writer(self) -> None:
+        """Write any buffered rows, then dispose the engine."""
+        self._flush_pending()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks)
+        if self._engine is not None:
+            await self._engine.dispose()
 
     def _infer_stage(self, routing_key: str) -> str | None:
         """Infer pipeline stage from RabbitMQ routing key."""
@@ -218,11 +291,24 @@ class EventLogConsumer:
     def stop(self) -> None:
         """Stop consumer and close connections."""
         logger.info("Stopping EventLogConsumer...")
+        if self._loop is not None:
+            # Write buffered rows while the connection is still open, so their acks are scheduled
+            asyncio.run_coroutine_threadsafe(self._close_writer(), self._loop).result(
+                timeout=self._SHUTDOWN_TIMEOUT_SECONDS
+            )
+        if self._connection and self._connection.is_open:
+            # Run the ack callbacks scheduled by the last flush before tearing down
+            self._connection.process_data_events(time_limit=0)
         if self._channel:
             self._channel.stop_consuming()
-        if self._connection:
+        if self._connection and self._connection.is_open:
             self._connection.close()
-        # No need to dispose engine - each thread creates and disposes its own
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._loop_thread is not None:
+                self._loop_thread.join(timeout=self._SHUTDOWN_TIMEOUT_SECONDS)
+            self._loop.close()
+            self._loop = None
 
 
 async def main() -> None:
@@ -4,12 +4,16 @@ import asyncio
 import json
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any
-
-import pika
-from pika.adapters.blocking_connection import BlockingChannel
-from temporalio.client import Client
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, ClassVar, Self
+
+import aio_pika
+import uvloop
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractQueue, AbstractRobustConnection
+from temporalio.client import Client, WorkflowHandle
+from temporalio.exceptions import WorkflowAlreadyStartedError
+from temporalio.service import KeepAliveConfig
 from vdb_core.infrastructure.workflows import (
     IngestDocumentWorkflow,
     IngestDocumentWorkflowInput,
@@ -21,19 +25,199 @@ from vdb_core.infrastructure.workflows import (
 
 logger = logging.getLogger(__name__)
 
+_EXCHANGE_NAME = "vdb.events"
+# Failed deliveries are dead-lettered here (vdb-dead-letter policy) and routed to the queue's retry queue
+_DEAD_LETTER_EXCHANGE_NAME = "vdb.events.dlx"
+# How long a failed delivery waits in the retry queue before it is redelivered
+_RETRY_DELAY_MS = 5_000
+# Deliveries that fail this many times are parked in the queue's ".dlq" queue
+_MAX_DELIVERY_ATTEMPTS = 5
+
+# (rabbitmq_host, queue_name) pairs whose topology this process has already declared
+_topology_declared: set[tuple[str, str]] = set()
+
+# (workflow run method, input, workflow id, future resolved with the started handle)
+_PendingStart = tuple[Callable[..., Any], Any, str, asyncio.Future[WorkflowHandle[Any, Any]]]
+
+
+async def _declare_topology(
+    channel: AbstractChannel, rabbitmq_host: str, queue_name: str, routing_keys: Sequence[str]
+) -> AbstractQueue:
+    """Declare the events exchange, a durable queue and its bindings, once per process.
+
+    Next to ``queue_name`` this declares its retry and parking queues. A delivery
+    nacked without requeue is dead-lettered to ``<queue>.retry`` (bound to the
+    dead-letter exchange with the same routing keys), waits there for
+    ``_RETRY_DELAY_MS`` and then expires back into ``queue_name``; the broker counts
+    these rounds in the ``x-death`` header. ``<queue>.dlq`` holds parked messages.
+
+    ``queue_name`` itself is declared without arguments, as it always was, so existing
+    queues are not rejected with PRECONDITION_FAILED; its dead-letter exchange comes
+    from the ``vdb-dead-letter`` broker policy (set up in docker-compose.yml and
+    deploy/kubernetes/22-rabbitmq.yaml). Without that policy, failed deliveries are
+    dropped instead of retried.
+
+    The main queue is declared with a round-trip; the new retry/parking queues and
+    the bindings are sent with nowait, so their frames are pipelined. The passive
+    declare that follows is only answered after the broker has processed them, and
+    fails if any of them was rejected (the broker closes the channel).
+    """
+    key = (rabbitmq_host, queue_name)
+    if key in _topology_declared:
+        return await channel.get_queue(queue_name, ensure=False)
+
+    underlay = await channel.get_underlay_channel()
+    retry_queue_name = f"{queue_name}.retry"
+    # Declare exchanges and queues (idempotent); all survive a broker restart
+    await underlay.exchange_declare(_EXCHANGE_NAME, exchange_type="topic", durable=True, nowait=True)
+    await underlay.exchange_declare(_DEAD_LETTER_EXCHANGE_NAME, exchange_type="topic", durable=True, nowait=True)
+    await underlay.queue_declare(queue_name, durable=True)
+    # Expired retries go straight back to queue_name through the default exchange
+    await underlay.queue_declare(
+        retry_queue_name,
+        durable=True,
+        arguments={
+            "x-message-ttl": _RETRY_DELAY_MS,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": queue_name,
+        },
+        nowait=True,
+    )
+    await underlay.queue_declare(f"{queue_name}.dlq", durable=True, nowait=True)
+    # Bind queue to exchange with routing patterns, and its retry queue to the dead-letter exchange
+    for routing_key in routing_keys:
+        await underlay.queue_bind(queue_name, _EXCHANGE_NAME, routing_key=routing_key, nowait=True)
+        await underlay.queue_bind(retry_queue_name, _DEAD_LETTER_EXCHANGE_NAME, routing_key=routing_key, nowait=True)
+
+    queue = await channel.declare_queue(queue_name, passive=True)
+    _topology_declared.add(key)
+    return queue
+
+
+def _wid(prefix: str, *parts: object) -> str:
+    """Build a workflow id ``prefix-part1-part2...``."""
+    return prefix + "-" + "-".join(map(str, parts))
+
+
+def _failed_attempts(message: AbstractIncomingMessage, queue_name: str) -> int:
+    """Count how often the broker has dead-lettered this message out of ``queue_name``."""
+    deaths = message.headers.get("x-death")
+    if not isinstance(deaths, list):
+        return 0
+    return sum(
+        int(death.get("count", 1))
+        for death in deaths
+        if isinstance(death, dict) and death.get("queue") == queue_name and death.get("reason") == "rejected"
+    )
 
-class TemporalIngestionConsumer:
-    """Consumes workflow-triggering events from RabbitMQ and triggers Temporal workflows.
 
-    This service bridges RabbitMQ and Temporal:
-    1. Subscribes to workflow_events queue
-    2. Receives domain events (DocumentCreated, LibraryConfigAdded, etc.)
-    3. Triggers appropriate Temporal workflows (IngestDocument, ProcessConfig, etc.)
-    4. Acknowledges message after workflow starts
+class _AckBatcher:
+    """Acknowledge completed deliveries in bulk with ``basic.ack(multiple=True)``.
 
-    Each consumer runs in its own process/pod and can be scaled independently.
+    Handlers finish out of order, so only the longest prefix of completed delivery
+    tags is acked, with one frame for the highest tag in it. Failed deliveries are
+    nacked individually right away, which settles them before any
+    later multiple-ack covers their tag. A flush happens every ``batch_size``
+    completions or ``flush_interval`` seconds after the first unflushed one.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float = 0.05) -> None:
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        # delivery_tag -> message, in delivery order; None while its handler runs
+        self._outstanding: dict[int, AbstractIncomingMessage | None] = {}
+        self._last_tag = 0
+        self._completed = 0
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    def track(self, message: AbstractIncomingMessage) -> None:
+        """Register a delivery before its handler runs."""
+        tag = message.delivery_tag or 0
+        if tag <= self._last_tag:
+            # Tags restart on a new channel (robust reconnect); the old channel's
+            # unacked deliveries are redelivered by the broker
+            self._outstanding.clear()
+            self._completed = 0
+        self._last_tag = tag
+        self._outstanding[tag] = None
+
+    def complete(self, message: AbstractIncomingMessage) -> None:
+        """Mark a delivery as handled; it is acked with the next flush."""
+        tag = message.delivery_tag or 0
+        if tag not in self._outstanding:
+            return
+        self._outstanding[tag] = message
+        self._completed += 1
+        if self._completed >= self._batch_size:
+            self._schedule_flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(self._flush_interval, self._schedule_flush)
+
+    async def reject(self, message: AbstractIncomingMessage) -> None:
+        """Nack a failed delivery immediately; the broker dead-letters it for a retry."""
+        self._outstanding.pop(message.delivery_tag or 0, None)
+        await message.nack(requeue=False)
+        # This delivery may have been the head holding back completed ones, whose timer already fired
+        head = next(iter(self._outstanding.values()), None)
+        if head is not None:
+            self._schedule_flush()
+
+    async def flush(self) -> None:
+        """Ack the longest completed prefix with a single multiple-ack."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        last: AbstractIncomingMessage | None = None
+        for tag, message in list(self._outstanding.items()):
+            if message is None:
+                break
+            del self._outstanding[tag]
+            self._completed -= 1
+            last = message
+        if last is None:
+            return
+        try:
+            await last.ack(multiple=True)
+        except Exception:
+            # Channel gone: the broker redelivers everything it never saw acked
+            logger.exception("Failed to ack deliveries up to %s", last.delivery_tag)
+
+    def _schedule_flush(self) -> None:
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+
+async def _connect(rabbitmq_host: str, rabbitmq_port: int) -> AbstractRobustConnection:
+    """Open a robust connection (reconnects and restores channels on failure)."""
+    return await aio_pika.connect_robust(
+        host=rabbitmq_host,
+        port=rabbitmq_port,
+        login="guest",
+        password="guest",
+        heartbeat=600,
+    )
+
+
+class _TemporalConsumer(ABC):
+    """AMQP plumbing shared by the consumers that turn events into Temporal workflows.
+
+    Consumer, Temporal client and acks share one asyncio loop. aio-pika runs each
+    delivery's callback as its own task, so up to ``prefetch_count`` handlers
+    overlap. Handled messages are acked in batches (see ``_AckBatcher``). A message
+    whose handler raises is retried after a delay, up to ``_MAX_DELIVERY_ATTEMPTS``
+    times, and then parked in the ``.dlq`` queue; one that cannot be parsed is
+    parked right away (see ``_declare_topology``).
+
+    Subclasses set ``ROUTING_KEYS`` and ``DEFAULT_PREFETCH_COUNT`` and implement
+    ``_dispatch``; ``_on_start``/``_on_stop`` hook per-consumer background work.
     """
 
+    DEFAULT_PREFETCH_COUNT: ClassVar[int]
+    ROUTING_KEYS: ClassVar[tuple[str, ...]]
+
     def __init__(
         self,
         rabbitmq_host: str,
@@ -41,6 +225,7 @@ class TemporalIngestionConsumer:
         queue_name: str,
         temporal_client: Client,
         task_queue: str,
+        prefetch_count: int | None = None,
     ) -> None:
         """Initialize consumer.
 
@@ -50,6 +235,8 @@ class TemporalIngestionConsumer:
             queue_name: Queue to consume from (e.g., "workflow_events")
             temporal_client: Connected Temporal client
             task_queue: Temporal task queue name
+            prefetch_count: Max unacked deliveries the broker sends this consumer
+                (defaults to the class's ``DEFAULT_PREFETCH_COUNT``)
 
         """
         self.rabbitmq_host = rabbitmq_host
@@ -57,149 +244,200 @@ class TemporalIngestionConsumer:
         self.queue_name = queue_name
         self.temporal_client = temporal_client
         self.task_queue = task_queue
+        self.prefetch_count = prefetch_count if prefetch_count is not None else self.DEFAULT_PREFETCH_COUNT
 
-        self._connection: pika.BlockingConnection | None = None
-        self._channel: BlockingChannel | None = None
-        self._executor = ThreadPoolExecutor(max_workers=10)
-
-    def start(self) -> None:
-        """Start consuming messages from RabbitMQ."""
-        logger.info("Starting TemporalIngestionConsumer for queue %s", self.queue_name)
-
-        # Connect to RabbitMQ
-        connection_params = pika.ConnectionParameters(
-            host=self.rabbitmq_host,
-            port=self.rabbitmq_port,
-            credentials=pika.PlainCredentials("guest", "guest"),
-            heartbeat=600,
-        )
+        # Set only when this consumer opened its own connection (see ``run``)
+        self._connection: AbstractRobustConnection | None = None
+        self._channel: AbstractChannel | None = None
+        # Flush acks well before every prefetch slot is waiting on one
+        self._acks = _AckBatcher(batch_size=self.prefetch_count // 2)
 
-        self._connection = pika.BlockingConnection(connection_params)
-        self._channel = self._connection.channel()
+    async def run(self, connection: AbstractRobustConnection | None = None) -> None:
+        """Consume messages from RabbitMQ until cancelled.
 
-        # Declare exchange (idempotent - ensures it exists)
-        self._channel.exchange_declare(
-            exchange="vdb.events",
-            exchange_type="topic",
-            durable=True,
-        )
+        Args:
+            connection: Shared connection to open this consumer's channel on. If None,
+                the consumer opens its own connection and closes it on stop.
 
-        # Declare queue (idempotent)
-        self._channel.queue_declare(
-            queue=self.queue_name,
-            durable=True,  # Survive broker restart
-        )
+        """
+        logger.info("Starting %s for queue %s", type(self).__name__, self.queue_name)
 
-        # Bind queue to exchange with routing patterns
-        self._channel.queue_bind(
-            exchange="vdb.events",
-            queue=self.queue_name,
-            routing_key="document.*",  # Match all document events
-        )
-        self._channel.queue_bind(
-            exchange="vdb.events",
-            queue=self.queue_name,
-            routing_key="library.config.*",  # Match library config events
-        )
-        self._channel.queue_bind(
-            exchange="vdb.events",
-            queue=self.queue_name,
-            routing_key="vectorization.*",  # Match vectorization events
-        )
-        self._channel.queue_bind(
-            exchange="vdb.events",
-            queue=self.queue_name,
-            routing_key="content.*",  # Match extracted content events
-        )
+        if connection is None:
+            connection = self._connection = await _connect(self.rabbitmq_host, self.rabbitmq_port)
+        await self._on_start()
+        try:
+            # Publisher confirms on, so publishes on this channel can await broker acks
+            channel = self._channel = await connection.channel(publisher_confirms=True)
 
-        # Set QoS - prefetch 1 message at a time
-        self._channel.basic_qos(prefetch_count=1)
+            # Keep several deliveries in flight so the channel never idles for a
+            # round-trip between messages; the limit applies per consumer
+            await channel.set_qos(prefetch_count=self.prefetch_count)
 
-        # Start consuming
-        logger.info("Waiting for messages on queue %s...", self.queue_name)
-        self._channel.basic_consume(
-            queue=self.queue_name,
-            on_message_callback=self._on_message,
-            auto_ack=False,  # Manual ack after processing
-        )
+            queue = await _declare_topology(channel, self.rabbitmq_host, self.queue_name, self.ROUTING_KEYS)
 
-        try:
-            self._channel.start_consuming()
-        except KeyboardInterrupt:
-            logger.info("Consumer stopped by user")
-            self.stop()
+            # Start consuming; manual ack after processing
+            logger.info("Waiting for messages on queue %s...", self.queue_name)
+            await queue.consume(self._on_message)
+            await asyncio.Future()  # Run until cancelled
+        finally:
+            await self.stop()
 
-    def _on_message(
-        self,
-        channel: BlockingChannel,
-        method: pika.spec.Basic.Deliver,
-        properties: pika.spec.BasicProperties,
-        body: bytes,
-    ) -> None:
+    async def _on_message(self, message: AbstractIncomingMessage) -> None:
         """Handle incoming message from RabbitMQ.
 
+        Queues an ack when the handler returns. If the handler raises, the message
+        is rejected for a delayed retry, or parked once it has used up its attempts.
+        A message that is not a JSON event never succeeds and is parked right away.
+
         Args:
-            channel: RabbitMQ channel
-            method: Delivery method
-            properties: Message properties
-            body: Message body (JSON bytes)
+            message: Delivered message (JSON body)
 
         """
+        self._acks.track(message)
         try:
             # Parse event
-            event_data = json.loads(body.decode("utf-8"))
+            event_data = json.loads(message.body)
             event_type = event_data["event_type"]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error("Unparseable message on %s, parking it: %s", self.queue_name, e)
+            await self._park(message)
+            return
 
-            logger.info("Received event: %s", event_type)
+        logger.debug("Received event on %s: %s", self.queue_name, event_type)
 
-            # Run async handler in a thread pool to avoid event loop conflicts
-            def run_async_handler():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    # Route to appropriate handler
-                    if event_type == "DocumentFragmentReceived":
-                        loop.run_until_complete(self._handle_document_fragment(event_data))
-
-                    elif event_type == "ExtractedContentCreated":
-                        loop.run_until_complete(self._handle_extracted_content(event_data))
-
-                    elif event_type == "LibraryConfigAdded":
-                        loop.run_until_complete(self._handle_library_config_added(event_data))
-
-                    elif event_type == "LibraryConfigRemoved":
-                        loop.run_until_complete(self._handle_library_config_removed(event_data))
-
-                    elif event_type == "VectorizationConfigUpdated":
-                        loop.run_until_complete(self._handle_vectorization_config_updated(event_data))
-
-                    elif event_type == "DocumentVectorizationPending":
-                        loop.run_until_complete(self._handle_document_vectorization_pending(event_data))
+        try:
+            await self._dispatch(event_type, event_data)
+        except Exception as e:
+            attempts = _failed_attempts(message, self.queue_name) + 1
+            if attempts >= _MAX_DELIVERY_ATTEMPTS:
+                logger.error(
+                    "Error processing %s on %s, parking it after %s attempts: %s",
+                    event_type,
+                    self.queue_name,
+                    attempts,
+                    e,
+                )
+                await self._park(message)
+            else:
+                logger.error("Error processing %s on %s (attempt %s): %s", event_type, self.queue_name, attempts, e)
+                # Reject without requeue: the broker dead-letters it to the retry queue
+                await self._acks.reject(message)
+            return
+
+        # Acknowledge message (removes from queue) with the next batch
+        self._acks.complete(message)
+
+    async def _park(self, message: AbstractIncomingMessage) -> None:
+        """Move a message to this queue's ``.dlq`` queue and ack the original."""
+        if self._channel is None:
+            msg = "Consumer channel is not open"
+            raise RuntimeError(msg)
+        try:
+            # Publisher confirms: returns once the broker has taken the copy
+            await self._channel.default_exchange.publish(
+                aio_pika.Message(
+                    message.body,
+                    headers=message.headers,
+                    content_type=message.content_type,
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                ),
+                routing_key=f"{self.queue_name}.dlq",
+            )
+        except Exception:
+            logger.exception("Failed to park message on %s, retrying it instead", self.queue_name)
+            await self._acks.reject(message)
+            return
+        self._acks.complete(message)
+
+    @abstractmethod
+    async def _dispatch(self, event_type: str, event_data: dict[str, Any]) -> None:
+        """Route an event to its handler."""
+
+    async def _on_start(self) -> None:  # noqa: B027
+        """Start per-consumer background work before consuming."""
+
+    async def _on_stop(self) -> None:  # noqa: B027
+        """Stop per-consumer background work after consuming has stopped."""
+
+    async def stop(self) -> None:
+        """Ack handled deliveries, then close the channel (or own connection)."""
+        await self._acks.flush()
+        if self._connection is not None:
+            # Closing the connection also closes the channel and cancels the consumer
+            await self._connection.close()
+            self._connection = None
+        elif self._channel is not None and not self._channel.is_closed:
+            await self._channel.close()
+        self._channel = None
+        await self._on_stop()
+        logger.info("%s stopped", type(self).__name__)
+
+
+async def run_consumers(consumers: Sequence[_TemporalConsumer], rabbitmq_host: str, rabbitmq_port: int) -> None:
+    """Run several consumers over one AMQP connection, each on its own channel.
+
+    Co-located consumers share a TCP connection and heartbeat instead of opening
+    one each.
+    """
+    connection = await _connect(rabbitmq_host, rabbitmq_port)
+    try:
+        await asyncio.gather(*(consumer.run(connection) for consumer in consumers))
+    finally:
+        await connection.close()
 
-                    elif event_type == "DocumentCreated":
-                        loop.run_until_complete(self._handle_document_created(event_data))
 
-                    else:
-                        logger.warning("Unknown event type: %s", event_type)
-                finally:
-                    loop.close()
+class TemporalIngestionConsumer(_TemporalConsumer):
+    """Consumes workflow-triggering events from RabbitMQ and triggers Temporal workflows.
 
-            # Execute in thread pool
-            future = self._executor.submit(run_async_handler)
-            future.result()  # Wait for completion
+    This service bridges RabbitMQ and Temporal:
+    1. Subscribes to workflow_events queue
+    2. Receives domain events (DocumentCreated, LibraryConfigAdded, etc.)
+    3. Triggers appropriate Temporal workflows (IngestDocument, ProcessConfig, etc.)
+    4. Acknowledges message after workflow starts
 
-            # Acknowledge message (removes from queue)
-            channel.basic_ack(delivery_tag=method.delivery_tag)
-            logger.debug("Acknowledged message %s", method.delivery_tag)
+    Each consumer runs in its own process/pod and can be scaled independently.
+    """
 
-        except Exception as e:
-            logger.error("Error processing message: %s", e)
+    DEFAULT_PREFETCH_COUNT = 50
+    # Workflow starts are issued in micro-batches of up to this many, collected for at most the wait
+    _START_BATCH_SIZE = 32
+    _START_BATCH_WAIT_SECONDS = 0.02
+    ROUTING_KEYS = (
+        "document.*",  # Match all document events
+        "library.config.*",  # Match library config events
+        "vectorization.*",  # Match vectorization events
+        "content.*",  # Match extracted content events
+    )
 
-            # Reject and requeue message for retry
-            channel.basic_nack(
-                delivery_tag=method.delivery_tag,
-                requeue=True,  # Put back in queue for retry
-            )
+    def __init__(
+        self,
+        rabbitmq_host: str,
+        rabbitmq_port: int,
+        queue_name: str,
+        temporal_client: Client,
+        task_queue: str,
+        prefetch_count: int | None = None,
+    ) -> None:
+        super().__init__(rabbitmq_host, rabbitmq_port, queue_name, temporal_client, task_queue, prefetch_count)
+        self._start_queue: asyncio.Queue[_PendingStart] | None = None
+        self._submit_task: asyncio.Task[None] | None = None
+
+    async def _on_start(self) -> None:
+        self._start_queue = asyncio.Queue()
+        self._submit_task = asyncio.create_task(self._submit_worker())
+
+    async def _on_stop(self) -> None:
+        if self._submit_task is not None:
+            self._submit_task.cancel()
+            self._submit_task = None
+
+    async def _dispatch(self, event_type: str, event_data: dict[str, Any]) -> None:
+        """Route an event to its handler (see ``_HANDLERS``)."""
+        handler = self._HANDLERS.get(event_type)
+        if handler is None:
+            logger.warning("Unknown event type: %s", event_type)
+            return
+        await handler(self, event_data)
 
     async def _handle_document_fragment(self, event_data: dict[str, Any]) -> None:
         """Handle DocumentFragmentReceived event.
@@ -294,7 +532,7 @@ class TemporalIngestionConsumer:
         if isinstance(library_id, dict):
             library_id = library_id.get("value", library_id)
 
-        logger.info(
+        logger.debug(
             "Triggering ProcessConfigWorkflow for document %s with config %s",
             document_id,
             config_id,
@@ -302,13 +540,13 @@ class TemporalIngestionConsumer:
 
         try:
             # Start Temporal workflow for this document+config pair
-            workflow_id = f"process-config-{document_id}-{config_id}"
+            workflow_id = _wid("process-config", document_id, config_id)
 
             # Note: We need to fetch extracted_content_ids for this document
             # For now, we'll pass an empty list and the workflow will query them
             # TODO: Include extracted_content_ids in the event to avoid extra DB query
 
-            handle = await self.temporal_client.start_workflow(
+            handle = await self._start_workflow(
                 ProcessConfigWorkflow.run,
                 ProcessConfigWorkflowInput(
                     library_id=str(library_id),
@@ -316,8 +554,7 @@ class TemporalIngestionConsumer:
                     config_id=str(config_id),
                     extracted_content_ids=[],  # Workflow will query
                 ),
-                id=workflow_id,
-                task_queue=self.task_queue,
+                workflow_id,
             )
 
             logger.info("Started vectorization workflow %s, run_id=%s", workflow_id, handle.id)
@@ -395,19 +632,18 @@ class TemporalIngestionConsumer:
         if isinstance(library_id, dict):
             library_id = library_id.get("value", library_id)
 
-        logger.info("Triggering IngestDocumentWorkflow for document %s", document_id)
+        logger.debug("Triggering IngestDocumentWorkflow for document %s", document_id)
 
         try:
-            workflow_id = f"ingest-{document_id}"
+            workflow_id = _wid("ingest", document_id)
 
-            handle = await self.temporal_client.start_workflow(
+            handle = await self._start_workflow(
                 IngestDocumentWorkflow.run,
                 IngestDocumentWorkflowInput(
                     document_id=str(document_id),
                     library_id=str(library_id),
                 ),
-                id=workflow_id,
-                task_queue=self.task_queue,
+                workflow_id,
             )
 
             logger.info("Started ingestion workflow %s, run_id=%s", workflow_id, handle.id)
@@ -416,128 +652,98 @@ class TemporalIngestionConsumer:
             logger.exception("Failed to start ingestion workflow for document %s: %s", document_id, e)
             raise  # Re-raise to trigger message requeue
 
-    def stop(self) -> None:
-        """Stop consuming and close connection."""
-        if self._channel:
-            self._channel.stop_consuming()
-        if self._connection:
-            self._connection.close()
-        logger.info("Consumer stopped")
+    # Event type -> handler, looked up once per message
+    _HANDLERS: ClassVar[dict[str, Callable[[Self, dict[str, Any]], Awaitable[None]]]] = {
+        "DocumentFragmentReceived": _handle_document_fragment,
+        "ExtractedContentCreated": _handle_extracted_content,
+        "LibraryConfigAdded": _handle_library_config_added,
+        "LibraryConfigRemoved": _handle_library_config_removed,
+        "VectorizationConfigUpdated": _handle_vectorization_config_updated,
+        "DocumentVectorizationPending": _handle_document_vectorization_pending,
+        "DocumentCreated": _handle_document_created,
+    }
+
+    async def _start_workflow(
+        self, workflow: Callable[..., Any], arg: Any, workflow_id: str
+    ) -> WorkflowHandle[Any, Any]:
+        """Queue a workflow start for the next micro-batch and wait for its handle.
+
+        Raises whatever ``start_workflow`` raised for this workflow, so the caller's
+        message is still nacked on failure. Workflow ids are deterministic per document
+        (and config), so an id whose run is still open (a redelivery or retry storm)
+        returns a handle to that run; once the run has finished, Temporal starts a new one.
+        """
+        if self._start_queue is None:
+            msg = "Submit worker not started"
+            raise RuntimeError(msg)
+        result: asyncio.Future[WorkflowHandle[Any, Any]] = asyncio.get_running_loop().create_future()
+        await self._start_queue.put((workflow, arg, workflow_id, result))
+        try:
+            return await result
+        except WorkflowAlreadyStartedError:
+            logger.debug("Workflow %s already running; skipping duplicate start", workflow_id)
+            return self.temporal_client.get_workflow_handle(workflow_id)
+
+    async def _submit_worker(self) -> None:
+        """Drain queued workflow starts in micro-batches and issue each batch concurrently."""
+        if self._start_queue is None:
+            msg = "Submit worker not started"
+            raise RuntimeError(msg)
+        queue = self._start_queue
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self._START_BATCH_WAIT_SECONDS
+            while len(batch) < self._START_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+
+            results = await asyncio.gather(
+                *(
+                    self.temporal_client.start_workflow(workflow, arg, id=workflow_id, task_queue=self.task_queue)
+                    for workflow, arg, workflow_id, _ in batch
+                ),
+                return_exceptions=True,
+            )
+            # Hand each outcome back to the handler waiting on it
+            for (_, _, _, result), outcome in zip(batch, results, strict=True):
+                if result.done():
+                    continue
+                if isinstance(outcome, BaseException):
+                    result.set_exception(outcome)
+                else:
+                    result.set_result(outcome)
 
 
-class TemporalSearchConsumer:
+class TemporalSearchConsumer(_TemporalConsumer):
     """Consumes search query events and triggers Temporal search workflows.
 
     Separate consumer for search operations, allowing independent scaling
     from ingestion workloads.
     """
 
-    def __init__(
-        self,
-        rabbitmq_host: str,
-        rabbitmq_port: int,
-        queue_name: str,
-        temporal_client: Client,
-        task_queue: str,
-    ) -> None:
-        self.rabbitmq_host = rabbitmq_host
-        self.rabbitmq_port = rabbitmq_port
-        self.queue_name = queue_name
-        self.temporal_client = temporal_client
-        self.task_queue = task_queue
-
-        self._connection: pika.BlockingConnection | None = None
-        self._channel: BlockingChannel | None = None
-        self._executor = ThreadPoolExecutor(max_workers=10)
+    DEFAULT_PREFETCH_COUNT = 100
+    ROUTING_KEYS = ("search.*",)
 
-    def start(self) -> None:
-        """Start consuming search query messages."""
-        logger.info("Starting TemporalSearchConsumer for queue %s", self.queue_name)
-
-        connection_params = pika.ConnectionParameters(
-            host=self.rabbitmq_host,
-            port=self.rabbitmq_port,
-            credentials=pika.PlainCredentials("guest", "guest"),
-            heartbeat=600,
-        )
-
-        self._connection = pika.BlockingConnection(connection_params)
-        self._channel = self._connection.channel()
-
-        # Declare exchange (idempotent - ensures it exists)
-        self._channel.exchange_declare(
-            exchange="vdb.events",
-            exchange_type="topic",
-            durable=True,
-        )
-
-        # Declare queue
-        self._channel.queue_declare(queue=self.queue_name, durable=True)
-
-        # Bind to search events
-        self._channel.queue_bind(
-            exchange="vdb.events",
-            queue=self.queue_name,
-            routing_key="search.*",
-        )
-
-        self._channel.basic_qos(prefetch_count=1)
-
-        logger.info("Waiting for search queries on %s...", self.queue_name)
-        self._channel.basic_consume(
-            queue=self.queue_name,
-            on_message_callback=self._on_message,
-            auto_ack=False,
-        )
-
-        try:
-            self._channel.start_consuming()
-        except KeyboardInterrupt:
-            logger.info("Search consumer stopped by user")
-            self.stop()
-
-    def _on_message(
-        self,
-        channel: BlockingChannel,
-        method: pika.spec.Basic.Deliver,
-        properties: pika.spec.BasicProperties,
-        body: bytes,
-    ) -> None:
-        """Handle search query message."""
-        try:
-            event_data = json.loads(body.decode("utf-8"))
-            event_type = event_data["event_type"]
-
-            logger.info("Received search event: %s", event_type)
-
-            # Run async handler in a thread pool to avoid event loop conflicts
-            def run_async_handler():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    if event_type == "SearchQueryCreated":
-                        loop.run_until_complete(self._handle_search_query(event_data))
-                finally:
-                    loop.close()
-
-            # Execute in thread pool
-            future = self._executor.submit(run_async_handler)
-            future.result()  # Wait for completion
-
-            channel.basic_ack(delivery_tag=method.delivery_tag)
-
-        except Exception as e:
-            logger.error("Error processing search query: %s", e)
-            channel.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+    async def _dispatch(self, event_type: str, event_data: dict[str, Any]) -> None:
+        """Route a search event to its handler."""
+        if event_type == "SearchQueryCreated":
+            await self._handle_search_query(event_data)
 
     async def _handle_search_query(self, event_data: dict[str, Any]) -> None:
         """Trigger SearchWorkflow in Temporal."""
         data = event_data["data"]
         query_id = data["query_id"]
 
-        logger.info("Triggering search workflow for query %s", query_id)
+        logger.debug("Triggering search workflow for query %s", query_id)
 
-        workflow_id = f"search-{query_id}"
+        workflow_id = _wid("search", query_id)
 
         # Get library_id from event data
         library_id = data.get("library_id")
@@ -558,14 +764,6 @@ class TemporalSearchConsumer:
 
         logger.info("Started search workflow %s, run_id=%s", workflow_id, handle.id)
 
-    def stop(self) -> None:
-        """Stop consuming and close connection."""
-        if self._channel:
-            self._channel.stop_consuming()
-        if self._connection:
-            self._connection.close()
-        logger.info("Search consumer stopped")
-
 
 async def main() -> None:
     """Start both ingestion and search consumers (or run separately)."""
@@ -575,41 +773,56 @@ async def main() -> None:
     temporal_host = os.getenv("TEMPORAL_HOST", "localhost")
     temporal_port = os.getenv("TEMPORAL_PORT", "7233")
     temporal_namespace = os.getenv("TEMPORAL_NAMESPACE", "default")
+    # Optional override of the per-consumer prefetch (defaults differ by consumer type)
+    prefetch_override = os.getenv("RABBITMQ_PREFETCH")
+    prefetch_count = int(prefetch_override) if prefetch_override else None
 
-    # Connect to Temporal
+    # Connect to Temporal. One client (one HTTP/2 connection) is shared by every consumer
+    # below; all concurrent start_workflow calls multiplex over it as separate streams.
+    # Keepalive pings keep that connection from being dropped as idle between bursts.
     temporal_address = f"{temporal_host}:{temporal_port}"
     temporal_client = await Client.connect(
         temporal_address,
         namespace=temporal_namespace,
+        tls=False,
+        keep_alive_config=KeepAliveConfig(interval_millis=30_000, timeout_millis=15_000),
     )
 
     logger.info("Connected to Temporal at %s", temporal_address)
 
-    # Determine which consumer to run
+    # Determine which consumer(s) to run: "ingestion", "search", or "all" (both on one loop)
     consumer_type = os.getenv("CONSUMER_TYPE", "ingestion")
 
-    if consumer_type == "ingestion":
-        consumer = TemporalIngestionConsumer(
-            rabbitmq_host=rabbitmq_host,
-            rabbitmq_port=rabbitmq_port,
-            queue_name="workflow_events",
-            temporal_client=temporal_client,
-            task_queue="vdb-tasks",
+    consumers: list[_TemporalConsumer] = []
+    if consumer_type in {"ingestion", "all"}:
+        consumers.append(
+            TemporalIngestionConsumer(
+                rabbitmq_host=rabbitmq_host,
+                rabbitmq_port=rabbitmq_port,
+                queue_name="workflow_events",
+                temporal_client=temporal_client,
+                task_queue="vdb-tasks",
+                prefetch_count=prefetch_count,
+            )
         )
-        consumer.start()
-
-    elif consumer_type == "search":
-        consumer = TemporalSearchConsumer(
-            rabbitmq_host=rabbitmq_host,
-            rabbitmq_port=rabbitmq_port,
-            queue_name="search_query_events",
-            temporal_client=temporal_client,
-            task_queue="vdb-search-tasks",
+    if consumer_type in {"search", "all"}:
+        consumers.append(
+            TemporalSearchConsumer(
+                rabbitmq_host=rabbitmq_host,
+                rabbitmq_port=rabbitmq_port,
+                queue_name="search_query_events",
+                temporal_client=temporal_client,
+                task_queue="vdb-search-tasks",
+                prefetch_count=prefetch_count,
+            )
         )
-        consumer.start()
 
-    else:
+    if not consumers:
         logger.error("Unknown consumer type: %s", consumer_type)
+        return
+
+    # One AMQP connection for the process; each consumer gets its own channel
+    await run_consumers(consumers, rabbitmq_host, rabbitmq_port)
 
 
 if __name__ == "__main__":
@@ -617,4 +830,5 @@ if __name__ == "__main__":
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
-    asyncio.run(main())
+    # libuv-based loop: cheaper task scheduling for many concurrent workflow starts
+    uvloop.run(main())
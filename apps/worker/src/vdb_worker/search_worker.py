@@ -10,11 +10,12 @@ The worker connects to Temporal and polls for tasks on the 'vdb-search-tasks' qu
 This separation allows search to scale independently from ingestion/processing workflows.
 """
 
-import asyncio
 import logging
 import os
 
+import uvloop
 from temporalio.client import Client
+from temporalio.service import KeepAliveConfig
 from temporalio.worker import Worker
 from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner, SandboxRestrictions
 from vdb_core.infrastructure import (
@@ -61,14 +62,20 @@ async def main() -> None:
     temporal_port = os.getenv("TEMPORAL_PORT", "7233")
     temporal_namespace = os.getenv("TEMPORAL_NAMESPACE", "default")
     task_queue = os.getenv("WORKER_TASK_QUEUE", "vdb-search-tasks")
+    # Search activities mix I/O with numerical work, so scale slots with cores
+    concurrency = int(os.getenv("SEARCH_WORKER_CONCURRENCY", str(min(64, (os.cpu_count() or 4) * 4))))
+    poll_concurrency = max(2, concurrency // 8)
 
     # Connect to Temporal server
     temporal_address = f"{temporal_host}:{temporal_port}"
     logger.info("Connecting to Temporal server at %s", temporal_address)
 
+    # Keepalive pings keep the multiplexed HTTP/2 connection alive between search bursts
     client = await Client.connect(
         temporal_address,
         namespace=temporal_namespace,
+        tls=False,
+        keep_alive_config=KeepAliveConfig(interval_millis=30_000, timeout_millis=15_000),
     )
 
     logger.info("Connected to Temporal namespace: %s", temporal_namespace)
@@ -90,15 +97,10 @@ async def main() -> None:
     logger.info("=" * 80)
     logger.info("")
 
-    # Configure sandbox with passthrough for vdb_core modules
+    # Configure sandbox with passthrough for vdb_core modules; a passthrough module
+    # covers all of its submodules, so the package root is enough
     workflow_runner = SandboxedWorkflowRunner(
-        restrictions=SandboxRestrictions.default.with_passthrough_modules(
-            "vdb_core",
-            "vdb_core.domain",
-            "vdb_core.domain.value_objects",
-            "vdb_core.infrastructure",
-            "vdb_core.infrastructure.workflows",
-        )
+        restrictions=SandboxRestrictions.default.with_passthrough_modules("vdb_core")
     )
 
     # Create worker with search workflow and activities only
@@ -115,12 +117,19 @@ async def main() -> None:
             update_query_status_activity,
         ],
         workflow_runner=workflow_runner,
-        max_concurrent_activities=20,  # Search is lightweight, allow more concurrency
-        max_concurrent_workflow_tasks=20,
+        max_concurrent_activities=concurrency,
+        max_concurrent_workflow_tasks=concurrency,
+        max_concurrent_activity_task_polls=poll_concurrency,
+        max_concurrent_workflow_task_polls=poll_concurrency,
     )
 
     logger.info("✅ Search worker started successfully")
-    logger.info("Concurrency limits: max 20 parallel activities, max 20 parallel workflows")
+    logger.info(
+        "Concurrency limits: max %s parallel activities, max %s parallel workflows, %s pollers each",
+        concurrency,
+        concurrency,
+        poll_concurrency,
+    )
     logger.info("Waiting for search tasks...")
     logger.info("")
 
@@ -129,4 +138,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-based loop: cheaper task scheduling for concurrent activities and polls
+    uvloop.run(main())
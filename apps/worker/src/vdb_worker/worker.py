@@ -14,6 +14,7 @@ import asyncio
 import logging
 import os
 
+import uvloop
 from temporalio.client import Client
 from temporalio.worker import Worker
 from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner, SandboxRestrictions
@@ -70,49 +71,62 @@ async def main() -> None:
     temporal_port = os.getenv("TEMPORAL_PORT", "7233")
     temporal_namespace = os.getenv("TEMPORAL_NAMESPACE", "default")
     task_queue = os.getenv("WORKER_TASK_QUEUE", "vdb-tasks")
+    # Activities mostly await I/O (DB, search service, embedding APIs), so many can be in
+    # flight; workflow tasks are short sandboxed replays and get a separate, lower limit
+    max_activities = int(os.getenv("WORKER_MAX_CONCURRENT_ACTIVITIES", "100"))
+    max_workflow_tasks = int(os.getenv("WORKER_MAX_CONCURRENT_WORKFLOWS", "20"))
 
     # Connect to Temporal server
     temporal_address = f"{temporal_host}:{temporal_port}"
     logger.info("Connecting to Temporal server at %s", temporal_address)
 
-    client = await Client.connect(
-        temporal_address,
-        namespace=temporal_namespace,
+    # Open DB / message bus connections now so the first activity doesn't pay for them;
+    # independent of the Temporal connection, so both handshakes run at once
+    client, _ = await asyncio.gather(
+        Client.connect(
+            temporal_address,
+            namespace=temporal_namespace,
+        ),
+        container.warmup(),
     )
 
     logger.info("Connected to Temporal namespace: %s", temporal_namespace)
     logger.info("Task queue: %s", task_queue)
 
-    # Register workflows and activities
-    logger.info("")
-    logger.info("=" * 80)
-    logger.info("TEMPORAL WORKFLOWS & ACTIVITIES")
-    logger.info("=" * 80)
-    logger.info("")
-    logger.info("Registered Workflows:")
-    logger.info("  - IngestDocumentWorkflow")
-    logger.info("      → Parses document fragments and triggers vectorization")
-    logger.info("  - ProcessConfigWorkflow")
-    logger.info("      → Chunks content, generates embeddings, indexes vectors")
-    logger.info("")
-    logger.info("Registered Activities:")
-    logger.info("  Ingestion: parse_all_fragments, get_library_configs, mark_document_completed")
-    logger.info("  Processing: load_extracted_content, chunk_content, generate_embeddings, index_vectors, mark_config_processing_completed")
-    logger.info("")
-    logger.info("Note: SearchWorkflow runs on dedicated search-worker (task queue: vdb-search-tasks)")
-    logger.info("")
-    logger.info("=" * 80)
-    logger.info("")
+    # Registered workflows and activities, emitted as one record so handlers lock,
+    # format and flush once rather than per line
+    banner = "\n".join(
+        [
+            "",
+            "=" * 80,
+            "TEMPORAL WORKFLOWS & ACTIVITIES",
+            "=" * 80,
+            "",
+            "Registered Workflows:",
+            "  - IngestDocumentWorkflow",
+            "      → Parses document fragments and triggers vectorization",
+            "  - ProcessConfigWorkflow",
+            "      → Chunks content, generates embeddings, indexes vectors",
+            "",
+            "Registered Activities:",
+            "  Ingestion: parse_all_fragments, get_library_configs, mark_document_completed",
+            (
+                "  Processing: load_extracted_content, chunk_content, generate_embeddings, index_vectors, "
+                "mark_config_processing_completed"
+            ),
+            "",
+            "Note: SearchWorkflow runs on dedicated search-worker (task queue: vdb-search-tasks)",
+            "",
+            "=" * 80,
+            "",
+        ]
+    )
+    logger.info("%s", banner)
 
-    # Configure sandbox with passthrough for vdb_core modules
+    # Configure sandbox with passthrough for vdb_core modules; a passthrough module
+    # covers all of its submodules, so the package root is enough
     workflow_runner = SandboxedWorkflowRunner(
-        restrictions=SandboxRestrictions.default.with_passthrough_modules(
-            "vdb_core",
-            "vdb_core.domain",
-            "vdb_core.domain.value_objects",
-            "vdb_core.infrastructure",
-            "vdb_core.infrastructure.workflows",
-        )
+        restrictions=SandboxRestrictions.default.with_passthrough_modules("vdb_core")
     )
 
     # Create worker with ingestion and processing workflows only
@@ -136,12 +150,16 @@ async def main() -> None:
             mark_config_processing_completed_activity,
         ],
         workflow_runner=workflow_runner,
-        max_concurrent_activities=10,  # Limit parallel activity execution
-        max_concurrent_workflow_tasks=10,   # Limit parallel workflow task execution
+        max_concurrent_activities=max_activities,  # Limit parallel activity execution
+        max_concurrent_workflow_tasks=max_workflow_tasks,  # Limit parallel workflow task execution
     )
 
     logger.info("✅ VectorDB worker started successfully")
-    logger.info("Concurrency limits: max 10 parallel activities, max 10 parallel workflows")
+    logger.info(
+        "Concurrency limits: max %s parallel activities, max %s parallel workflows",
+        max_activities,
+        max_workflow_tasks,
+    )
     logger.info("Waiting for tasks...")
     logger.info("")
 
@@ -150,4 +168,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-based loop: cheaper callbacks for activity dispatch and DB round-trips
+    uvloop.run(main())
@@ -0,0 +1,52 @@
+"""Tests for the RabbitMQ → Temporal consumer."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from vdb_worker.rabbitmq_consumer import _AckBatcher
+
+
+def _message(delivery_tag: int) -> MagicMock:
+    message = MagicMock(delivery_tag=delivery_tag)
+    message.ack = AsyncMock()
+    message.nack = AsyncMock()
+    return message
+
+
+class TestAckBatcher:
+    """Test suite for _AckBatcher."""
+
+    async def test_acks_completed_prefix_with_one_multiple_ack(self) -> None:
+        """Test that a flush acks the highest tag of the completed prefix only."""
+        acks = _AckBatcher(batch_size=10)
+        first, second, third = _message(1), _message(2), _message(3)
+        for message in (first, second, third):
+            acks.track(message)
+
+        acks.complete(first)
+        acks.complete(third)
+        await acks.flush()
+
+        first.ack.assert_awaited_once_with(multiple=True)
+        second.ack.assert_not_awaited()
+        third.ack.assert_not_awaited()
+
+    async def test_rejected_head_unblocks_completed_deliveries(self) -> None:
+        """Test that rejecting the head acks the completed deliveries behind it without another completion."""
+        acks = _AckBatcher(batch_size=10, flush_interval=0.01)
+        head, second, third = _message(1), _message(2), _message(3)
+        for message in (head, second, third):
+            acks.track(message)
+
+        acks.complete(second)
+        acks.complete(third)
+        # The flush timer fires while the head is still running, and acks nothing
+        await asyncio.sleep(0.05)
+        third.ack.assert_not_awaited()
+
+        await acks.reject(head)
+        await asyncio.sleep(0)
+
+        head.nack.assert_awaited_once_with(requeue=False)
+        third.ack.assert_awaited_once_with(multiple=True)
+        second.ack.assert_not_awaited()
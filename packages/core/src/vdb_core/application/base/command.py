@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, TypeVar
 
@@ -66,7 +67,11 @@ class Command[TInput, TOutput](ABC):
         2. Opens a transaction
         3. Calls _execute() (implemented by subclasses)
         4. Commits the transaction
-        5. Publishes collected domain events
+        5. Publishes collected domain events (skipped when there are none)
+
+        Publishing starts as soon as the commit succeeds, so it overlaps closing the
+        UoW's session; it is awaited before returning, so callers still observe
+        published events and publish errors.
 
         Args:
             input_data: Typed input data for the command
@@ -80,11 +85,17 @@ class Command[TInput, TOutput](ABC):
 
         """
         uow = self.uow_factory()
-        async with uow:
-            result = await self._execute(input_data, uow)
-            events = await uow.commit()
-
-        await self.message_bus.handle_events(events)
+        publish: asyncio.Task[None] | None = None
+        try:
+            async with uow:
+                result = await self._execute(input_data, uow)
+                events = await uow.commit()
+                if events:
+                    publish = asyncio.create_task(self.message_bus.handle_events(events))
+        finally:
+            # Committed events are published even if tearing down the UoW fails
+            if publish is not None:
+                await publish
 
         return result
 
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from vdb_core.application.read_model_cache import ReadModelCache
     from vdb_core.application.read_repository_provider import ReadRepositoryProvider
 
 
@@ -40,14 +41,20 @@ class Query[TInput, TOutput](ABC):
 
     """
 
-    def __init__(self, read_repo_provider_factory: Callable[[], ReadRepositoryProvider]) -> None:
+    def __init__(
+        self,
+        read_repo_provider_factory: Callable[[], ReadRepositoryProvider],
+        cache: ReadModelCache | None = None,
+    ) -> None:
         """Initialize query with dependencies.
 
         Args:
             read_repo_provider_factory: Factory function that creates ReadRepositoryProvider instances
+            cache: Optional read-through cache for results, keyed by the (frozen) query input
 
         """
         self.read_repo_provider_factory = read_repo_provider_factory
+        self.cache = cache
 
     async def execute(self, input_data: TInput) -> TOutput:
         """Execute the query with typed input.
@@ -58,6 +65,9 @@ class Query[TInput, TOutput](ABC):
         3. Calls _execute() (implemented by subclasses)
         4. Returns the result
 
+        With a cache, a hit skips all of the above; results are cached per input and
+        per library (the input's `library_id`, if any) for invalidation.
+
         Args:
             input_data: Typed input data for the query
 
@@ -68,6 +78,16 @@ class Query[TInput, TOutput](ABC):
             Exception: If query execution fails
 
         """
+        if self.cache is not None:
+            return await self.cache.get_or_load(
+                input_data,
+                lambda: self._run(input_data),
+                library_id=getattr(input_data, "library_id", None),
+            )
+        return await self._run(input_data)
+
+    async def _run(self, input_data: TInput) -> TOutput:
+        """Run the query against a fresh read repository provider."""
         read_repo_provider = self.read_repo_provider_factory()
         async with read_repo_provider:
             result = await self._execute(input_data, read_repo_provider)
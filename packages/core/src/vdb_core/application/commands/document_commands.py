@@ -6,6 +6,7 @@ Each command encapsulates the business logic for a specific write operation.
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -23,12 +24,32 @@ from vdb_core.domain.value_objects import (
     DocumentId,
     DocumentName,
 )
+from vdb_core.utils import parse_uuid
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
     from vdb_core.application.i_unit_of_work import IUnitOfWork
 
+# Fragments smaller than this are hashed inline: cheaper than a hand-off to a thread
+_INLINE_HASH_MAX_BYTES = 64 * 1024
+
+
+def _as_uuid(value: UUID | str) -> UUID:
+    """Return ``value`` as a UUID, parsing it only if it is still a string."""
+    return value if isinstance(value, UUID) else parse_uuid(value)
+
+
+async def _hash_content(content: bytes) -> ContentHash:
+    """Hash fragment content, in a worker thread when it is large.
+
+    Fragments can be up to MAX_FRAGMENT_SIZE_BYTES; hashing one inline would stall the
+    event loop. hashlib releases the GIL while hashing large buffers.
+    """
+    if len(content) <= _INLINE_HASH_MAX_BYTES:
+        return ContentHash.from_bytes(content)
+    return await asyncio.to_thread(ContentHash.from_bytes, content)
+
 
 class CreateDocumentCommand(Command[CreateDocumentInput, DocumentId]):
     """Command to create a new document.
@@ -57,7 +78,7 @@ class CreateDocumentCommand(Command[CreateDocumentInput, DocumentId]):
         """
         from vdb_core.domain.exceptions import EntityNotFoundError, LibraryNotFoundError
 
-        library_id_vo = UUID(input_data.library_id)
+        library_id_vo = parse_uuid(input_data.library_id)
 
         try:
             library = await uow.libraries.get(library_id_vo)
@@ -91,7 +112,7 @@ class UpdateDocumentCommand(Command[UpdateDocumentInput, DocumentId]):
             The updated document's ID
 
         """
-        document_id_vo = UUID(input_data.document_id)
+        document_id_vo = parse_uuid(input_data.document_id)
 
         # Load library (aggregate root)
         library = await uow.libraries.get_by_document_id(document_id_vo)
@@ -122,10 +143,11 @@ class DeleteDocumentCommand(Command[DeleteDocumentInput, None]):
             uow: Active Unit of Work (within transaction)
 
         """
-        document_id_vo = UUID(input_data.document_id)
+        document_id_vo = parse_uuid(input_data.document_id)
         library = await uow.libraries.get_by_document_id(document_id_vo)
         await library.remove_document(document_id_vo)
 
+
 class CreateDocumentFragmentCommand(Command[CreateDocumentFragmentInput, str]):
     """Command to create a document fragment during streaming upload.
 
@@ -159,21 +181,21 @@ class CreateDocumentFragmentCommand(Command[CreateDocumentFragmentInput, str]):
         """
         from vdb_core.domain.exceptions import LibraryNotFoundError
 
-        library_id_vo = UUID(input_data.library_id)
-        document_id_vo = UUID(input_data.document_id)
+        library_id_vo = _as_uuid(input_data.library_id)
+        document_id_vo = _as_uuid(input_data.document_id)
 
         # Load library (aggregate root)
         library = await uow.libraries.get(library_id_vo)
 
         if library is None:
-            raise LibraryNotFoundError(input_data.library_id)
+            raise LibraryNotFoundError(str(input_data.library_id))
 
         # Add fragment through aggregate root (propagates events to library)
         fragment = await library.add_document_fragment(
             document_id=document_id_vo,
             sequence_number=input_data.sequence_number,
             content=input_data.content,
-            content_hash=ContentHash.from_bytes(input_data.content),
+            content_hash=await _hash_content(input_data.content),
             is_final=input_data.is_final,
         )
 
@@ -222,6 +244,11 @@ class UploadDocumentCommand:
 
     """
 
+    # Non-final fragments being written while the next batch is read from the stream. Each is up to
+    # MAX_FRAGMENT_SIZE_BYTES (100 MB), held next to the pending batch and the partial buffer, so one
+    # write overlapping the next read keeps an upload at ~300 MB
+    MAX_FRAGMENTS_IN_FLIGHT = 1
+
     def __init__(
         self,
         create_document_command: CreateDocumentCommand,
@@ -255,20 +282,36 @@ class UploadDocumentCommand:
             Output: [1MB, 600KB]  # First two chunks batched, rest yielded as-is
 
         """
+        # Bound once: read for every chunk and every fragment split below
+        frag_size = MAX_FRAGMENT_SIZE_BYTES
         buffer = bytearray()
+        # First chunk of a fragment, held as-is: if nothing follows it (the common
+        # single-chunk upload) it is yielded without being copied through the buffer
+        held: bytes | None = None
 
         async for chunk in chunks:
+            if held is None and not buffer and type(chunk) is bytes and len(chunk) < frag_size:
+                held = chunk
+                continue
+            if held is not None:
+                buffer.extend(held)
+                held = None
             buffer.extend(chunk)
 
             # Yield complete fragments when buffer exceeds limit
-            while len(buffer) >= MAX_FRAGMENT_SIZE_BYTES:
-                # Yield exactly MAX_FRAGMENT_SIZE_BYTES
-                yield bytes(buffer[:MAX_FRAGMENT_SIZE_BYTES])
-                # Keep remainder in buffer
-                buffer = buffer[MAX_FRAGMENT_SIZE_BYTES:]
+            while len(buffer) >= frag_size:
+                # Copy exactly MAX_FRAGMENT_SIZE_BYTES out through a view (no intermediate bytearray);
+                # the view is released before the buffer is resized
+                with memoryview(buffer) as view:
+                    fragment = view[:frag_size].tobytes()
+                # Keep remainder in buffer: shifted in place instead of copied into a new bytearray
+                del buffer[:frag_size]
+                yield fragment
 
         # Yield any remaining bytes as final fragment
-        if buffer:
+        if held:
+            yield held
+        elif buffer:
             yield bytes(buffer)
 
     async def execute(
@@ -297,40 +340,60 @@ class UploadDocumentCommand:
             name=input_data.filename,
         )
         document_id = await self.create_document_command.execute(create_doc_input)
+        # Parsed once here rather than once per fragment
+        library_id = parse_uuid(input_data.library_id)
 
         # 2. Stream fragments (each via CreateDocumentFragmentCommand)
         # Batch chunks into <= 1 MB fragments before creating DocumentFragment entities
-        # Buffer one fragment to know when we've reached the last one
+        # Peek one batch ahead: a batch is only final once the stream has nothing after it
+        # Non-final fragments are written in background tasks, so their commits overlap
+        # reading the stream; the window bounds how many batches are held at once
         sequence = 0
-        total_bytes = 0
-        previous_batch = None
+        window = asyncio.Semaphore(self.MAX_FRAGMENTS_IN_FLIGHT)
+        in_flight: set[asyncio.Task[str]] = set()
+        batches = aiter(self._batch_chunks(chunks))
+        pending = await anext(batches, None)
 
-        async for batch in self._batch_chunks(chunks):
-            # If we have a previous batch, create fragment with is_final=False
-            if previous_batch is not None:
+        try:
+            async for batch in batches:
+                # Another batch follows, so the pending one is not final
                 fragment_input = CreateDocumentFragmentInput(
-                    library_id=input_data.library_id,
-                    document_id=str(document_id),
+                    library_id=library_id,
+                    document_id=document_id,
                     sequence_number=sequence,
-                    content=previous_batch,
+                    content=pending,
                     is_final=False,
                 )
-                await self.create_fragment_command.execute(fragment_input)
+                await window.acquire()
+                _raise_first_failure(in_flight)
+                task = asyncio.create_task(self.create_fragment_command.execute(fragment_input))
+                task.add_done_callback(lambda _: window.release())
+                in_flight.add(task)
                 sequence += 1
-                total_bytes += len(previous_batch)
+                pending = batch
 
-            # Store current batch to process next iteration
-            previous_batch = batch
+            # Every earlier fragment is stored before the final one marks the upload complete
+            await asyncio.gather(*in_flight)
+        finally:
+            for task in in_flight:
+                task.cancel()
 
         # 3. Create final fragment with is_final=True (if any content was uploaded)
-        if previous_batch is not None:
+        if pending is not None:
             fragment_input = CreateDocumentFragmentInput(
-                library_id=input_data.library_id,
-                document_id=str(document_id),
+                library_id=library_id,
+                document_id=document_id,
                 sequence_number=sequence,
-                content=previous_batch,
+                content=pending,
                 is_final=True,
             )
             await self.create_fragment_command.execute(fragment_input)
 
         return document_id
+
+
+def _raise_first_failure(tasks: set[asyncio.Task[str]]) -> None:
+    """Drop finished tasks from ``tasks``, re-raising the first failure among them."""
+    for task in [task for task in tasks if task.done()]:
+        tasks.discard(task)
+        task.result()
@@ -8,7 +8,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
-from uuid import UUID
 
 from vdb_core.application.base.command import Command
 from vdb_core.application.commands.inputs import (
@@ -16,13 +15,15 @@ from vdb_core.application.commands.inputs import (
     ParseDocumentInput,
     ProcessVectorizationConfigInput,
 )
-from vdb_core.domain.value_objects import DocumentId, DocumentStatus, LibraryId
+from vdb_core.domain.value_objects import DocumentStatus
+from vdb_core.utils import parse_uuid
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     from vdb_core.application.i_unit_of_work import IUnitOfWork
     from vdb_core.application.message_bus import IMessageBus
+    from vdb_core.domain.entities import ExtractedContent
     from vdb_core.domain.services import IParser
 
 
@@ -108,23 +109,23 @@ class ParseDocumentCommand(Command[ParseDocumentInput, ParseDocumentResult]):
             ParseError: If content parsing fails
 
         """
-        document_id_vo = UUID(input.document_id)
-        library_id_vo = UUID(input.library_id)
-        fragment_id_vo = UUID(input.fragment_id)
+        document_id_vo = parse_uuid(input.document_id)
+        library_id_vo = parse_uuid(input.library_id)
+        fragment_id_vo = parse_uuid(input.fragment_id)
 
-        library = await uow.libraries.get(library_id_vo)
-        document = await library.get_document(document_id_vo)
-        fragment = await document.get_fragment(fragment_id_vo)
+        # 1. Load library, document and fragment in one lookup
+        library, document, fragment = await uow.libraries.get_with_document_fragment(
+            library_id_vo, document_id_vo, fragment_id_vo
+        )
 
         # 2. Parse content (parser handles modality detection)
         extracted_contents = await self.parser.parse(fragment)
 
         # 3. Add extracted content through aggregate root (propagates events to library)
-        for content in extracted_contents:
-            await library.add_document_extracted_content(
-                document_id=document_id_vo,
-                extracted_content=content,
-            )
+        await library.add_document_extracted_contents(
+            document_id=document_id_vo,
+            extracted_contents=extracted_contents,
+        )
 
         # 4. If this is the final fragment, mark document as COMPLETED
         if input.is_final:
@@ -143,7 +144,7 @@ class ParseAllFragmentsCommand(Command[ParseAllFragmentsInput, ParseAllFragments
     This command orchestrates:
     1. Loading all fragments from the document
     2. Parsing each fragment using appropriate parser (parser handles modality detection)
-    3. Saving ExtractedContent and publishing events
+    3. Saving ExtractedContent in fragment order and publishing events
 
     Designed to be called from Temporal activities for durable execution.
 
@@ -192,28 +193,24 @@ class ParseAllFragmentsCommand(Command[ParseAllFragmentsInput, ParseAllFragments
             ParseError: If content parsing fails
 
         """
-        document_id_vo = DocumentId(input_data.document_id)
-        library_id_vo = LibraryId(input_data.library_id)
+        document_id_vo = parse_uuid(input_data.document_id)
+        library_id_vo = parse_uuid(input_data.library_id)
 
         # Load library and document
         library = await uow.libraries.get(library_id_vo)
         document = await library.get_document(document_id_vo)
 
-        # Parse all fragments
-        all_extracted_content_ids: list[str] = []
-
-        # Load and parse each fragment
+        # Load and parse each fragment (parser handles modality detection)
+        extracted_contents: list[ExtractedContent] = []
         async for fragment in document.load_fragments():
-            # Parse content (parser handles modality detection)
-            extracted_contents = await self.parser.parse(fragment)
-
-            # Add extracted content through aggregate root (propagates events to library)
-            for content in extracted_contents:
-                await library.add_document_extracted_content(
-                    document_id=document_id_vo,
-                    extracted_content=content,
-                )
-                all_extracted_content_ids.append(str(content.id))
+            extracted_contents.extend(await self.parser.parse(fragment))
+
+        # Add extracted content through aggregate root (propagates events to library)
+        await library.add_document_extracted_contents(
+            document_id=document_id_vo,
+            extracted_contents=extracted_contents,
+        )
+        all_extracted_content_ids = [str(content.id) for content in extracted_contents]
 
         return ParseAllFragmentsResult(
             extracted_content_ids=all_extracted_content_ids,
@@ -1,15 +1,17 @@
 """Input dataclasses for command handlers.
 
 These are the typed inputs that commands receive via their execute() method.
-They are simple, immutable data containers with no logic.
+They are simple, immutable data containers with no logic. Slotted (one is built per
+call, and per fragment on uploads) and compared by identity: nothing compares inputs.
 """
 
 from dataclasses import dataclass
+from uuid import UUID
 
 # ==================== Library Inputs ====================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class CreateLibraryInput:
     """Input for creating a new library.
 
@@ -21,7 +23,7 @@ class CreateLibraryInput:
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class UpdateLibraryInput:
     """Input for updating an existing library.
 
@@ -35,7 +37,7 @@ class UpdateLibraryInput:
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class DeleteLibraryInput:
     """Input for deleting a library.
 
@@ -50,7 +52,7 @@ class DeleteLibraryInput:
 # ==================== Document Inputs ====================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class CreateDocumentInput:
     """Input for creating a new document.
 
@@ -64,7 +66,7 @@ class CreateDocumentInput:
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class UpdateDocumentInput:
     """Input for updating an existing document.
 
@@ -78,7 +80,7 @@ class UpdateDocumentInput:
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class DeleteDocumentInput:
     """Input for deleting a document.
 
@@ -90,27 +92,30 @@ class DeleteDocumentInput:
     document_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class CreateDocumentFragmentInput:
     """Input for creating a document fragment during streaming upload.
 
     Attributes:
-        library_id: The parent library's ID (UUID string)
-        document_id: The parent document's ID (UUID string)
+        library_id: The parent library's ID (UUID or UUID string)
+        document_id: The parent document's ID (UUID or UUID string)
         sequence_number: Order fragment was received
         content: Raw bytes (could be part of image, PDF, etc.)
         is_final: True if this is the last fragment
 
+    Callers creating many fragments (streaming upload) pass already-parsed UUIDs so
+    the string is not parsed again for every fragment.
+
     """
 
-    library_id: str
-    document_id: str
+    library_id: UUID | str
+    document_id: UUID | str
     sequence_number: int
     content: bytes
     is_final: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class UploadDocumentInput:
     """Input for streaming document upload.
 
@@ -127,7 +132,7 @@ class UploadDocumentInput:
 # ==================== Library-Config Association Inputs ====================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class AddConfigToLibraryInput:
     """Input for adding a vectorization config to a library.
 
@@ -141,7 +146,7 @@ class AddConfigToLibraryInput:
     config_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class RemoveConfigFromLibraryInput:
     """Input for removing a vectorization config from a library.
 
@@ -158,7 +163,7 @@ class RemoveConfigFromLibraryInput:
 # ==================== Query Inputs ====================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class CreateQueryInput:
     """Input for creating a query.
 
@@ -177,7 +182,7 @@ class CreateQueryInput:
 # ==================== Temporal Workflow Inputs ====================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ParseDocumentInput:
     """Input for parsing a document fragment.
 
@@ -197,7 +202,7 @@ class ParseDocumentInput:
     is_final: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ParseAllFragmentsInput:
     """Input for parsing all fragments of a document into ExtractedContent.
 
@@ -211,7 +216,7 @@ class ParseAllFragmentsInput:
     document_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ProcessVectorizationConfigInput:
     """Input for processing a document with a specific VectorizationConfig.
 
@@ -6,8 +6,8 @@ Each command encapsulates the business logic for a specific write operation.
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING
-from uuid import UUID
 
 from vdb_core.application.base.command import Command
 from vdb_core.application.commands.inputs import (
@@ -18,13 +18,13 @@ from vdb_core.application.commands.inputs import (
     UpdateLibraryInput,
 )
 from vdb_core.domain.entities import Library
-from vdb_core.domain.exceptions import LibraryNotFoundError
 from vdb_core.domain.value_objects import (
     LibraryId,
     LibraryName,
     LibraryStatus,
     VectorizationConfigId,
 )
+from vdb_core.utils import parse_uuid
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -48,6 +48,10 @@ class CreateLibraryCommand(Command[CreateLibraryInput, LibraryId]):
 
     """
 
+    # Configs only change at bootstrap / migration time, so the id list is reused briefly
+    # across library creations instead of re-read from the read model every time
+    CONFIG_IDS_TTL_SECONDS = 60.0
+
     def __init__(
         self,
         uow_factory: Callable[[], IUnitOfWork],
@@ -64,6 +68,8 @@ class CreateLibraryCommand(Command[CreateLibraryInput, LibraryId]):
         """
         super().__init__(uow_factory, message_bus)
         self.config_read_repo_factory = config_read_repo_factory
+        self._config_ids: tuple[VectorizationConfigId, ...] | None = None
+        self._config_ids_expire_at = 0.0
 
     async def _execute(self, input_data: CreateLibraryInput, uow: IUnitOfWork) -> LibraryId:
         """Create a new library and associate all vectorization configs.
@@ -80,17 +86,24 @@ class CreateLibraryCommand(Command[CreateLibraryInput, LibraryId]):
         library = Library(name=LibraryName(value=input_data.name))
         await uow.libraries.add(library)
 
-        # Get all vectorization configs from read repository (regardless of status)
-        config_read_repo = self.config_read_repo_factory()
-        all_configs = await config_read_repo.get_all(statuses=None)
-
-        # Associate each config with the library
-        for config_read_model in all_configs:
-            config_id = VectorizationConfigId(UUID(config_read_model.id))
-            library.add_config(config_id)
+        # Associate every config (regardless of status) with the library in one call
+        library.add_configs(await self._get_config_ids())
 
         return library.id
 
+    async def _get_config_ids(self) -> tuple[VectorizationConfigId, ...]:
+        """Get the ids of all vectorization configs, cached for CONFIG_IDS_TTL_SECONDS."""
+        now = time.monotonic()
+        if self._config_ids is None or now >= self._config_ids_expire_at:
+            config_read_repo = self.config_read_repo_factory()
+            all_configs = await config_read_repo.get_all(statuses=None)
+            self._config_ids = tuple(
+                VectorizationConfigId(parse_uuid(config_read_model.id)) for config_read_model in all_configs
+            )
+            self._config_ids_expire_at = now + self.CONFIG_IDS_TTL_SECONDS
+        return self._config_ids
+
+
 class UpdateLibraryCommand(Command[UpdateLibraryInput, LibraryId]):
     """Command to update an existing library.
 
@@ -113,19 +126,17 @@ class UpdateLibraryCommand(Command[UpdateLibraryInput, LibraryId]):
             The updated library's ID
 
         """
-        library_id_vo = LibraryId(input_data.library_id)
+        library_id_vo = parse_uuid(input_data.library_id)
 
         # Load library (raises LibraryNotFoundError if not found)
         library = await uow.libraries.get(library_id_vo)
-        if library is None:
-            msg = f"Library {library_id_vo} not found"
-            raise LibraryNotFoundError(msg)
 
         # Update library name using update() method
         library.update(name=LibraryName(value=input_data.name))
 
         return library.id
 
+
 class DeleteLibraryCommand(Command[DeleteLibraryInput, None]):
     """Command to soft-delete a library.
 
@@ -146,13 +157,10 @@ class DeleteLibraryCommand(Command[DeleteLibraryInput, None]):
             uow: Active Unit of Work (within transaction)
 
         """
-        library_id_vo = LibraryId(input_data.library_id)
+        library_id_vo = parse_uuid(input_data.library_id)
 
         # Load library (raises LibraryNotFoundError if not found)
         library = await uow.libraries.get(library_id_vo)
-        if library is None:
-            msg = f"Library {library_id_vo} not found"
-            raise LibraryNotFoundError(msg)
 
         # Soft delete: update status to DELETED
         library.update(status=LibraryStatus.DELETED)
@@ -186,8 +194,8 @@ class AddConfigToLibraryCommand(Command[AddConfigToLibraryInput, None]):
             ValidationException: If config already associated with library
 
         """
-        library_id_vo = LibraryId(input_data.library_id)
-        config_id_vo = VectorizationConfigId(UUID(input_data.config_id))
+        library_id_vo = parse_uuid(input_data.library_id)
+        config_id_vo = VectorizationConfigId(parse_uuid(input_data.config_id))
 
         # Load library (raises LibraryNotFoundError if not found)
         library = await uow.libraries.get(library_id_vo)
@@ -224,8 +232,8 @@ class RemoveConfigFromLibraryCommand(Command[RemoveConfigFromLibraryInput, None]
             ValidationException: If config not associated with library
 
         """
-        library_id_vo = LibraryId(input_data.library_id)
-        config_id_vo = VectorizationConfigId(UUID(input_data.config_id))
+        library_id_vo = parse_uuid(input_data.library_id)
+        config_id_vo = VectorizationConfigId(parse_uuid(input_data.config_id))
 
         # Load library (raises LibraryNotFoundError if not found)
         library = await uow.libraries.get(library_id_vo)
@@ -1,5 +1,16 @@
 """Base application exception."""
 
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Shared read-only stand-in for "no details", so the default path allocates nothing
+_EMPTY_DETAILS: Mapping[str, object] = MappingProxyType({})
+
 
 class ApplicationException(Exception):
     """Base exception for application layer (use case) failures.
@@ -13,7 +24,7 @@ class ApplicationException(Exception):
 
     Attributes:
         message: Human-readable error message
-        details: Optional dictionary containing additional error context
+        details: Additional error context (read-only empty mapping when not given)
 
     """
 
@@ -26,5 +37,10 @@ class ApplicationException(Exception):
 
         """
         self.message = message
-        self.details = details or {}
+        self._details = details
         super().__init__(message)
+
+    @property
+    def details(self) -> Mapping[str, object]:
+        """Additional error context."""
+        return self._details if self._details is not None else _EMPTY_DETAILS
@@ -23,6 +23,10 @@ class IUnitOfWork(ABC):
     5. Automatically rolls back on any exception
     6. Returns events only after successful commit
 
+    Implementations backed by a database should check their connection out of a
+    shared, process-wide pool in __aenter__ and return it in __aexit__, rather than
+    opening a new connection per unit of work.
+
     DDD Aggregate Pattern:
     - 2 write repositories (aggregate roots): Library, VectorizationConfig
     - Documents, Chunks, Fragments: Written through Library aggregate
@@ -33,19 +33,22 @@ class IMessageBus(ABC):
         # Route events to handlers
         await message_bus.handle_events(events)
 
-    Example handler:
-        @message_bus.register_handler(LibraryCreated)
+    Example handler (in-process buses, e.g. InMemoryMessageBus):
         async def on_library_created(event: LibraryCreated):
             # Start processing workflow
             await temporal_client.start_workflow(...)
+
+        message_bus.register_handler(LibraryCreated, on_library_created)
     """
 
     @abstractmethod
     async def handle_events(self, events: list[DomainEvent]) -> None:
         """Handle a batch of domain events.
 
-        Routes each event to all registered handlers for that event type.
-        Handlers are called in registration order.
+        Routes each event to all registered handlers for that event type and
+        returns once they have all finished. Independent handlers may run
+        concurrently, so handlers must not rely on each other's ordering unless
+        the implementation offers an explicit serial mode for them.
 
         Args:
             events: List of domain events to handle
@@ -1,7 +1,9 @@
 """Message handlers for domain events."""
 
 from .document_handlers import DocumentMessageHandlers
+from .library_handlers import LibraryMessageHandlers
 
 __all__ = [
     "DocumentMessageHandlers",
+    "LibraryMessageHandlers",
 ]
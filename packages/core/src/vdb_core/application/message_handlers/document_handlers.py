@@ -6,10 +6,13 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from vdb_core.application.i_unit_of_work import IUnitOfWork
+    from vdb_core.application.read_model_cache import ReadModelCache
     from vdb_core.domain.events import (
         DocumentCreated,
         DocumentDeleted,
+        DocumentFragmentReceived,
         DocumentUpdated,
+        ExtractedContentCreated,
     )
 
 
@@ -29,14 +32,16 @@ class DocumentMessageHandlers:
         message_bus.register(DocumentDeleted, handlers.on_document_deleted)
     """
 
-    def __init__(self, uow: IUnitOfWork) -> None:
+    def __init__(self, uow: IUnitOfWork, read_model_cache: ReadModelCache | None = None) -> None:
         """Initialize handlers with dependencies.
 
         Args:
             uow: Unit of Work for loading entities
+            read_model_cache: Cached read models to invalidate when a document changes
 
         """
         self.uow = uow
+        self.read_model_cache = read_model_cache
 
     async def on_document_created(self, event: DocumentCreated) -> None:
         """Handle document creation event.
@@ -54,6 +59,9 @@ class DocumentMessageHandlers:
             so the document definitely exists in the database.
 
         """
+        # The library's document count changed
+        if self.read_model_cache is not None:
+            self.read_model_cache.invalidate_library(str(event.library_id))
 
     async def on_document_updated(self, event: DocumentUpdated) -> None:
         """Handle document update event.
@@ -67,6 +75,8 @@ class DocumentMessageHandlers:
             event: The document updated event
 
         """
+        if self.read_model_cache is not None:
+            self.read_model_cache.invalidate_library(str(event.library_id))
 
     async def on_document_deleted(self, event: DocumentDeleted) -> None:
         """Handle document deletion event.
@@ -80,3 +90,28 @@ class DocumentMessageHandlers:
             event: The document deleted event
 
         """
+        if self.read_model_cache is not None:
+            self.read_model_cache.invalidate_library(str(event.library_id))
+
+    async def on_document_fragment_received(self, event: DocumentFragmentReceived) -> None:
+        """Handle document fragment event.
+
+        Uploads raise only fragment events; the final fragment completes the upload
+        and changes the document's status and fragment count.
+
+        Args:
+            event: The document fragment received event
+
+        """
+        if self.read_model_cache is not None:
+            self.read_model_cache.invalidate_library(str(event.library_id))
+
+    async def on_extracted_content_created(self, event: ExtractedContentCreated) -> None:
+        """Handle extracted content creation event (the document's parsed content changed).
+
+        Args:
+            event: The extracted content created event
+
+        """
+        if self.read_model_cache is not None:
+            self.read_model_cache.invalidate_library(str(event.library_id))
@@ -0,0 +1,85 @@
+"""Message handlers for library-related domain events."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from vdb_core.application.read_model_cache import ReadModelCache
+    from vdb_core.domain.events.library_events import (
+        LibraryConfigAdded,
+        LibraryConfigRemoved,
+        LibraryCreated,
+        LibraryDeleted,
+        LibraryUpdated,
+    )
+
+
+class LibraryMessageHandlers:
+    """Handlers for library domain events.
+
+    Keeps cached library read models consistent with library lifecycle events.
+
+    Message handlers are called AFTER successful transaction commit,
+    so a reload after invalidation sees the committed state.
+
+    Example usage:
+        handlers = LibraryMessageHandlers(read_model_cache=cache)
+        message_bus.register_handler(LibraryCreated, handlers.on_library_created)
+        message_bus.register_handler(LibraryUpdated, handlers.on_library_updated)
+        message_bus.register_handler(LibraryDeleted, handlers.on_library_deleted)
+    """
+
+    def __init__(self, read_model_cache: ReadModelCache) -> None:
+        """Initialize handlers with dependencies.
+
+        Args:
+            read_model_cache: Cached read models to invalidate when a library changes
+
+        """
+        self.read_model_cache = read_model_cache
+
+    async def on_library_created(self, event: LibraryCreated) -> None:
+        """Handle library creation event (the list of libraries changed).
+
+        Args:
+            event: The library created event
+
+        """
+        self.read_model_cache.invalidate_library(str(event.library_id))
+
+    async def on_library_updated(self, event: LibraryUpdated) -> None:
+        """Handle library update event.
+
+        Args:
+            event: The library updated event
+
+        """
+        self.read_model_cache.invalidate_library(str(event.library_id))
+
+    async def on_library_deleted(self, event: LibraryDeleted) -> None:
+        """Handle library deletion event.
+
+        Args:
+            event: The library deleted event
+
+        """
+        self.read_model_cache.invalidate_library(str(event.library_id))
+
+    async def on_library_config_added(self, event: LibraryConfigAdded) -> None:
+        """Handle vectorization config added to a library.
+
+        Args:
+            event: The library config added event
+
+        """
+        self.read_model_cache.invalidate_library(str(event.library_id))
+
+    async def on_library_config_removed(self, event: LibraryConfigRemoved) -> None:
+        """Handle vectorization config removed from a library.
+
+        Args:
+            event: The library config removed event
+
+        """
+        self.read_model_cache.invalidate_library(str(event.library_id))
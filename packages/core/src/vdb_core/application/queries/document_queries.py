@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetDocumentsQuery:
     """Query to get all documents in a library.
 
@@ -18,7 +18,7 @@ class GetDocumentsQuery:
     offset: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetDocumentByIdQuery:
     """Query to get a document by ID.
 
@@ -32,7 +32,7 @@ class GetDocumentByIdQuery:
     document_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetDocumentChunksQuery:
     """Query to get all chunks for a document.
 
@@ -55,7 +55,7 @@ class GetDocumentChunksQuery:
     offset: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetDocumentFragmentsQuery:
     """Query to get all fragments for a document.
 
@@ -78,7 +78,7 @@ class GetDocumentFragmentsQuery:
     offset: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetDocumentVectorizationStatusQuery:
     """Query to get vectorization status for a document.
 
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetEventLogsQuery:
     """Query to get all event logs across all libraries.
 
@@ -26,7 +26,7 @@ class GetEventLogsQuery:
     offset: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetEventLogByIdQuery:
     """Query to get a specific event log by ID.
 
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetLibrariesQuery:
     """Query to get all libraries.
 
@@ -17,7 +17,7 @@ class GetLibrariesQuery:
     offset: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetLibraryByIdQuery:
     """Query to get a library by ID.
 
@@ -29,7 +29,7 @@ class GetLibraryByIdQuery:
     library_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetLibraryConfigsQuery:
     """Query to get all vectorization configs for a library.
 
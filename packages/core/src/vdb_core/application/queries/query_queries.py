@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetQueriesQuery:
     """Query to get all queries for a library.
 
@@ -24,7 +24,7 @@ class GetQueriesQuery:
     offset: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetQueryByIdQuery:
     """Query to get a specific query by ID.
 
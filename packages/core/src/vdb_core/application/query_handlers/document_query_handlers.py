@@ -59,9 +59,6 @@ class GetDocumentsQuery(Query[GetDocumentsInput, list[DocumentReadModel]]):
             List of document read models
 
         """
-        if read_repo_provider.documents is None:
-            msg = "Documents repository not initialized"
-            raise RuntimeError(msg)
         return await read_repo_provider.documents.get_all_in_library(
             library_id=input_data.library_id,
             limit=input_data.limit,
@@ -92,9 +89,6 @@ class GetDocumentByIdQuery(Query[GetDocumentByIdInput, DocumentReadModel | None]
             Document read model if found, None otherwise
 
         """
-        if read_repo_provider.documents is None:
-            msg = "Documents repository not initialized"
-            raise RuntimeError(msg)
         return await read_repo_provider.documents.get_by_id(
             library_id=input_data.library_id,
             document_id=input_data.document_id,
@@ -124,9 +118,6 @@ class GetDocumentChunksQuery(Query[GetDocumentChunksInput, list[ChunkReadModel]]
             List of chunk read models
 
         """
-        if read_repo_provider.chunks is None:
-            msg = "Chunks repository not initialized"
-            raise RuntimeError(msg)
         return await read_repo_provider.chunks.get_chunks_by_document(
             library_id=input_data.library_id,
             document_id=input_data.document_id,
@@ -158,9 +149,6 @@ class GetDocumentFragmentsQuery(Query[GetDocumentFragmentsInput, list[DocumentFr
             List of fragment read models
 
         """
-        if read_repo_provider.document_fragments is None:
-            msg = "Document fragments repository not initialized"
-            raise RuntimeError(msg)
         return await read_repo_provider.document_fragments.get_all_in_document(
             library_id=input_data.library_id,
             document_id=input_data.document_id,
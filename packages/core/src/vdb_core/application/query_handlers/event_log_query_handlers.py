@@ -50,9 +50,6 @@ class GetEventLogsQuery(Query[GetEventLogsInput, list[EventLogReadModel]]):
             List of event log read models ordered by occurred_at descending
 
         """
-        if read_repo_provider.event_logs is None:
-            msg = "Event_Logs repository not initialized"
-            raise RuntimeError(msg)
         return await read_repo_provider.event_logs.get_all(
             event_type=input_data.event_type,
             aggregate_type=input_data.aggregate_type,
@@ -84,9 +81,6 @@ class GetEventLogByIdQuery(Query[GetEventLogByIdInput, EventLogReadModel | None]
             Event log read model if found, None otherwise
 
         """
-        if read_repo_provider.event_logs is None:
-            msg = "Event logs repository not initialized"
-            raise RuntimeError(msg)
         return await read_repo_provider.event_logs.get_by_id(
             event_log_id=input_data.event_log_id,
         )
@@ -48,9 +48,6 @@ class GetLibrariesQuery(Query[GetLibrariesInput, list[LibraryReadModel]]):
             List of library read models
 
         """
-        if read_repo_provider.libraries is None:
-            msg = "Libraries repository not initialized"
-            raise RuntimeError(msg)
         return await read_repo_provider.libraries.get_all(limit=input_data.limit, offset=input_data.offset)
 
 
@@ -80,9 +77,6 @@ class GetLibraryByIdQuery(Query[GetLibraryByIdInput, LibraryReadModel]):
             LibraryNotFoundError: If library not found
 
         """
-        if read_repo_provider.libraries is None:
-            msg = "Libraries repository not initialized"
-            raise RuntimeError(msg)
         return await read_repo_provider.libraries.get_by_id(input_data.library_id)
 
 
@@ -110,7 +104,4 @@ class GetLibraryConfigsQuery(Query[GetLibraryConfigsInput, list[VectorizationCon
             List of vectorization config read models for the library
 
         """
-        if read_repo_provider.vectorization_configs is None:
-            msg = "Vectorization configs repository not initialized"
-            raise RuntimeError(msg)
         return await read_repo_provider.vectorization_configs.get_by_library(input_data.library_id)
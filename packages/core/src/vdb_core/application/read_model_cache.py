@@ -0,0 +1,137 @@
+"""In-process read-through cache for read models (CQRS read side)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+
+class ReadModelCache:
+    """TTL + LRU cache for query results, keyed by the (frozen, hashable) query input.
+
+    - Entries expire after `ttl_seconds`, and the least recently used entry is evicted
+      once `max_entries` is reached
+    - Entries are indexed by library id so a library and everything under it can be
+      invalidated at once; entries without a library id (e.g. the list of all libraries)
+      are dropped on every library invalidation
+    - Concurrent misses on the same key share one load instead of each hitting the database
+    - A load that overlaps an invalidation of its key (or its library) is returned to its
+      callers but not stored; loads of other keys and libraries are unaffected
+
+    Invalidation is driven by domain events handled in this process; changes made in other
+    processes only become visible once the TTL expires, so keep it short.
+
+    Example:
+        cache = ReadModelCache(ttl_seconds=5.0)
+        library = await cache.get_or_load(query, lambda: load(query), library_id=query.library_id)
+        cache.invalidate_library(library_id)
+
+    """
+
+    def __init__(self, *, ttl_seconds: float = 5.0, max_entries: int = 10_000) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: How long an entry is served before it is reloaded
+            max_entries: Maximum number of cached entries (least recently used evicted first)
+
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # key -> (expires_at, library_id, value), least recently used first
+        self._entries: OrderedDict[Hashable, tuple[float, str | None, Any]] = OrderedDict()
+        self._keys_by_library: defaultdict[str | None, set[Hashable]] = defaultdict(set)
+        # key -> (library_id, in-flight load); a load is only stored while it is still registered here
+        self._loading: dict[Hashable, tuple[str | None, asyncio.Task[Any]]] = {}
+
+    async def get_or_load[T](
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        *,
+        library_id: str | None = None,
+    ) -> T:
+        """Return the cached value for `key`, loading (and caching) it on a miss.
+
+        Args:
+            key: Hashable cache key, typically the frozen query input
+            loader: Coroutine factory producing the value on a miss
+            library_id: Library the value belongs to, for invalidation
+
+        Returns:
+            The cached or freshly loaded value
+
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, _, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                return cast("T", value)
+            self._discard(key)
+
+        loading = self._loading.get(key)
+        if loading is None:
+            task = asyncio.ensure_future(loader())
+            self._loading[key] = (library_id, task)
+
+            def store(done: asyncio.Task[Any]) -> None:
+                current = self._loading.get(key)
+                if current is None or current[1] is not done:
+                    return  # Invalidated while loading
+                del self._loading[key]
+                if done.cancelled() or done.exception() is not None:
+                    return
+                self._store(key, library_id, done.result())
+
+            task.add_done_callback(store)
+        else:
+            task = loading[1]
+
+        # Shielded: a caller giving up does not cancel the load other callers are waiting on
+        return cast("T", await asyncio.shield(task))
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one entry (and let an in-flight load for it finish uncached)."""
+        self._loading.pop(key, None)
+        self._discard(key)
+
+    def invalidate_library(self, library_id: str) -> None:
+        """Drop every entry of a library, plus the entries that span libraries."""
+        stale = [key for key, (owner, _) in self._loading.items() if owner in (library_id, None)]
+        for key in stale:
+            del self._loading[key]
+        for key in self._keys_by_library.pop(library_id, set()) | self._keys_by_library.pop(None, set()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._loading.clear()
+        self._entries.clear()
+        self._keys_by_library.clear()
+
+    def _store(self, key: Hashable, library_id: str | None, value: Any) -> None:
+        self._discard(key)
+        while len(self._entries) >= self.max_entries:
+            self._discard(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, library_id, value)
+        self._keys_by_library[library_id].add(key)
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        library_keys = self._keys_by_library.get(entry[1])
+        if library_keys is not None:
+            library_keys.discard(key)
+            if not library_keys:
+                del self._keys_by_library[entry[1]]
+
+    def __len__(self) -> int:
+        """Get count of cached entries."""
+        return len(self._entries)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, Any, NoReturn, Self
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -19,8 +19,59 @@ if TYPE_CHECKING:
     )
 
 
+class _MissingReadRepository:
+    """Placeholder for a read repository that is not available.
+
+    Falsy, so optional repositories can still be tested with `if not provider.queries`,
+    and raises RuntimeError on any attribute access - query handlers can call the
+    repository directly instead of checking it for None on every query.
+    """
+
+    __slots__ = ("_message",)
+
+    def __init__(self, message: str) -> None:
+        self._message = message
+
+    def __getattr__(self, name: str) -> NoReturn:
+        raise RuntimeError(self._message)
+
+    def __bool__(self) -> bool:
+        return False
+
+
+# Bound outside the `async with` block and for optional repositories that are not configured
+_MISSING_LIBRARIES: Any = _MissingReadRepository("Libraries repository not initialized")
+_MISSING_DOCUMENTS: Any = _MissingReadRepository("Documents repository not initialized")
+_MISSING_DOCUMENT_FRAGMENTS: Any = _MissingReadRepository("Document fragments repository not initialized")
+_MISSING_CHUNKS: Any = _MissingReadRepository("Chunks repository not initialized")
+_MISSING_QUERIES: Any = _MissingReadRepository("Queries repository not initialized")
+_MISSING_EVENT_LOGS: Any = _MissingReadRepository("Event logs repository not initialized")
+_MISSING_VECTORIZATION_CONFIGS: Any = _MissingReadRepository("Vectorization configs repository not initialized")
+
+
 class ReadRepositoryProvider:
-    """Provider for all read repositories (CQRS read side)."""
+    """Provider for all read repositories (CQRS read side).
+
+    Repositories that are not available (outside the `async with` block, or optional
+    ones without a factory) are falsy placeholders that raise RuntimeError when used.
+    """
+
+    __slots__ = (
+        "_chunk_read_repository_factory",
+        "_document_fragment_read_repository_factory",
+        "_document_read_repository_factory",
+        "_event_log_read_repository_factory",
+        "_library_read_repository_factory",
+        "_query_read_repository_factory",
+        "_vectorization_config_read_repository_factory",
+        "chunks",
+        "document_fragments",
+        "documents",
+        "event_logs",
+        "libraries",
+        "queries",
+        "vectorization_configs",
+    )
 
     def __init__(
         self,
@@ -53,13 +104,13 @@ class ReadRepositoryProvider:
         self._query_read_repository_factory = query_read_repository_factory
 
         # Repositories will be initialized when context is entered (mirrors UoW)
-        self.libraries: ILibraryReadRepository | None = None
-        self.documents: IDocumentReadRepository | None = None
-        self.document_fragments: IDocumentFragmentReadRepository | None = None
-        self.chunks: IChunkReadRepository | None = None
-        self.queries: IQueryReadRepository | None = None
-        self.event_logs: IEventLogReadRepository | None = None
-        self.vectorization_configs: IVectorizationConfigReadRepository | None = None
+        self.libraries: ILibraryReadRepository = _MISSING_LIBRARIES
+        self.documents: IDocumentReadRepository = _MISSING_DOCUMENTS
+        self.document_fragments: IDocumentFragmentReadRepository = _MISSING_DOCUMENT_FRAGMENTS
+        self.chunks: IChunkReadRepository = _MISSING_CHUNKS
+        self.queries: IQueryReadRepository = _MISSING_QUERIES
+        self.event_logs: IEventLogReadRepository = _MISSING_EVENT_LOGS
+        self.vectorization_configs: IVectorizationConfigReadRepository = _MISSING_VECTORIZATION_CONFIGS
 
     async def __aenter__(self) -> Self:
         """Enter async context - initialize all repositories (mirrors UoW).
@@ -95,11 +146,11 @@ class ReadRepositoryProvider:
 
         """
         # For read-only operations, no rollback needed
-        # Just reset repositories to None (mirrors UoW cleanup)
-        self.libraries = None
-        self.documents = None
-        self.document_fragments = None
-        self.chunks = None
-        self.queries = None
-        self.event_logs = None
-        self.vectorization_configs = None
+        # Just reset repositories to the placeholders (mirrors UoW cleanup)
+        self.libraries = _MISSING_LIBRARIES
+        self.documents = _MISSING_DOCUMENTS
+        self.document_fragments = _MISSING_DOCUMENT_FRAGMENTS
+        self.chunks = _MISSING_CHUNKS
+        self.queries = _MISSING_QUERIES
+        self.event_logs = _MISSING_EVENT_LOGS
+        self.vectorization_configs = _MISSING_VECTORIZATION_CONFIGS
@@ -19,6 +19,11 @@ class AbstractRepository[TEntity: "IEntity", TId](ABC):
     - Private methods (_add, _get, _update) do actual database work
     - Subclasses only implement private methods
 
+    `get` also acts as an identity map: while an entity is tracked in `self.seen`,
+    getting it again returns the same instance without calling `_get`. Repeated loads
+    within one Unit of Work cost nothing, and changes made through either reference
+    land on the one instance whose events the Unit of Work collects.
+
     Type Parameters:
         TEntity: The entity type managed by this repository
         TId: The ID type for the entity
@@ -41,6 +46,8 @@ class AbstractRepository[TEntity: "IEntity", TId](ABC):
         """Initialize repository with empty seen set."""
         self.seen: set[TEntity] = set()
         self.added: set[TEntity] = set()  # Track newly added entities separately
+        # id -> instance handed out by add/get; only valid while the instance is in `seen`
+        self._identity_map: dict[TId, TEntity] = {}
 
     async def add(self, entity: TEntity) -> None:
         """Add entity and track in added set.
@@ -52,6 +59,7 @@ class AbstractRepository[TEntity: "IEntity", TId](ABC):
         await self._add(entity)
         self.seen.add(entity)
         self.added.add(entity)  # Track as newly added
+        self._identity_map[entity.id] = entity
 
     async def get(self, id: TId) -> TEntity:
         """Get entity and track in seen set if found.
@@ -66,11 +74,17 @@ class AbstractRepository[TEntity: "IEntity", TId](ABC):
             EntityNotFoundError: If entity doesn't exist
 
         """
+        # Already loaded in this Unit of Work (`seen` is cleared on rollback / new transaction)
+        entity = self._identity_map.get(id)
+        if entity is not None and entity in self.seen:
+            return entity
+
         entity = await self._get(id)
         if entity is None:
             from vdb_core.domain.exceptions import EntityNotFoundError
             raise EntityNotFoundError(f"Entity with id {id} not found")
         self.seen.add(entity)
+        self._identity_map[id] = entity
         return entity
 
     async def update(self, entity: TEntity) -> None:
@@ -82,6 +96,7 @@ class AbstractRepository[TEntity: "IEntity", TId](ABC):
         """
         await self._update(entity)
         self.seen.add(entity)
+        self._identity_map[entity.id] = entity
 
     async def delete(self, id: TId) -> None:
         """Hard delete entity (doesn't track in seen since entity is removed).
@@ -91,6 +106,7 @@ class AbstractRepository[TEntity: "IEntity", TId](ABC):
 
         """
         await self._delete(id)
+        self._identity_map.pop(id, None)
 
     async def soft_delete(self, id: TId) -> None:
         """Soft delete entity (loads entity and tracks in seen).
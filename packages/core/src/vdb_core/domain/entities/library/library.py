@@ -27,7 +27,7 @@ from vdb_core.domain.value_objects import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable
+    from collections.abc import AsyncIterator, Callable, Iterable
     from datetime import datetime
 
     from vdb_core.domain.entities.extracted_content import ExtractedContent
@@ -170,14 +170,26 @@ class Library(IEntity):
         document_id: DocumentId,
         extracted_content: ExtractedContent,
     ) -> None:
-        # using imported ExtractedContentCreated
+        await self.add_document_extracted_contents(document_id, [extracted_content])
+
+    async def add_document_extracted_contents(
+        self,
+        document_id: DocumentId,
+        extracted_contents: list[ExtractedContent],
+    ) -> None:
+        # Document resolved and touched once per batch; one ExtractedContentCreated per
+        # content, since persistence and downstream consumers handle them individually
         from vdb_core.utils.dt_utils import utc_now
 
+        if not extracted_contents:
+            return
+
         document = await self.get_document(document_id)
-        document._extracted_contents[extracted_content.id] = extracted_content
+        for extracted_content in extracted_contents:
+            document._extracted_contents[extracted_content.id] = extracted_content
         object.__setattr__(document, "updated_at", utc_now())
 
-        self.events.append(
+        self.events.extend(
             ExtractedContentCreated(
                 library_id=self.id,
                 document_id=document_id,
@@ -187,6 +199,7 @@ class Library(IEntity):
                 modality_sequence_number=extracted_content.modality_sequence_number,
                 is_last_of_modality=extracted_content.is_last_of_modality,
             )
+            for extracted_content in extracted_contents
         )
 
     async def get_document(self, document_id: DocumentId) -> Document:
@@ -240,27 +253,43 @@ class Library(IEntity):
 
         Emits LibraryConfigAdded event and tracks pending association.
         """
-        # Avoid duplicate if already associated
-        if any(str(cfg.id) == str(config_id) for cfg in self._configs):
-            return
-        if config_id in self._added_configs:
-            return
+        self.add_configs([config_id])
+
+    def add_configs(self, config_ids: Iterable[VectorizationConfigId]) -> None:
+        """Associate several vectorization configs with this library.
+
+        Existing associations are checked against one set built up front rather than
+        rescanned per config. Emits one LibraryConfigAdded event per new association.
+        """
         from vdb_core.domain.events.library_events import LibraryConfigAdded
 
-        self._added_configs.add(config_id)
-        self.events.append(LibraryConfigAdded(library_id=self.id, config_id=config_id))
+        associated = {str(cfg.id) for cfg in self._configs}
+        for config_id in config_ids:
+            # Avoid duplicate if already associated
+            if str(config_id) in associated or config_id in self._added_configs:
+                continue
+            self._added_configs.add(config_id)
+            self.events.append(LibraryConfigAdded(library_id=self.id, config_id=config_id))
 
     def remove_config(self, config_id: VectorizationConfigId) -> None:
         """Disassociate a vectorization config from this library.
 
         Emits LibraryConfigRemoved event and tracks pending removal.
         """
-        if config_id in self._removed_configs:
-            return
+        self.remove_configs([config_id])
+
+    def remove_configs(self, config_ids: Iterable[VectorizationConfigId]) -> None:
+        """Disassociate several vectorization configs from this library.
+
+        Emits one LibraryConfigRemoved event per config not already pending removal.
+        """
         from vdb_core.domain.events.library_events import LibraryConfigRemoved
 
-        self._removed_configs.add(config_id)
-        self.events.append(LibraryConfigRemoved(library_id=self.id, config_id=config_id))
+        for config_id in config_ids:
+            if config_id in self._removed_configs:
+                continue
+            self._removed_configs.add(config_id)
+            self.events.append(LibraryConfigRemoved(library_id=self.id, config_id=config_id))
 
     # Chunk and Embedding management (deduplicated value objects)
 
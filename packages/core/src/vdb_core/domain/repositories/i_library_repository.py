@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from vdb_core.domain.base import AbstractRepository
 from vdb_core.domain.entities import Library
 from vdb_core.domain.value_objects import DocumentId, LibraryId
 
+if TYPE_CHECKING:
+    from vdb_core.domain.entities import Document
+    from vdb_core.domain.entities.library import DocumentFragment
+    from vdb_core.domain.value_objects import DocumentFragmentId
+
 
 class ILibraryRepository(AbstractRepository[Library, LibraryId], ABC):
     """Repository for Library aggregate root.
@@ -32,3 +38,27 @@ class ILibraryRepository(AbstractRepository[Library, LibraryId], ABC):
 
         """
         ...
+
+    @abstractmethod
+    async def get_with_document_fragment(
+        self,
+        library_id: LibraryId,
+        document_id: DocumentId,
+        fragment_id: DocumentFragmentId,
+    ) -> tuple[Library, Document, DocumentFragment]:
+        """Get a library together with one of its documents and one fragment of that document.
+
+        Args:
+            library_id: Library ID
+            document_id: Document ID within the library
+            fragment_id: Fragment ID within the document
+
+        Returns:
+            Tuple of (library, document, fragment)
+
+        Raises:
+            LibraryNotFoundError: If library does not exist
+            ValueError: If the document or fragment does not exist
+
+        """
+        ...
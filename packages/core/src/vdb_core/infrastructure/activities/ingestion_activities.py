@@ -178,15 +178,10 @@ async def parse_all_fragments_activity(
     # Get dependencies from DI container
     container = get_di_container()
 
-    # Create and execute ParseAllFragmentsCommand
-    from vdb_core.application.commands.ingestion_commands import ParseAllFragmentsCommand
+    # Execute the container's ParseAllFragmentsCommand (built once, reused across activities)
     from vdb_core.application.commands.inputs import ParseAllFragmentsInput
 
-    command = ParseAllFragmentsCommand(
-        uow_factory=container.get_unit_of_work,
-        message_bus=container.get_message_bus(),
-        parser=container.get_parser(),
-    )
+    command = container.application.parse_all_fragments_command
 
     result = await command.execute(
         ParseAllFragmentsInput(
@@ -3,6 +3,7 @@
 Each activity handles a single I/O operation for proper retry control.
 """
 
+import asyncio
 import logging
 from typing import Any
 from uuid import UUID
@@ -26,6 +27,9 @@ from vdb_core.infrastructure.activities.ingestion_activities import get_di_conta
 
 logger = logging.getLogger(__name__)
 
+# ExtractedContents chunked at once in chunk_content; chunkers are synchronous and run in threads
+_MAX_CONCURRENT_CHUNKING = 4
+
 
 @activity.defn(name="load_extracted_content")
 async def load_extracted_content_activity(
@@ -134,18 +138,13 @@ async def chunk_content_activity(
         chunk_ids = []
         document_chunk_index = 0
 
-        # Process each ExtractedContent
+        # Resolve a chunker for each ExtractedContent, in order
+        jobs = []
         for ec_dict in extracted_contents:
             extracted = _deserialize_extracted_content(ec_dict)
 
-            activity.logger.info(f"Chunking {extracted.modality.value.upper()} content ({len(extracted.content)} bytes)")
-
-            # Get ChunkingStrategy for this modality from config
-            from vdb_core.domain.value_objects import ModalityType
-
+            # Find chunking strategy for this modality from config
             modality_enum = ModalityType[extracted.modality.value.upper()]
-
-            # Find chunking strategy for this modality
             chunking_strategy = next(
                 (s for s in vectorization_config.chunking_strategies if s.modality.value == modality_enum),
                 None,
@@ -156,14 +155,28 @@ async def chunk_content_activity(
                 continue
 
             # Resolve to implementation
-            chunker_impl = strategy_resolver.get_chunker(chunking_strategy)
+            jobs.append((extracted, chunking_strategy, strategy_resolver.get_chunker(chunking_strategy)))
 
-            # Chunk the content
-            raw_chunks = chunker_impl.chunk(extracted.content)
+        # Chunk the contents concurrently: chunkers are synchronous (tokenizer work), so each
+        # runs in a thread instead of blocking the event loop, bounded by the semaphore
+        limit = asyncio.Semaphore(_MAX_CONCURRENT_CHUNKING)
+
+        async def run_chunker(extracted: ExtractedContent, chunker_impl: Any) -> list[str | bytes]:
+            async with limit:
+                activity.logger.info(
+                    f"Chunking {extracted.modality.value.upper()} content ({len(extracted.content)} bytes)"
+                )
+                return await asyncio.to_thread(chunker_impl.chunk, extracted.content)
+
+        all_raw_chunks = await asyncio.gather(
+            *(run_chunker(extracted, chunker_impl) for extracted, _, chunker_impl in jobs)
+        )
 
+        # Create Chunk value objects in content order so sequence numbers stay deterministic
+        pending_rows: list[dict[str, Any]] = []
+        for (extracted, chunking_strategy, _), raw_chunks in zip(jobs, all_raw_chunks, strict=True):
             activity.logger.info(f"Created {len(raw_chunks)} chunks using {chunking_strategy.model_key}")
 
-            # Create Chunk value objects
             for chunk_content in raw_chunks:
                 # Create Chunk value object (immutable, deduplicated)
                 chunk = Chunk(
@@ -179,9 +192,6 @@ async def chunk_content_activity(
                 # Add chunk to library (deduplication happens here)
                 stored_chunk = library.add_chunk(chunk)
 
-                # Persist chunk to database directly (we have the context here)
-                from sqlalchemy import text
-
                 # Convert content to string if bytes
                 chunk_content_str = chunk_content
                 if isinstance(chunk_content_str, bytes):
@@ -190,17 +200,7 @@ async def chunk_content_activity(
                 # ChunkId.value is already a UUID string
                 chunk_ids.append(stored_chunk.chunk_id.value)
 
-                await uow.session.execute(
-                    text("""
-                        INSERT INTO chunks (
-                            id, document_id, chunking_strategy_id, extracted_content_id,
-                            sequence_number, content, content_hash, modality_type
-                        ) VALUES (
-                            :id, :document_id, :chunking_strategy_id, :extracted_content_id,
-                            :sequence_number, :content, :content_hash, :modality_type
-                        )
-                        ON CONFLICT (id) DO NOTHING
-                    """),
+                pending_rows.append(
                     {
                         "id": stored_chunk.chunk_id.value,
                         "document_id": str(document.id),
@@ -210,11 +210,29 @@ async def chunk_content_activity(
                         "content": chunk_content_str,
                         "content_hash": stored_chunk.content_hash.value,
                         "modality_type": extracted.modality.value,
-                    },
+                    }
                 )
 
                 document_chunk_index += 1
 
+        # Persist chunks directly (we have the context here), in one executemany
+        if pending_rows:
+            from sqlalchemy import text
+
+            await uow.session.execute(
+                text("""
+                    INSERT INTO chunks (
+                        id, document_id, chunking_strategy_id, extracted_content_id,
+                        sequence_number, content, content_hash, modality_type
+                    ) VALUES (
+                        :id, :document_id, :chunking_strategy_id, :extracted_content_id,
+                        :sequence_number, :content, :content_hash, :modality_type
+                    )
+                    ON CONFLICT (id) DO NOTHING
+                """),
+                pending_rows,
+            )
+
         await uow.commit()
 
         activity.logger.info(f"✅ Created {len(chunk_ids)} chunks total")
@@ -380,7 +398,8 @@ async def generate_embeddings_activity(
                     vectors.append(new_vectors[new_vector_idx])
                     new_vector_idx += 1
 
-            # Create Embedding value objects and persist to database (only for new embeddings)
+            # Create Embedding value objects; new ones are collected and written in one batch
+            pending_rows: list[dict[str, Any]] = []
             for chunk, vector in zip(modality_chunks, vectors, strict=False):
                 # ChunkReadModel has 'id' field (UUID string)
                 # Create ChunkId from the chunk's UUID
@@ -410,7 +429,19 @@ async def generate_embeddings_activity(
                     vector_indexing_strategy=vectorization_config.vector_indexing_strategy.value
                 )
 
-                # Persist new embedding to database
+                pending_rows.append(
+                    {
+                        "id": stored_embedding.embedding_id.value,
+                        "chunk_id": chunk.id,  # Use chunk UUID directly
+                        "vectorization_config_id": str(vectorization_config.id),
+                        "library_id": str(library.id),
+                        "vector": json.dumps(list(vector)),
+                        "dimensions": len(vector),
+                    }
+                )
+
+            # Persist new embeddings with a single executemany instead of one INSERT per embedding
+            if pending_rows:
                 await uow.session.execute(
                     text("""
                         INSERT INTO embeddings (
@@ -422,14 +453,7 @@ async def generate_embeddings_activity(
                         )
                         ON CONFLICT (id) DO NOTHING
                     """),
-                    {
-                        "id": stored_embedding.embedding_id.value,
-                        "chunk_id": chunk.id,  # Use chunk UUID directly
-                        "vectorization_config_id": str(vectorization_config.id),
-                        "library_id": str(library.id),
-                        "vector": json.dumps(list(vector)),
-                        "dimensions": len(vector),
-                    },
+                    pending_rows,
                 )
 
             num_reused = len(existing_embeddings)
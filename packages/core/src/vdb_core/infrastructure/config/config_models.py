@@ -36,6 +36,7 @@ class StorageConfig(BaseModel):
     type: StorageType = Field(default=StorageType.INMEMORY, description="Storage backend type")
     database_url: str | None = Field(default=None, description="Database connection URL")
     pool_size: int = Field(default=10, description="Connection pool size")
+    max_overflow: int = Field(default=20, description="Connections allowed beyond pool_size under load")
 
 
 class MessageBusConfig(BaseModel):
@@ -66,6 +67,9 @@ class ApplicationConfig(BaseModel):
     shared_read_write_storage: bool = Field(
         default=True, description="Whether to use same storage for reads and writes"
     )
+    read_model_cache_ttl_seconds: float = Field(
+        default=0.0, description="TTL of the in-process library/document read model cache (0 disables it)"
+    )
 
 
 class ApiConfig(BaseModel):
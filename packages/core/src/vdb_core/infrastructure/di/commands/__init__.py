@@ -8,6 +8,7 @@ from .document_commands import (
     provide_upload_document_command,
 )
 from .ingestion_commands import (
+    provide_parse_all_fragments_command,
     provide_parse_document_command,
     provide_process_vectorization_config_command,
 )
@@ -30,6 +31,7 @@ __all__ = [
     "provide_delete_library_command",
     "provide_remove_config_from_library_command",
     # Ingestion commands
+    "provide_parse_all_fragments_command",
     "provide_parse_document_command",
     "provide_process_vectorization_config_command",
     "provide_update_document_command",
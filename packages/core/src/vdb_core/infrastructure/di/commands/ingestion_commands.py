@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING
 
 from vdb_core.application.commands import (
+    ParseAllFragmentsCommand,
     ParseDocumentCommand,
     ProcessVectorizationConfigCommand,
 )
@@ -38,6 +39,29 @@ def provide_parse_document_command(
     )
 
 
+def provide_parse_all_fragments_command(
+    uow_factory: "Callable[[], IUnitOfWork]",
+    message_bus: "IMessageBus",
+    parser: "IParser",
+) -> ParseAllFragmentsCommand:
+    """Provide ParseAllFragmentsCommand with its dependencies.
+
+    Args:
+        uow_factory: Factory function that creates UoW instances
+        message_bus: Message bus for routing events to handlers
+        parser: Service for parsing content (handles modality detection internally)
+
+    Returns:
+        Configured ParseAllFragmentsCommand instance
+
+    """
+    return ParseAllFragmentsCommand(
+        uow_factory=uow_factory,
+        message_bus=message_bus,
+        parser=parser,
+    )
+
+
 def provide_process_vectorization_config_command(
     uow: "IUnitOfWork",
     message_bus: "IMessageBus",
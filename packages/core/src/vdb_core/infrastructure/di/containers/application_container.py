@@ -9,6 +9,7 @@ from vdb_core.application.commands import (
     CreateLibraryCommand,
     DeleteDocumentCommand,
     DeleteLibraryCommand,
+    ParseAllFragmentsCommand,
     ParseDocumentCommand,
     ProcessVectorizationConfigCommand,
     RemoveConfigFromLibraryCommand,
@@ -190,6 +191,22 @@ class ApplicationContainer(BaseContainer):
 
         return self._get_or_create("parse_document_command", factory)
 
+    @property
+    def parse_all_fragments_command(self) -> ParseAllFragmentsCommand:
+        """Get the parse all fragments command (singleton).
+
+        This command is used by the parse_all_fragments Temporal activity.
+        """
+
+        def factory() -> ParseAllFragmentsCommand:
+            return commands.provide_parse_all_fragments_command(
+                uow_factory=self.container.get_unit_of_work,
+                message_bus=self.container.get_message_bus(),
+                parser=self.container.get_parser(),
+            )
+
+        return self._get_or_create("parse_all_fragments_command", factory)
+
     @property
     def process_vectorization_config_command(self) -> ProcessVectorizationConfigCommand:
         """Get the process vectorization config command (singleton).
@@ -215,6 +232,7 @@ class ApplicationContainer(BaseContainer):
         def factory() -> GetLibrariesQuery:
             return GetLibrariesQuery(
                 read_repo_provider_factory=self.container.get_read_repository_provider,
+                cache=self.container.get_read_model_cache(),
             )
 
         return self._get_or_create("get_libraries_query", factory)
@@ -226,6 +244,7 @@ class ApplicationContainer(BaseContainer):
         def factory() -> GetLibraryByIdQuery:
             return GetLibraryByIdQuery(
                 read_repo_provider_factory=self.container.get_read_repository_provider,
+                cache=self.container.get_read_model_cache(),
             )
 
         return self._get_or_create("get_library_by_id_query", factory)
@@ -248,6 +267,7 @@ class ApplicationContainer(BaseContainer):
         def factory() -> GetDocumentByIdQuery:
             return GetDocumentByIdQuery(
                 read_repo_provider_factory=self.container.get_read_repository_provider,
+                cache=self.container.get_read_model_cache(),
             )
 
         return self._get_or_create("get_document_by_id_query", factory)
@@ -1,7 +1,10 @@
 """Main DI container that composes all sub-containers."""
 
+import asyncio
+
 from vdb_core.application.i_unit_of_work import IUnitOfWork
 from vdb_core.application.message_bus import IMessageBus
+from vdb_core.application.read_model_cache import ReadModelCache
 from vdb_core.application.read_repository_provider import ReadRepositoryProvider
 from vdb_core.application.repositories import (
     IChunkReadRepository,
@@ -54,6 +57,31 @@ class DIContainer(BaseContainer):
         # Initialize sub-containers
         self.application = ApplicationContainer(main_container=self)
 
+    async def warmup(self) -> None:
+        """Create the long-lived infrastructure up front instead of on first use.
+
+        Opens the message bus connection, pings the write database so its pool holds a
+        live connection, and builds the strategy resolver (which imports the embedding
+        clients). They are independent, so they run concurrently; the blocking ones go
+        to threads. Call once at process startup, before serving work.
+        """
+        warmups = [
+            asyncio.to_thread(self.get_message_bus),
+            asyncio.to_thread(self.get_strategy_resolver),
+        ]
+        if self.config.get_storage_type().value == "postgres":
+            warmups.append(self._ping_database())
+        await asyncio.gather(*warmups)
+
+    async def _ping_database(self) -> None:
+        """Check out one connection from the shared SQLAlchemy pool and round-trip it."""
+        from sqlalchemy import text
+
+        from vdb_core.infrastructure.persistence.database import DatabaseSessionManager
+
+        async with DatabaseSessionManager.get_engine().connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
     # ==================== Infrastructure ====================
 
     def get_unit_of_work(self) -> IUnitOfWork:
@@ -76,10 +104,64 @@ class DIContainer(BaseContainer):
 
         def factory_fn() -> IMessageBus:
             # Create RabbitMQ bus for event publishing
-            return self.factory.create_message_bus()
+            message_bus = self.factory.create_message_bus()
+            self._register_read_model_cache_handlers(message_bus)
+            return message_bus
 
         return self._get_or_create("message_bus", factory_fn)
 
+    def get_read_model_cache(self) -> ReadModelCache | None:
+        """Get the read model cache (singleton), or None when caching is disabled.
+
+        Enabled by config.application.read_model_cache_ttl_seconds > 0.
+        """
+        ttl_seconds = self.config.application.read_model_cache_ttl_seconds
+        if ttl_seconds <= 0:
+            return None
+
+        return self._get_or_create("read_model_cache", lambda: ReadModelCache(ttl_seconds=ttl_seconds))
+
+    def _register_read_model_cache_handlers(self, message_bus: IMessageBus) -> None:
+        """Invalidate cached read models on library/document events handled in this process.
+
+        Only buses that dispatch to in-process handlers take part; with a broker-backed bus
+        cached entries are bounded by the cache TTL alone.
+        """
+        from vdb_core.application.message_handlers import DocumentMessageHandlers, LibraryMessageHandlers
+        from vdb_core.domain.events import (
+            DocumentCreated,
+            DocumentDeleted,
+            DocumentFragmentReceived,
+            DocumentUpdated,
+            ExtractedContentCreated,
+        )
+        from vdb_core.domain.events.library_events import (
+            LibraryConfigAdded,
+            LibraryConfigRemoved,
+            LibraryCreated,
+            LibraryDeleted,
+            LibraryUpdated,
+        )
+        from vdb_core.infrastructure.message_bus import InMemoryMessageBus
+
+        cache = self.get_read_model_cache()
+        if cache is None or not isinstance(message_bus, InMemoryMessageBus):
+            return
+
+        document_handlers = DocumentMessageHandlers(uow=self.get_unit_of_work(), read_model_cache=cache)
+        message_bus.register_handler(DocumentCreated, document_handlers.on_document_created)
+        message_bus.register_handler(DocumentUpdated, document_handlers.on_document_updated)
+        message_bus.register_handler(DocumentDeleted, document_handlers.on_document_deleted)
+        message_bus.register_handler(DocumentFragmentReceived, document_handlers.on_document_fragment_received)
+        message_bus.register_handler(ExtractedContentCreated, document_handlers.on_extracted_content_created)
+
+        library_handlers = LibraryMessageHandlers(read_model_cache=cache)
+        message_bus.register_handler(LibraryCreated, library_handlers.on_library_created)
+        message_bus.register_handler(LibraryUpdated, library_handlers.on_library_updated)
+        message_bus.register_handler(LibraryDeleted, library_handlers.on_library_deleted)
+        message_bus.register_handler(LibraryConfigAdded, library_handlers.on_library_config_added)
+        message_bus.register_handler(LibraryConfigRemoved, library_handlers.on_library_config_removed)
+
     def get_library_read_repository(self) -> ILibraryReadRepository:
         """Get the Library Read Repository (singleton).
 
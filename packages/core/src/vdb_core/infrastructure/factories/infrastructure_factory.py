@@ -52,6 +52,14 @@ class InfrastructureFactory:
 
         """
         self.config = config
+        if config.get_storage_type() == StorageType.POSTGRES:
+            from vdb_core.infrastructure.persistence.database import DatabaseSessionManager
+
+            # Size the shared write pool that every PostgresUnitOfWork session draws from
+            DatabaseSessionManager.configure(
+                pool_size=config.infrastructure.storage.pool_size,
+                max_overflow=config.infrastructure.storage.max_overflow,
+            )
         self._pg_read_pool = None  # Shared Postgres connection pool for read repositories
         self._pg_write_pool = None  # Shared Postgres connection pool for write operations (UoW)
 
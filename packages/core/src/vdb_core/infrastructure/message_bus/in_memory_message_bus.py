@@ -2,24 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from vdb_core.application.message_bus import IMessageBus
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from vdb_core.domain.events import DomainEvent
 
+    EventHandler = Callable[[DomainEvent], Awaitable[None]]
+
 
 class InMemoryMessageBus(IMessageBus):
     """In-memory implementation of message bus.
 
-    Stores handled events in memory for inspection/testing.
-    Does not route to handlers yet (can be extended).
+    Stores handled events in memory for inspection/testing and routes them to
+    handlers registered for their exact type.
 
     Following Cosmic Python pattern (Chapter 9):
     - Message bus receives events after UoW commit
-    - Routes events to registered handlers
-    - For now: just stores for inspection
+    - Routes events to registered handlers (looked up by type(event), no isinstance scan)
+    - Handlers run concurrently; handlers registered with serial=True run one after
+      another, in registration and event order, per event type
 
     Useful for:
     - Testing: Verify which events were handled
@@ -28,6 +35,7 @@ class InMemoryMessageBus(IMessageBus):
 
     Example:
         message_bus = InMemoryMessageBus()
+        message_bus.register_handler(LibraryCreated, on_library_created)
         await message_bus.handle_events([LibraryCreated(...)])
 
         # Inspect handled events
@@ -39,24 +47,67 @@ class InMemoryMessageBus(IMessageBus):
     def __init__(self) -> None:
         """Initialize empty message bus."""
         self.handled_events: list[DomainEvent] = []
+        self._handlers: defaultdict[type[DomainEvent], list[EventHandler]] = defaultdict(list)
+        self._serial_handlers: defaultdict[type[DomainEvent], list[EventHandler]] = defaultdict(list)
+
+    def register_handler(
+        self,
+        event_type: type[DomainEvent],
+        handler: EventHandler,
+        *,
+        serial: bool = False,
+    ) -> None:
+        """Register a handler for events of exactly `event_type`.
+
+        Args:
+            event_type: Event class to route to the handler
+            handler: Async callable receiving the event
+            serial: Run this handler in order with the other serial handlers of the
+                event type (for ordering-sensitive handlers) instead of concurrently
+
+        """
+        registry = self._serial_handlers if serial else self._handlers
+        registry[event_type].append(handler)
 
     async def handle_events(self, events: list[DomainEvent]) -> None:
         """Handle a batch of domain events.
 
-        For now, just stores events. In full implementation:
-        - Route to registered handlers based on event type
-        - Execute handlers in order
-        - Handle failures/retries
+        Stores the events, then runs every matching handler and returns once all have
+        finished. Independent handlers run concurrently, so the batch takes as long as
+        the slowest handler rather than the sum of all of them. Serial handlers of one
+        event type form a single sequential chain. The first handler error is raised.
 
         Args:
             events: List of domain events to handle
 
         """
+        self.handled_events.extend(events)
+
+        runs: list[Awaitable[None]] = [
+            handler(event) for event in events for handler in self._handlers.get(type(event), ())
+        ]
+
+        serial_events: defaultdict[type[DomainEvent], list[DomainEvent]] = defaultdict(list)
+        for event in events:
+            if type(event) in self._serial_handlers:
+                serial_events[type(event)].append(event)
+        runs.extend(
+            self._run_serial(self._serial_handlers[event_type], same_type_events)
+            for event_type, same_type_events in serial_events.items()
+        )
+
+        if runs:
+            await asyncio.gather(*runs)
+
+    @staticmethod
+    async def _run_serial(handlers: list[EventHandler], events: list[DomainEvent]) -> None:
+        """Run handlers one at a time: each event in order, its handlers in registration order."""
         for event in events:
-            self.handled_events.append(event)
+            for handler in handlers:
+                await handler(event)
 
     def clear(self) -> None:
-        """Clear all handled events (useful for tests)."""
+        """Clear all handled events (useful for tests). Registered handlers are kept."""
         self.handled_events.clear()
 
     def get_events_of_type(self, event_type: type[DomainEvent]) -> list[DomainEvent]:
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import threading
 from dataclasses import asdict, is_dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -129,6 +131,8 @@ class RabbitMQMessageBus(IMessageBus):
 
         self._connection: pika.BlockingConnection | None = None
         self._channel: BlockingChannel | None = None
+        # The blocking connection is not thread-safe: one publishing thread at a time
+        self._publish_lock = threading.Lock()
 
         # Connect and declare exchange
         self._ensure_connection()
@@ -173,6 +177,11 @@ class RabbitMQMessageBus(IMessageBus):
         based on event type. Consumers can subscribe to specific event types
         by binding queues with matching routing patterns.
 
+        Publishing runs in a worker thread: the blocking socket I/O (and a reconnect,
+        or the wait while the broker blocks publishers) then no longer stalls the
+        event loop, so other requests keep running meanwhile. Events of one call are
+        published in order; concurrent calls publish one batch at a time.
+
         Args:
             events: List of domain events to publish
 
@@ -183,44 +192,53 @@ class RabbitMQMessageBus(IMessageBus):
         if not events:
             return
 
-        self._ensure_connection()
+        await asyncio.to_thread(self._publish_batch, events)
+
+    def _publish_batch(self, events: list[DomainEvent]) -> None:
+        """Publish events in order over the blocking channel (runs in a worker thread)."""
+        with self._publish_lock:
+            self._ensure_connection()
+
+            # Ensure channel is available after connection
+            if self._channel is None:
+                msg = "RabbitMQ channel not initialized"
+                raise RuntimeError(msg)
+
+            for event in events:
+                self._publish_event(self._channel, event)
+
+    def _publish_event(self, channel: BlockingChannel, event: DomainEvent) -> None:
+        """Serialize and publish one event."""
+        try:
+            # Serialize event to JSON
+            message = self._serialize_event(event)
+            routing_key = self._get_routing_key(event)
 
-        # Ensure channel is available after connection
-        if self._channel is None:
-            msg = "RabbitMQ channel not initialized"
-            raise RuntimeError(msg)
-
-        for event in events:
-            try:
-                # Serialize event to JSON
-                message = self._serialize_event(event)
-                routing_key = self._get_routing_key(event)
-
-                # Publish to exchange
-                self._channel.basic_publish(
-                    exchange=self.exchange_name,
-                    routing_key=routing_key,
-                    body=message.encode("utf-8"),
-                    properties=pika.BasicProperties(
-                        delivery_mode=2,  # Persistent message
-                        content_type="application/json",
-                        content_encoding="utf-8",
-                        message_id=str(event.event_id),
-                        timestamp=int(event.occurred_at.timestamp()),
-                    ),
-                )
-
-                logger.debug(
-                    "Published event %s to %s with routing key %s",
-                    event.__class__.__name__,
-                    self.exchange_name,
-                    routing_key,
-                )
-
-            except Exception as e:
-                logger.exception("Failed to publish event %s: %s", event.__class__.__name__, e)
-                # Re-raise to fail the request (ensures at-least-once delivery)
-                raise
+            # Publish to exchange
+            channel.basic_publish(
+                exchange=self.exchange_name,
+                routing_key=routing_key,
+                body=message.encode("utf-8"),
+                properties=pika.BasicProperties(
+                    delivery_mode=2,  # Persistent message
+                    content_type="application/json",
+                    content_encoding="utf-8",
+                    message_id=str(event.event_id),
+                    timestamp=int(event.occurred_at.timestamp()),
+                ),
+            )
+
+            logger.debug(
+                "Published event %s to %s with routing key %s",
+                event.__class__.__name__,
+                self.exchange_name,
+                routing_key,
+            )
+
+        except Exception as e:
+            logger.exception("Failed to publish event %s: %s", event.__class__.__name__, e)
+            # Re-raise to fail the request (ensures at-least-once delivery)
+            raise
 
     def _serialize_event(self, event: DomainEvent) -> str:
         """Serialize domain event to JSON string.
@@ -11,10 +11,23 @@ class DatabaseSessionManager:
 
     This is a singleton that creates one engine and one session maker
     for the entire application, preventing connection pool exhaustion.
+    Every session (and so every PostgresUnitOfWork) checks its connection out of
+    the engine's pool and returns it on close.
     """
 
     _engine: AsyncEngine | None = None
     _session_maker: async_sessionmaker[AsyncSession] | None = None
+    _pool_size: int = 10
+    _max_overflow: int = 20
+
+    @classmethod
+    def configure(cls, *, pool_size: int, max_overflow: int) -> None:
+        """Set the connection pool size used when the engine is created.
+
+        Only takes effect before the engine exists (i.e. before the first session).
+        """
+        cls._pool_size = pool_size
+        cls._max_overflow = max_overflow
 
     @classmethod
     def get_engine(cls) -> AsyncEngine:
@@ -32,8 +45,8 @@ class DatabaseSessionManager:
             cls._engine = create_async_engine(
                 database_url,
                 echo=False,
-                pool_size=10,
-                max_overflow=20,
+                pool_size=cls._pool_size,
+                max_overflow=cls._max_overflow,
                 pool_pre_ping=True,  # Verify connections before using
                 pool_recycle=3600,  # Recycle connections after 1 hour
             )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from sqlalchemy import text
@@ -21,7 +21,8 @@ from vdb_core.domain.value_objects import (
 from .postgres_mapper import to_datetime, to_uuid
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable
+    from collections.abc import AsyncIterator, Callable, Mapping
+    from datetime import datetime
 
     from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -49,6 +50,9 @@ class PostgresLibraryRepository(AbstractRepository[Library, LibraryId]):
         """
         super().__init__()
         self.session = session
+        # Persisted state of loaded children, so _update() skips rows that did not change
+        self._persisted_document_versions: dict[DocumentId, datetime] = {}
+        self._persisted_fragment_ids: set[DocumentFragmentId] = set()
 
     def _create_document_loader(
         self, library_id: LibraryId
@@ -65,8 +69,6 @@ class PostgresLibraryRepository(AbstractRepository[Library, LibraryId]):
 
         async def document_loader(document_id: DocumentId | None = None) -> AsyncIterator[Document]:
             """Load documents from database."""
-            from vdb_core.domain.entities.library import Document
-
             if document_id:
                 # Load specific document
                 result = await self.session.execute(
@@ -79,32 +81,7 @@ class PostgresLibraryRepository(AbstractRepository[Library, LibraryId]):
                 )
                 row = result.mappings().one_or_none()
                 if row:
-                    # Create document and set all fields including internal ones
-                    document = object.__new__(Document)
-                    document_id_uuid = to_uuid(row["id"])
-                    object.__setattr__(document, "id", document_id_uuid)
-                    object.__setattr__(document, "library_id", to_uuid(row["library_id"]))
-                    object.__setattr__(document, "name", row["name"])
-                    object.__setattr__(document, "status", row["status"])
-                    object.__setattr__(document, "upload_complete", row["upload_complete"])
-                    object.__setattr__(document, "created_at", to_datetime(row["created_at"]))
-                    object.__setattr__(document, "updated_at", to_datetime(row["updated_at"]))
-
-                    # Initialize LazyCollection for fragments
-                    from vdb_core.domain.base import LazyCollection
-
-                    fragments_collection: LazyCollection[DocumentFragment, DocumentFragmentId] = LazyCollection()
-                    fragments_collection.set_loader(
-                        loader=self._create_fragment_loader(document_id_uuid),
-                        get_id=lambda f: f.id,
-                    )
-                    object.__setattr__(document, "_fragments", fragments_collection)
-
-                    object.__setattr__(document, "_extracted_contents", {})
-                    object.__setattr__(document, "_chunks", {})
-                    object.__setattr__(document, "_chunk_loader", None)
-                    object.__setattr__(document, "events", [])
-                    yield document
+                    yield self._build_document(row)
             else:
                 # Load all documents for library
                 result = await self.session.execute(
@@ -118,35 +95,49 @@ class PostgresLibraryRepository(AbstractRepository[Library, LibraryId]):
                 )
                 rows = result.mappings().all()
                 for row in rows:
-                    # Create document and set all fields including internal ones
-                    from vdb_core.domain.base import LazyCollection
-
-                    document = object.__new__(Document)
-                    document_id_uuid = to_uuid(row["id"])
-                    object.__setattr__(document, "id", document_id_uuid)
-                    object.__setattr__(document, "library_id", to_uuid(row["library_id"]))
-                    object.__setattr__(document, "name", row["name"])
-                    object.__setattr__(document, "status", row["status"])
-                    object.__setattr__(document, "upload_complete", row["upload_complete"])
-                    object.__setattr__(document, "created_at", to_datetime(row["created_at"]))
-                    object.__setattr__(document, "updated_at", to_datetime(row["updated_at"]))
-
-                    # Initialize LazyCollection for fragments
-                    fragments_collection = LazyCollection()
-                    fragments_collection.set_loader(
-                        loader=self._create_fragment_loader(document_id_uuid),
-                        get_id=lambda f: f.id,
-                    )
-                    object.__setattr__(document, "_fragments", fragments_collection)
-
-                    object.__setattr__(document, "_extracted_contents", {})
-                    object.__setattr__(document, "_chunks", {})
-                    object.__setattr__(document, "_chunk_loader", None)
-                    object.__setattr__(document, "events", [])
-                    yield document
+                    yield self._build_document(row)
 
         return document_loader
 
+    def _build_document(self, row: Mapping[str, Any]) -> Document:
+        """Rebuild a Document from a `documents` row, with lazily loaded fragments.
+
+        Args:
+            row: Mapping with the documents table columns
+
+        Returns:
+            The document entity
+
+        """
+        from vdb_core.domain.base import LazyCollection
+        from vdb_core.domain.entities.library import Document
+
+        # Create document and set all fields including internal ones
+        document = object.__new__(Document)
+        document_id_uuid = to_uuid(row["id"])
+        object.__setattr__(document, "id", document_id_uuid)
+        object.__setattr__(document, "library_id", to_uuid(row["library_id"]))
+        object.__setattr__(document, "name", row["name"])
+        object.__setattr__(document, "status", row["status"])
+        object.__setattr__(document, "upload_complete", row["upload_complete"])
+        object.__setattr__(document, "created_at", to_datetime(row["created_at"]))
+        object.__setattr__(document, "updated_at", to_datetime(row["updated_at"]))
+
+        # Initialize LazyCollection for fragments
+        fragments_collection: LazyCollection[DocumentFragment, DocumentFragmentId] = LazyCollection()
+        fragments_collection.set_loader(
+            loader=self._create_fragment_loader(document_id_uuid),
+            get_id=lambda f: f.id,
+        )
+        object.__setattr__(document, "_fragments", fragments_collection)
+
+        object.__setattr__(document, "_extracted_contents", {})
+        object.__setattr__(document, "_chunks", {})
+        object.__setattr__(document, "_chunk_loader", None)
+        object.__setattr__(document, "events", [])
+        self._persisted_document_versions[document_id_uuid] = document.updated_at
+        return document
+
     def _create_fragment_loader(self, document_id: DocumentId) -> Callable[[DocumentFragmentId | None], AsyncIterator[DocumentFragment]]:
         """Create a fragment loader function for lazy loading document fragments.
 
@@ -165,8 +156,6 @@ class PostgresLibraryRepository(AbstractRepository[Library, LibraryId]):
                 fragment_id: Optional fragment ID to load a specific fragment. If None, loads all fragments.
 
             """
-            from vdb_core.domain.value_objects import ContentHash
-
             # Build query based on whether we're loading a specific fragment or all
             if fragment_id is not None:
                 query = text("""
@@ -189,19 +178,34 @@ class PostgresLibraryRepository(AbstractRepository[Library, LibraryId]):
             fragment_rows = fragments_result.mappings().all()
 
             for frag_row in fragment_rows:
-                fragment = object.__new__(DocumentFragment)
-                object.__setattr__(fragment, "id", to_uuid(frag_row["id"]))
-                object.__setattr__(fragment, "document_id", to_uuid(frag_row["document_id"]))
-                object.__setattr__(fragment, "sequence_number", frag_row["sequence_number"])
-                object.__setattr__(fragment, "content", frag_row["content"])
-                object.__setattr__(fragment, "content_hash", ContentHash(value=frag_row["content_hash"]))
-                object.__setattr__(fragment, "is_last_fragment", frag_row["is_final"])
-                object.__setattr__(fragment, "created_at", to_datetime(frag_row["created_at"]))
-                object.__setattr__(fragment, "events", [])  # Initialize events list
-                yield fragment
+                yield self._build_fragment(frag_row)
 
         return fragment_loader
 
+    def _build_fragment(self, row: Mapping[str, Any]) -> DocumentFragment:
+        """Rebuild a DocumentFragment from a `document_fragments` row.
+
+        Args:
+            row: Mapping with the document_fragments table columns
+
+        Returns:
+            The document fragment entity
+
+        """
+        from vdb_core.domain.value_objects import ContentHash
+
+        fragment = object.__new__(DocumentFragment)
+        object.__setattr__(fragment, "id", to_uuid(row["id"]))
+        object.__setattr__(fragment, "document_id", to_uuid(row["document_id"]))
+        object.__setattr__(fragment, "sequence_number", row["sequence_number"])
+        object.__setattr__(fragment, "content", row["content"])
+        object.__setattr__(fragment, "content_hash", ContentHash(value=row["content_hash"]))
+        object.__setattr__(fragment, "is_last_fragment", row["is_final"])
+        object.__setattr__(fragment, "created_at", to_datetime(row["created_at"]))
+        object.__setattr__(fragment, "events", [])  # Initialize events list
+        self._persisted_fragment_ids.add(fragment.id)
+        return fragment
+
     async def _add(self, entity: Library) -> None:
         """Persist library to database.
 
@@ -391,6 +395,7 @@ class PostgresLibraryRepository(AbstractRepository[Library, LibraryId]):
         from vdb_core.domain.events.extracted_content_events import ExtractedContentCreated
         from vdb_core.domain.events.library_events import LibraryConfigAdded, LibraryConfigRemoved
 
+        added_configs: list[dict[str, str]] = []
         for event in entity.events:
             if isinstance(event, DocumentDeleted):
                 # Delete document from database (CASCADE deletes fragments, chunks, embeddings)
@@ -451,24 +456,17 @@ class PostgresLibraryRepository(AbstractRepository[Library, LibraryId]):
                         },
                     )
             elif isinstance(event, LibraryConfigAdded):
-                # Insert association into junction table (idempotent)
-                await self.session.execute(
-                    text(
-                        """
-                        INSERT INTO library_vectorization_configs (
-                            library_id, vectorization_config_id, created_at, updated_at
-                        ) VALUES (
-                            :library_id, :config_id, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
-                        )
-                        ON CONFLICT (library_id, vectorization_config_id) DO NOTHING
-                        """
-                    ),
+                # Collected and inserted together (a new library gets every config at once)
+                added_configs.append(
                     {
                         "library_id": str(event.library_id),
                         "config_id": str(event.config_id),
-                    },
+                    }
                 )
             elif isinstance(event, LibraryConfigRemoved):
+                # Earlier additions go in first so an add-then-remove still ends removed
+                await self._insert_config_associations(added_configs)
+                added_configs = []
                 # Remove association from junction table (if exists)
                 await self.session.execute(
                     text(
@@ -483,6 +481,31 @@ class PostgresLibraryRepository(AbstractRepository[Library, LibraryId]):
                     },
                 )
 
+        await self._insert_config_associations(added_configs)
+
+    async def _insert_config_associations(self, rows: list[dict[str, str]]) -> None:
+        """Insert library-config associations into the junction table in one executemany (idempotent).
+
+        Args:
+            rows: Parameter dicts with library_id and config_id
+
+        """
+        if not rows:
+            return
+        await self.session.execute(
+            text(
+                """
+                INSERT INTO library_vectorization_configs (
+                    library_id, vectorization_config_id, created_at, updated_at
+                ) VALUES (
+                    :library_id, :config_id, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+                )
+                ON CONFLICT (library_id, vectorization_config_id) DO NOTHING
+                """
+            ),
+            rows,
+        )
+
     async def _update(self, entity: Library) -> None:
         """Update library in database.
 
@@ -518,30 +541,35 @@ class PostgresLibraryRepository(AbstractRepository[Library, LibraryId]):
         # Persist documents (Library is aggregate root, responsible for child entities)
         # Access private _documents dict directly since it's internal to the aggregate
         for document in entity._documents.values():
-            # Upsert document (insert or update if exists)
-            await self.session.execute(
-                text("""
-                    INSERT INTO documents (id, library_id, name, status, upload_complete, created_at, updated_at)
-                    VALUES (:id, :library_id, :name, :status, :upload_complete, :created_at, :updated_at)
-                    ON CONFLICT (id) DO UPDATE SET
-                        name = EXCLUDED.name,
-                        status = EXCLUDED.status,
-                        upload_complete = EXCLUDED.upload_complete,
-                        updated_at = EXCLUDED.updated_at
-                """),
-                {
-                    "id": str(document.id),
-                    "library_id": str(entity.id),
-                    "name": document.name,
-                    "status": document.status,
-                    "upload_complete": document.upload_complete,
-                    "created_at": document.created_at,
-                    "updated_at": document.updated_at,
-                },
-            )
+            # Upsert document (insert or update if exists), unless unchanged since it was loaded
+            if self._persisted_document_versions.get(document.id) != document.updated_at:
+                await self.session.execute(
+                    text("""
+                        INSERT INTO documents (id, library_id, name, status, upload_complete, created_at, updated_at)
+                        VALUES (:id, :library_id, :name, :status, :upload_complete, :created_at, :updated_at)
+                        ON CONFLICT (id) DO UPDATE SET
+                            name = EXCLUDED.name,
+                            status = EXCLUDED.status,
+                            upload_complete = EXCLUDED.upload_complete,
+                            updated_at = EXCLUDED.updated_at
+                    """),
+                    {
+                        "id": str(document.id),
+                        "library_id": str(entity.id),
+                        "name": document.name,
+                        "status": document.status,
+                        "upload_complete": document.upload_complete,
+                        "created_at": document.created_at,
+                        "updated_at": document.updated_at,
+                    },
+                )
+                self._persisted_document_versions[document.id] = document.updated_at
 
-            # Persist document fragments (only cached items, not lazy-loaded)
+            # Persist document fragments (only cached items, not lazy-loaded).
+            # Fragments are immutable, so ones loaded from the database are not sent back.
             for fragment in document._fragments.cached_items:
+                if fragment.id in self._persisted_fragment_ids:
+                    continue
                 await self.session.execute(
                     text("""
                         INSERT INTO document_fragments (id, document_id, sequence_number, content, content_hash, is_final, created_at)
@@ -558,6 +586,7 @@ class PostgresLibraryRepository(AbstractRepository[Library, LibraryId]):
                         "created_at": fragment.created_at,
                     },
                 )
+                self._persisted_fragment_ids.add(fragment.id)
 
     async def _delete(self, id: LibraryId) -> None:
         """Hard delete a library by ID (removes from database).
@@ -754,6 +783,69 @@ class PostgresLibraryRepository(AbstractRepository[Library, LibraryId]):
         library_id = LibraryId(str(row["library_id"]))
         return await self.get(library_id)
 
+    async def get_with_document_fragment(
+        self,
+        library_id: LibraryId,
+        document_id: DocumentId,
+        fragment_id: DocumentFragmentId,
+    ) -> tuple[Library, Document, DocumentFragment]:
+        """Get a library together with one of its documents and one fragment of that document.
+
+        The document and fragment rows are fetched with a single joined query and cached on
+        the aggregate, instead of the two lookups `library.get_document()` followed by
+        `document.get_fragment()` would issue. Mutations still go through the library.
+
+        Args:
+            library_id: Library ID
+            document_id: Document ID within the library
+            fragment_id: Fragment ID within the document
+
+        Returns:
+            Tuple of (library, document, fragment)
+
+        Raises:
+            LibraryNotFoundError: If library does not exist
+            ValueError: If the document or fragment does not exist
+
+        """
+        library = await self.get(library_id)
+
+        if document_id not in library._documents:
+            result = await self.session.execute(
+                text("""
+                    SELECT
+                        d.id, d.library_id, d.name, d.status, d.upload_complete, d.created_at, d.updated_at,
+                        f.id AS fragment_id, f.sequence_number, f.content, f.content_hash, f.is_final,
+                        f.created_at AS fragment_created_at
+                    FROM documents d
+                    JOIN document_fragments f ON f.document_id = d.id
+                    WHERE d.library_id = :library_id AND d.id = :document_id AND f.id = :fragment_id
+                """),
+                {"library_id": str(library_id), "document_id": str(document_id), "fragment_id": str(fragment_id)},
+            )
+            row = result.mappings().one_or_none()
+            if row:
+                document = self._build_document(row)
+                document._fragments.add_to_cache(
+                    self._build_fragment(
+                        {
+                            "id": row["fragment_id"],
+                            "document_id": row["id"],
+                            "sequence_number": row["sequence_number"],
+                            "content": row["content"],
+                            "content_hash": row["content_hash"],
+                            "is_final": row["is_final"],
+                            "created_at": row["fragment_created_at"],
+                        }
+                    )
+                )
+                library._documents[document.id] = document
+
+        # Served from the aggregate's caches when the joined row was found
+        document = await library.get_document(document_id)
+        fragment = await document.get_fragment(fragment_id)
+        return library, document, fragment
+
     def collect_events(self) -> list[DomainEvent]:
         """Collect domain events from all tracked entities.
 
@@ -10,8 +10,9 @@ from vdb_core.domain.repositories import AbstractRepository
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
-    from vdb_core.domain.entities import Library
-    from vdb_core.domain.value_objects import LibraryId
+    from vdb_core.domain.entities import Document, Library
+    from vdb_core.domain.entities.library import DocumentFragment
+    from vdb_core.domain.value_objects import DocumentFragmentId, DocumentId, LibraryId
 
 
 class InMemoryLibraryRepository(AbstractRepository["Library", "LibraryId"]):
@@ -184,6 +185,32 @@ class InMemoryLibraryRepository(AbstractRepository["Library", "LibraryId"]):
         msg = f"No library found containing document {document_id}"
         raise ValueError(msg)
 
+    async def get_with_document_fragment(
+        self,
+        library_id: LibraryId,
+        document_id: DocumentId,
+        fragment_id: DocumentFragmentId,
+    ) -> tuple[Library, Document, DocumentFragment]:
+        """Get a library together with one of its documents and one fragment of that document.
+
+        Args:
+            library_id: Library ID
+            document_id: Document ID within the library
+            fragment_id: Fragment ID within the document
+
+        Returns:
+            Tuple of (library, document, fragment)
+
+        Raises:
+            EntityNotFoundError: If library does not exist
+            ValueError: If the document or fragment does not exist
+
+        """
+        library = await self.get(library_id)
+        document = await library.get_document(document_id)
+        fragment = await document.get_fragment(fragment_id)
+        return library, document, fragment
+
     def __len__(self) -> int:
         """Get count of libraries in storage."""
         return len(self._storage)
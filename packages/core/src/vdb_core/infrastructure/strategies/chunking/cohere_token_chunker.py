@@ -106,27 +106,16 @@ class CohereTokenChunker:
         if len(tokens) <= self.chunk_size:
             return [text]
 
-        # Split tokens into overlapping chunks
-        chunks = []
-        start = 0
-
-        while start < len(tokens):
-            # Get chunk tokens
-            end = min(start + self.chunk_size, len(tokens))
-            chunk_tokens = tokens[start:end]
-
-            # Ensure we don't exceed max_tokens
-            if len(chunk_tokens) > self.max_tokens:
-                chunk_tokens = chunk_tokens[: self.max_tokens]
-
-            # Detokenize back to text
-            detokenized = self.client.detokenize(tokens=chunk_tokens, model="embed-english-v3.0")
-            chunk_text = detokenized.text
-            chunks.append(str(chunk_text))
-
-            # Move forward by (chunk_size - overlap)
-            # Ensure we make progress even with large overlap
-            step = max(1, self.chunk_size - self.chunk_overlap)
-            start += step
+        # Split tokens into overlapping windows. Window starts step by (chunk_size - overlap),
+        # always making progress even with large overlap; each window is capped at
+        # max_tokens. Both are loop-invariant, so the starts come straight from range()
+        step = max(1, self.chunk_size - self.chunk_overlap)
+        window = min(self.chunk_size, self.max_tokens)
+
+        # Detokenize each window back to text
+        chunks = [
+            str(self.client.detokenize(tokens=tokens[start : start + window], model="embed-english-v3.0").text)
+            for start in range(0, len(tokens), step)
+        ]
 
         return chunks  # type: ignore[return-value]
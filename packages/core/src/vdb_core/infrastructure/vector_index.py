@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import logging
+import math
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
 
 import numpy as np
 from numpy.typing import NDArray
@@ -13,7 +17,16 @@ logger = logging.getLogger(__name__)
 
 
 class VectorIndex:
-    """In-memory vector index using NumPy."""
+    """In-memory vector index using NumPy.
+
+    Removal flips a bit in ``active_mask`` instead of rewriting the arrays; search
+    skips inactive rows. Storage is compacted once more than
+    ``_COMPACT_DELETED_FRACTION`` of the rows are inactive, so deletes cost O(1)
+    amortized rather than an O(n) array copy and id-map rebuild each.
+    """
+
+    _COMPACT_DELETED_FRACTION = 0.25
+    _INITIAL_MASK_CAPACITY = 1024
 
     def __init__(
         self, dimensions: int, strategy: str, metric: VectorSimilarityMetric = VectorSimilarityMetric.L2
@@ -33,7 +46,10 @@ class VectorIndex:
         # Store vectors as numpy array
         self.vectors: NDArray[np.float32] | None = None  # Shape: (n_vectors, dimensions)
         self.embedding_ids: list[str] = []  # Embedding IDs in same order as vectors
-        self.id_to_index: dict[str, int] = {}  # embedding_id -> index mapping
+        self.id_to_index: dict[str, int] = {}  # embedding_id -> index mapping (live ids only)
+        # Preallocated, doubled when full so adds cost O(1) amortized; rows past len(embedding_ids) are unused
+        self._mask_buffer: NDArray[np.bool_] = np.zeros(0, dtype=np.bool_)
+        self.deleted_count = 0
 
     def add(self, embedding_id: str, vector: list[float]) -> None:
         """Add vector to index.
@@ -60,6 +76,16 @@ class VectorIndex:
         idx = len(self.embedding_ids)
         self.embedding_ids.append(embedding_id)
         self.id_to_index[embedding_id] = idx
+        if idx == len(self._mask_buffer):
+            grown = np.zeros(max(2 * idx, self._INITIAL_MASK_CAPACITY), dtype=np.bool_)
+            grown[:idx] = self._mask_buffer
+            self._mask_buffer = grown
+        self._mask_buffer[idx] = True
+
+    @property
+    def active_mask(self) -> NDArray[np.bool_]:
+        """Get the per-row liveness mask (False for removed rows), one entry per stored row."""
+        return self._mask_buffer[: len(self.embedding_ids)]
 
     def search(self, query_vector: list[float], k: int) -> tuple[list[str], list[float]]:
         """Search for k nearest neighbors.
@@ -72,7 +98,7 @@ class VectorIndex:
             Tuple of (embedding_ids, scores)
 
         """
-        if self.vectors is None or len(self.embedding_ids) == 0:
+        if self.vectors is None or self.count == 0:
             return [], []
 
         # Convert query to numpy array
@@ -96,7 +122,7 @@ class VectorIndex:
         elif self.metric == VectorSimilarityMetric.COSINE:
             # Cosine similarity: (a · b) / (||a|| * ||b||)
             # Normalize vectors
-            query_norm = query_array / np.linalg.norm(query_array)
+            query_norm = query_array / math.sqrt(float(query_array @ query_array))
             vectors_norm = self.vectors / np.linalg.norm(self.vectors, axis=1, keepdims=True)
             # Compute cosine similarity
             scores = np.dot(vectors_norm, query_norm)
@@ -113,8 +139,12 @@ class VectorIndex:
             msg = f"Unknown similarity metric: {self.metric}"
             raise ValueError(msg)
 
+        # Removed rows still occupy slots until compaction; drop them from the ranking
+        if self.deleted_count:
+            sorted_indices = sorted_indices[self.active_mask[sorted_indices]]
+
         # Get top k results
-        k = min(k, len(self.embedding_ids))
+        k = min(k, self.count)
         top_k_indices = sorted_indices[:k]
 
         # Map back to embedding IDs and scores
@@ -133,34 +163,53 @@ class VectorIndex:
             True if removed, False if not found
 
         """
-        if embedding_id not in self.id_to_index:
+        removed = self._deactivate(embedding_id)
+        self._maybe_compact()
+        return removed
+
+    def remove_many(self, embedding_ids: list[str]) -> int:
+        """Remove several vectors, compacting at most once at the end.
+
+        Args:
+            embedding_ids: UUIDs of embeddings to remove
+
+        Returns:
+            Number of embeddings removed (ids not in the index are skipped)
+
+        """
+        removed = sum(self._deactivate(embedding_id) for embedding_id in embedding_ids)
+        self._maybe_compact()
+        return removed
+
+    def _deactivate(self, embedding_id: str) -> bool:
+        """Mark an embedding's row inactive; returns False if it is not in the index."""
+        idx = self.id_to_index.pop(embedding_id, None)
+        if idx is None:
             return False
+        self._mask_buffer[idx] = False
+        self.deleted_count += 1
+        return True
 
-        # Get index to remove
-        idx_to_remove = self.id_to_index[embedding_id]
+    def _maybe_compact(self) -> None:
+        """Drop inactive rows once they exceed the compaction threshold."""
+        if self.deleted_count <= self._COMPACT_DELETED_FRACTION * len(self.embedding_ids):
+            return
 
-        # Remove from vectors array
+        keep = self.active_mask
         if self.vectors is not None:
-            mask = np.ones(len(self.embedding_ids), dtype=bool)
-            mask[idx_to_remove] = False
-            self.vectors = self.vectors[mask]
-
+            self.vectors = self.vectors[keep]
             # Handle empty case
             if self.vectors.shape[0] == 0:
                 self.vectors = None
-
-        # Remove from ID list
-        self.embedding_ids.pop(idx_to_remove)
-
-        # Rebuild ID mapping (indices shifted after removal)
+        self.embedding_ids = [eid for eid, alive in zip(self.embedding_ids, keep.tolist(), strict=True) if alive]
         self.id_to_index = {eid: i for i, eid in enumerate(self.embedding_ids)}
-
-        return True
+        self._mask_buffer = np.ones(len(self.embedding_ids), dtype=np.bool_)
+        self.deleted_count = 0
 
     @property
     def count(self) -> int:
         """Get number of vectors in index."""
-        return len(self.embedding_ids)
+        return len(self.embedding_ids) - self.deleted_count
 
 
 class VectorIndexManager:
@@ -180,7 +229,10 @@ class VectorIndexManager:
 
         """
         self.metric = metric
-        self.indices: dict[tuple[str, str], VectorIndex] = {}  # (library_id, config_id) -> VectorIndex
+        # (library_id, config_id) -> VectorIndex. Readers use the published read-only snapshot;
+        # writers copy it under _indices_lock and swap in a new one (read-copy-update).
+        self.indices: Mapping[tuple[str, str], VectorIndex] = MappingProxyType({})
+        self._indices_lock = threading.Lock()
 
     def get_or_create_index(
         self,
@@ -205,10 +257,20 @@ class VectorIndexManager:
         """
         key = (library_id, config_id)
 
-        if key not in self.indices:
+        index = self.indices.get(key)
+        if index is not None:
+            return index
+
+        with self._indices_lock:
+            # Another writer may have published this key while we waited
+            index = self.indices.get(key)
+            if index is not None:
+                return index
+
             # Use provided metric or fall back to manager's default
             index_metric = metric if metric is not None else self.metric
-            self.indices[key] = self._create_index(dimensions, strategy, index_metric)
+            index = self._create_index(dimensions, strategy, index_metric)
+            self.indices = MappingProxyType({**self.indices, key: index})
             logger.info(
                 "Created %s index with %s metric for library=%s, config=%s, dimensions=%s",
                 strategy,
@@ -218,7 +280,7 @@ class VectorIndexManager:
                 dimensions,
             )
 
-        return self.indices[key]
+        return index
 
     def _create_index(
         self, dimensions: int, strategy: str, metric: VectorSimilarityMetric
@@ -305,21 +367,14 @@ class VectorIndexManager:
             Tuple of (removed_count, not_found_count)
 
         """
-        key = (library_id, config_id)
+        index = self.indices.get((library_id, config_id))
 
-        if key not in self.indices:
+        if index is None:
             logger.warning("No index found for library=%s, config=%s", library_id, config_id)
             return 0, len(embedding_ids)
 
-        index = self.indices[key]
-        removed = 0
-        not_found = 0
-
-        for embedding_id in embedding_ids:
-            if index.remove(embedding_id):
-                removed += 1
-            else:
-                not_found += 1
+        removed = index.remove_many(embedding_ids)
+        not_found = len(embedding_ids) - removed
 
         logger.info(
             "Removed %s embeddings from index (library=%s, config=%s), %s not found",
@@ -346,13 +401,13 @@ class VectorIndexManager:
             Tuple of (embedding_ids, scores)
 
         """
-        key = (library_id, config_id)
+        index = self.indices.get((library_id, config_id))
 
-        if key not in self.indices:
+        if index is None:
             logger.warning("No index found for library=%s, config=%s", library_id, config_id)
             return [], []
 
-        return self.indices[key].search(query_vector, k)
+        return index.search(query_vector, k)
 
     def get_stats(self) -> list[dict[str, object]]:
         """Get statistics for all indices.
@@ -395,27 +450,47 @@ class VectorIndexManager:
             raise RuntimeError(msg)
 
         try:
-            offset = 0
             total_indexed = 0
+            # Keyset cursor: each page resumes after the last (library, config, id)
+            # seen, so Postgres seeks via the index instead of re-scanning an OFFSET.
+            last_key: tuple[object, object, object] | None = None
 
             while True:
-                rows = await pool.fetch(
-                    """
-                    SELECT e.id, e.library_id, e.vectorization_config_id, e.vector, e.dimensions,
-                           vc.vector_indexing_strategy, vc.similarity_metric
-                    FROM embeddings e
-                    JOIN vectorization_configs vc
-                      ON e.vectorization_config_id = vc.id
-                    ORDER BY e.library_id, e.vectorization_config_id
-                    LIMIT $1 OFFSET $2
-                    """,
-                    batch_size,
-                    offset,
-                )
+                if last_key is None:
+                    rows = await pool.fetch(
+                        """
+                        SELECT e.id, e.library_id, e.vectorization_config_id, e.vector, e.dimensions,
+                               vc.vector_indexing_strategy, vc.similarity_metric
+                        FROM embeddings e
+                        JOIN vectorization_configs vc
+                          ON e.vectorization_config_id = vc.id
+                        ORDER BY e.library_id, e.vectorization_config_id, e.id
+                        LIMIT $1
+                        """,
+                        batch_size,
+                    )
+                else:
+                    rows = await pool.fetch(
+                        """
+                        SELECT e.id, e.library_id, e.vectorization_config_id, e.vector, e.dimensions,
+                               vc.vector_indexing_strategy, vc.similarity_metric
+                        FROM embeddings e
+                        JOIN vectorization_configs vc
+                          ON e.vectorization_config_id = vc.id
+                        WHERE (e.library_id, e.vectorization_config_id, e.id) > ($2, $3, $4)
+                        ORDER BY e.library_id, e.vectorization_config_id, e.id
+                        LIMIT $1
+                        """,
+                        batch_size,
+                        *last_key,
+                    )
 
                 if not rows:
                     break
 
+                last = rows[-1]
+                last_key = (last["library_id"], last["vectorization_config_id"], last["id"])
+
                 # Index batch
                 for row in rows:
                     try:
@@ -439,7 +514,6 @@ class VectorIndexManager:
                     except Exception as e:
                         logger.exception("Failed to index embedding %s: %s", row["id"], str(e))
 
-                offset += batch_size
                 logger.info("Indexed %s embeddings...", total_indexed)
 
             logger.info("Bootstrap complete. Total indexed: %s", total_indexed)
@@ -460,7 +534,9 @@ class VectorIndexRegistry:
 
     def __init__(self) -> None:
         """Initialize empty registry."""
-        self._managers: dict[str, VectorIndexManager] = {}
+        # Read-only snapshot swapped on every mutation, so lookups never take the lock
+        self._managers: Mapping[str, VectorIndexManager] = MappingProxyType({})
+        self._lock = threading.Lock()
 
     def get_or_create_manager(
         self,
@@ -477,11 +553,18 @@ class VectorIndexRegistry:
             VectorIndexManager for this config
 
         """
-        if config_id not in self._managers:
-            self._managers[config_id] = VectorIndexManager(metric=metric)
-            logger.info("Created VectorIndexManager for config %s with %s metric", config_id, metric.value)
+        manager = self._managers.get(config_id)
+        if manager is not None:
+            return manager
+
+        with self._lock:
+            manager = self._managers.get(config_id)
+            if manager is None:
+                manager = VectorIndexManager(metric=metric)
+                self._managers = MappingProxyType({**self._managers, config_id: manager})
+                logger.info("Created VectorIndexManager for config %s with %s metric", config_id, metric.value)
 
-        return self._managers[config_id]
+        return manager
 
     def get_manager(self, config_id: str) -> VectorIndexManager | None:
         """Get VectorIndexManager for a config, if it exists.
@@ -502,9 +585,10 @@ class VectorIndexRegistry:
             config_id: VectorizationConfig ID
 
         """
-        if config_id in self._managers:
-            del self._managers[config_id]
-            logger.info("Removed VectorIndexManager for config %s", config_id)
+        with self._lock:
+            if config_id in self._managers:
+                self._managers = MappingProxyType({k: v for k, v in self._managers.items() if k != config_id})
+                logger.info("Removed VectorIndexManager for config %s", config_id)
 
     def get_stats(self) -> dict[str, list[dict[str, object]]]:
         """Get statistics for all managed indices.
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -49,7 +50,7 @@ class CosineSimilarityStrategy(INearestVectorStrategy):
 
         # Convert query to numpy array
         query_array = np.array(query_vector, dtype=np.float32)
-        query_norm = np.linalg.norm(query_array)
+        query_norm = math.sqrt(float(query_array @ query_array))
 
         # Avoid division by zero for zero vectors
         if query_norm == 0:
@@ -59,7 +60,7 @@ class CosineSimilarityStrategy(INearestVectorStrategy):
         similarities: list[tuple[Embedding, float]] = []
         for embedding in candidates:
             candidate_array = np.array(embedding.vector, dtype=np.float32)
-            candidate_norm = np.linalg.norm(candidate_array)
+            candidate_norm = math.sqrt(float(candidate_array @ candidate_array))
 
             # Handle zero vectors
             if candidate_norm == 0:
@@ -1,5 +1,6 @@
 """Utility functions and helpers."""
 
 from .dt_utils import utc_now
+from .uuid_utils import parse_uuid
 
-__all__ = ["utc_now"]
+__all__ = ["parse_uuid", "utc_now"]
@@ -0,0 +1,14 @@
+"""UUID utilities."""
+
+from functools import lru_cache
+from uuid import UUID
+
+
+@lru_cache(maxsize=4096)
+def parse_uuid(value: str) -> UUID:
+    """Parse a UUID string, memoized.
+
+    The same library/document/config ids are parsed over and over by commands run
+    from activities; UUIDs are immutable, so the parsed instance can be shared.
+    """
+    return UUID(value)
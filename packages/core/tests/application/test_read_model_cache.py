@@ -0,0 +1,110 @@
+"""Tests for ReadModelCache."""
+
+import asyncio
+
+import pytest
+from vdb_core.application.queries import GetDocumentByIdQuery, GetLibrariesQuery, GetLibraryByIdQuery
+from vdb_core.application.read_model_cache import ReadModelCache
+
+
+def _loader(value: str, calls: list[str], delay: float = 0.0):  # type: ignore[no-untyped-def]
+    async def load() -> str:
+        calls.append(value)
+        await asyncio.sleep(delay)
+        return value
+
+    return load
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load() -> None:
+    """Test that a hot key is loaded once, by concurrent and later callers alike."""
+    cache = ReadModelCache(ttl_seconds=60)
+    query = GetLibraryByIdQuery(library_id="lib-1")
+    calls: list[str] = []
+
+    results = await asyncio.gather(
+        *(cache.get_or_load(query, _loader("v1", calls, delay=0.01), library_id="lib-1") for _ in range(5))
+    )
+    again = await cache.get_or_load(GetLibraryByIdQuery(library_id="lib-1"), _loader("v2", calls), library_id="lib-1")
+
+    assert results == ["v1"] * 5
+    assert again == "v1"
+    assert calls == ["v1"]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_library_drops_its_entries_and_cross_library_lists() -> None:
+    """Test that invalidating a library keeps other libraries' entries."""
+    cache = ReadModelCache(ttl_seconds=60)
+    calls: list[str] = []
+    await cache.get_or_load(GetLibrariesQuery(), _loader("all", calls))
+    await cache.get_or_load(GetLibraryByIdQuery(library_id="lib-1"), _loader("lib-1", calls), library_id="lib-1")
+    await cache.get_or_load(
+        GetDocumentByIdQuery(library_id="lib-2", document_id="doc-1"), _loader("doc-1", calls), library_id="lib-2"
+    )
+
+    cache.invalidate_library("lib-1")
+
+    assert len(cache) == 1
+    await cache.get_or_load(
+        GetDocumentByIdQuery(library_id="lib-2", document_id="doc-1"), _loader("reloaded", calls), library_id="lib-2"
+    )
+    assert calls == ["all", "lib-1", "doc-1"]
+
+
+@pytest.mark.asyncio
+async def test_load_overlapping_invalidation_is_not_stored() -> None:
+    """Test that a value loaded before an invalidation is not served afterwards."""
+    cache = ReadModelCache(ttl_seconds=60)
+    query = GetLibraryByIdQuery(library_id="lib-1")
+    calls: list[str] = []
+
+    pending = asyncio.create_task(cache.get_or_load(query, _loader("stale", calls, delay=0.01), library_id="lib-1"))
+    await asyncio.sleep(0)
+    cache.invalidate_library("lib-1")
+
+    assert await pending == "stale"
+    assert await cache.get_or_load(query, _loader("fresh", calls), library_id="lib-1") == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_expired_and_least_recently_used_entries_are_reloaded() -> None:
+    """Test TTL expiry and LRU eviction."""
+    calls: list[str] = []
+    expiring = ReadModelCache(ttl_seconds=0)
+    await expiring.get_or_load("key", _loader("first", calls))
+    assert await expiring.get_or_load("key", _loader("second", calls)) == "second"
+
+    bounded = ReadModelCache(ttl_seconds=60, max_entries=2)
+    await bounded.get_or_load("a", _loader("a", calls))
+    await bounded.get_or_load("b", _loader("b", calls))
+    await bounded.get_or_load("a", _loader("a-again", calls))  # hit: "b" is now least recently used
+    await bounded.get_or_load("c", _loader("c", calls))
+
+    assert await bounded.get_or_load("a", _loader("a-reloaded", calls)) == "a"
+    assert await bounded.get_or_load("b", _loader("b-reloaded", calls)) == "b-reloaded"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_keeps_unrelated_loads_in_flight() -> None:
+    """Test that invalidating one key or library still stores other keys' in-flight loads."""
+    cache = ReadModelCache(ttl_seconds=60)
+    calls: list[str] = []
+    lib_1 = GetLibraryByIdQuery(library_id="lib-1")
+    lib_2 = GetLibraryByIdQuery(library_id="lib-2")
+    doc = GetDocumentByIdQuery(library_id="lib-2", document_id="doc-1")
+
+    pending = [
+        asyncio.create_task(cache.get_or_load(lib_1, _loader("lib-1", calls, delay=0.01), library_id="lib-1")),
+        asyncio.create_task(cache.get_or_load(lib_2, _loader("lib-2", calls, delay=0.01), library_id="lib-2")),
+        asyncio.create_task(cache.get_or_load(doc, _loader("doc-1", calls, delay=0.01), library_id="lib-2")),
+    ]
+    await asyncio.sleep(0)
+    cache.invalidate_library("lib-1")
+    cache.invalidate(lib_2)
+    await asyncio.gather(*pending)
+
+    assert await cache.get_or_load(lib_1, _loader("lib-1 reloaded", calls), library_id="lib-1") == "lib-1 reloaded"
+    assert await cache.get_or_load(lib_2, _loader("lib-2 reloaded", calls), library_id="lib-2") == "lib-2 reloaded"
+    assert await cache.get_or_load(doc, _loader("doc-1 reloaded", calls), library_id="lib-2") == "doc-1"
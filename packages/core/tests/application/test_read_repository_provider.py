@@ -0,0 +1,39 @@
+"""Tests for ReadRepositoryProvider."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from vdb_core.application.read_repository_provider import ReadRepositoryProvider
+
+
+def _provider() -> ReadRepositoryProvider:
+    return ReadRepositoryProvider(
+        library_read_repository_factory=MagicMock,
+        document_read_repository_factory=MagicMock,
+        chunk_read_repository_factory=MagicMock,
+        event_log_read_repository_factory=MagicMock,
+        vectorization_config_read_repository_factory=MagicMock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_repositories_raise_outside_context() -> None:
+    """Test that repositories used outside the context raise instead of returning None."""
+    provider = _provider()
+
+    async with provider:
+        assert isinstance(provider.documents, MagicMock)
+
+    with pytest.raises(RuntimeError, match="Documents repository not initialized"):
+        await provider.documents.get_by_id("library-id", "document-id")
+
+
+@pytest.mark.asyncio
+async def test_unconfigured_optional_repository_is_falsy() -> None:
+    """Test that an optional repository without a factory still reads as not configured."""
+    provider = _provider()
+
+    async with provider:
+        assert not provider.queries
+        with pytest.raises(RuntimeError, match="Queries repository not initialized"):
+            provider.queries.get_all_in_library  # noqa: B018
@@ -161,3 +161,18 @@ class TestBatchChunks:
         # Assert: content matches original order
         expected = b"A" * 700_000 + b"B" * 700_000
         assert full_content == expected
+
+    async def test_batch_chunks_passes_single_chunk_through(self) -> None:
+        """Test that a lone chunk below the limit is yielded as the same object, uncopied."""
+        command = object.__new__(UploadDocumentCommand)
+
+        chunk = b"s" * 700_000
+
+        # Act
+        batches = []
+        async for batch in command._batch_chunks(async_chunk_generator([chunk])):
+            batches.append(batch)
+
+        # Assert: the input chunk itself, not a copy
+        assert len(batches) == 1
+        assert batches[0] is chunk
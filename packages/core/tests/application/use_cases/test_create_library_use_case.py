@@ -88,3 +88,66 @@ async def test_create_library_command_rollback_on_error(mock_uow: MagicMock, moc
 
     # Verify events were NOT published
     mock_event_bus.handle_events.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_library_command_associates_all_configs_once(
+    mock_uow: MagicMock, mock_event_bus: AsyncMock
+) -> None:
+    """Test that every config is associated once, with one LibraryConfigAdded event each."""
+    from uuid import uuid4
+
+    from vdb_core.domain.events.library_events import LibraryConfigAdded
+
+    # Arrange - the read model lists one config twice
+    mock_uow.libraries = AsyncMock()
+    mock_uow.libraries.add = AsyncMock()
+    mock_uow.commit = AsyncMock(return_value=[])
+
+    config_ids = [str(uuid4()), str(uuid4())]
+    mock_config_read_repo = AsyncMock()
+    mock_config_read_repo.get_all = AsyncMock(
+        return_value=[MagicMock(id=config_id) for config_id in [*config_ids, config_ids[0]]]
+    )
+
+    # Act
+    command = CreateLibraryCommand(
+        uow_factory=lambda: mock_uow,
+        message_bus=mock_event_bus,
+        config_read_repo_factory=lambda: mock_config_read_repo,
+    )
+    await command.execute(CreateLibraryInput(name="Test Library"))
+
+    # Assert
+    library = mock_uow.libraries.add.call_args.args[0]
+    added = [event for event in library.events if isinstance(event, LibraryConfigAdded)]
+    assert [str(event.config_id) for event in added] == config_ids
+
+
+@pytest.mark.asyncio
+async def test_create_library_command_reuses_config_ids_within_ttl(
+    mock_uow: MagicMock, mock_event_bus: AsyncMock
+) -> None:
+    """Test that consecutive creations read the config list once until the cache expires."""
+    mock_uow.libraries = AsyncMock()
+    mock_uow.libraries.add = AsyncMock()
+    mock_uow.commit = AsyncMock(return_value=[])
+
+    mock_config_read_repo = AsyncMock()
+    mock_config_read_repo.get_all = AsyncMock(return_value=[])
+
+    command = CreateLibraryCommand(
+        uow_factory=lambda: mock_uow,
+        message_bus=mock_event_bus,
+        config_read_repo_factory=lambda: mock_config_read_repo,
+    )
+    await command.execute(CreateLibraryInput(name="First Library"))
+    await command.execute(CreateLibraryInput(name="Second Library"))
+
+    mock_config_read_repo.get_all.assert_called_once()
+
+    # Once expired, the next creation reads the config list again
+    command._config_ids_expire_at = 0.0
+    await command.execute(CreateLibraryInput(name="Third Library"))
+
+    assert mock_config_read_repo.get_all.call_count == 2
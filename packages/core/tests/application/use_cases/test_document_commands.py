@@ -338,3 +338,5 @@ async def test_create_document_fragment_command_final_fragment(
     assert call_args is not None
     assert call_args[1]["is_final"] is True
     assert call_args[1]["sequence_number"] == 5
+    # Commit produced no events, so the bus is not called
+    mock_event_bus.handle_events.assert_not_called()
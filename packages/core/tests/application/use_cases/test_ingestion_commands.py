@@ -0,0 +1,43 @@
+"""Tests for ingestion commands."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from vdb_core.application.commands import ParseAllFragmentsCommand, ParseAllFragmentsInput
+
+
+@pytest.mark.asyncio
+async def test_parse_all_fragments_keeps_fragment_order(mock_uow: MagicMock, mock_event_bus: AsyncMock) -> None:
+    """Test that extracted contents are added once, in fragment order."""
+    # Arrange
+    fragments = [MagicMock(sequence_number=i) for i in range(3)]
+    contents = {id(fragment): [MagicMock(id=f"content-{fragment.sequence_number}")] for fragment in fragments}
+
+    async def load_fragments():  # type: ignore[no-untyped-def]
+        for fragment in fragments:
+            yield fragment
+
+    mock_document = MagicMock()
+    mock_document.load_fragments = load_fragments
+    mock_library = MagicMock()
+    mock_library.get_document = AsyncMock(return_value=mock_document)
+    mock_library.add_document_extracted_contents = AsyncMock()
+
+    mock_uow.libraries = AsyncMock()
+    mock_uow.libraries.get = AsyncMock(return_value=mock_library)
+    mock_uow.commit = AsyncMock(return_value=[])
+
+    parser = MagicMock()
+    parser.parse = AsyncMock(side_effect=lambda fragment: contents[id(fragment)])
+
+    # Act
+    command = ParseAllFragmentsCommand(uow_factory=lambda: mock_uow, message_bus=mock_event_bus, parser=parser)
+    result = await command.execute(ParseAllFragmentsInput(library_id=str(uuid4()), document_id=str(uuid4())))
+
+    # Assert
+    assert result.extracted_content_ids == ["content-0", "content-1", "content-2"]
+    mock_library.add_document_extracted_contents.assert_awaited_once()
+    added = mock_library.add_document_extracted_contents.call_args.kwargs["extracted_contents"]
+    assert [content.id for content in added] == ["content-0", "content-1", "content-2"]
+    assert parser.parse.await_count == 3
@@ -1,13 +1,17 @@
 """Tests for UploadDocumentCommand."""
 
+import asyncio
 from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from vdb_core.application.commands import (
     CreateDocumentCommand,
     CreateDocumentFragmentCommand,
+    CreateDocumentFragmentInput,
     UploadDocumentCommand,
     UploadDocumentInput,
+    document_commands,
 )
 from vdb_core.domain.entities import Library
 from vdb_core.domain.events import DocumentCreated, DocumentFragmentReceived
@@ -218,3 +222,39 @@ class TestUploadDocumentCommand:
             remaining = (chunk_size * 2) - MAX_FRAGMENT_SIZE_BYTES
             assert fragments[1].size_bytes == remaining
             assert fragments[1].is_last_fragment is True
+
+    async def test_upload_document_bounds_fragment_writes_in_flight(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that no more than MAX_FRAGMENTS_IN_FLIGHT fragment writes run at once."""
+        # Arrange: tiny fragments, so many batches are read while writes are slow
+        monkeypatch.setattr(document_commands, "MAX_FRAGMENT_SIZE_BYTES", 4)
+        live = 0
+        max_live = 0
+        written: list[int] = []
+
+        async def write_fragment(fragment_input: CreateDocumentFragmentInput) -> str:
+            nonlocal live, max_live
+            live += 1
+            max_live = max(max_live, live)
+            await asyncio.sleep(0.001)
+            live -= 1
+            written.append(fragment_input.sequence_number)
+            return f"fragment-{fragment_input.sequence_number}"
+
+        create_doc_cmd = MagicMock()
+        create_doc_cmd.execute = AsyncMock(return_value="00000000-0000-0000-0000-000000000001")
+        create_frag_cmd = MagicMock()
+        create_frag_cmd.execute = AsyncMock(side_effect=write_fragment)
+        command = UploadDocumentCommand(
+            create_document_command=create_doc_cmd,
+            create_fragment_command=create_frag_cmd,
+        )
+
+        # Act
+        await command.execute(
+            input_data=UploadDocumentInput(library_id="00000000-0000-0000-0000-000000000002", filename="test.txt"),
+            chunks=async_chunk_generator([b"abcd"] * 10),
+        )
+
+        # Assert
+        assert max_live == UploadDocumentCommand.MAX_FRAGMENTS_IN_FLIGHT == 1
+        assert written == list(range(10))
@@ -116,3 +116,39 @@ async def test_multiple_fragments_update_timestamps() -> None:
 
     for i in range(1, len(timestamps_lib)):
         assert timestamps_lib[i] > timestamps_lib[i - 1], f"Library timestamp {i} should be > timestamp {i - 1}"
+
+
+@pytest.mark.asyncio
+async def test_extracted_contents_batch_updates_document_once_with_event_per_content() -> None:
+    """Adding a batch of ExtractedContent touches the document and records one event per content."""
+    from uuid import uuid4
+
+    from vdb_core.domain.entities import ExtractedContent
+    from vdb_core.domain.events import ExtractedContentCreated
+    from vdb_core.domain.value_objects import ModalityType
+
+    library = Library(name=LibraryName(value="Test Library"))
+    document = library.add_document(name=DocumentName("Test Doc"))
+    document_initial_updated_at = document.updated_at
+    library.events.clear()
+
+    await asyncio.sleep(0.01)
+
+    fragment_id = uuid4()
+    contents = [
+        ExtractedContent(
+            document_id=document.id,
+            document_fragment_id=fragment_id,
+            content=f"page {i}".encode(),
+            modality=ModalityType.TEXT,
+            modality_sequence_number=i,
+            is_last_of_modality=i == 2,
+        )
+        for i in (1, 2)
+    ]
+    await library.add_document_extracted_contents(document.id, contents)
+
+    assert document.updated_at > document_initial_updated_at
+    assert set(document._extracted_contents) == {content.id for content in contents}
+    assert all(isinstance(event, ExtractedContentCreated) for event in library.events)
+    assert [event.extracted_content_id for event in library.events] == [content.id for content in contents]
@@ -110,6 +110,30 @@ async def test_repository_delete() -> None:
         await repo.get(library.id)
 
 
+@pytest.mark.asyncio
+async def test_repository_get_returns_tracked_instance() -> None:
+    """Test that a tracked entity is returned as-is instead of being loaded again."""
+    from vdb_core.domain.value_objects import LibraryName
+
+    repo = MockLibraryRepository()
+    library = Library(name=LibraryName(value="Test Library"))
+    repo._storage[str(library.id)] = library
+
+    first = await repo.get(library.id)
+    # A fresh load would return whatever storage holds now
+    repo._storage[str(library.id)] = Library(name=LibraryName(value="Other Library"))
+    second = await repo.get(library.id)
+
+    assert second is first
+
+    # Once tracking is reset (new transaction / rollback), get loads again
+    repo.seen.clear()
+    third = await repo.get(library.id)
+
+    assert third is not first
+    assert third.name.value == "Other Library"
+
+
 @pytest.mark.asyncio
 async def test_repository_stream() -> None:
     """Test that repository can stream entities."""
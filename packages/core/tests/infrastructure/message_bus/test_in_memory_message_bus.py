@@ -1,5 +1,6 @@
 """Tests for InMemoryMessageBus."""
 
+import asyncio
 from uuid import uuid4
 
 import pytest
@@ -57,3 +58,60 @@ class TestInMemoryMessageBus:
 
         # Assert
         assert len(bus.handled_events) == 2
+
+    async def test_handlers_run_concurrently(self) -> None:
+        """Test that independent handlers overlap instead of running one after another."""
+        # Arrange
+        bus = InMemoryMessageBus()
+        from vdb_core.domain.value_objects import LibraryName
+
+        running = 0
+        max_running = 0
+
+        async def handler(_event: object) -> None:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        bus.register_handler(LibraryCreated, handler)
+        bus.register_handler(LibraryCreated, handler)
+
+        # Act
+        await bus.handle_events([LibraryCreated(library_id=uuid4(), name=LibraryName(value="Test"))])
+
+        # Assert
+        assert max_running == 2
+        assert running == 0
+
+    async def test_serial_handlers_keep_event_and_registration_order(self) -> None:
+        """Test that serial handlers run in order and only for their exact event type."""
+        # Arrange
+        bus = InMemoryMessageBus()
+        from vdb_core.domain.value_objects import DocumentName, LibraryName
+
+        calls: list[tuple[str, str]] = []
+
+        def record(tag: str):  # type: ignore[no-untyped-def]
+            async def handler(event: LibraryCreated) -> None:
+                await asyncio.sleep(0.01 if tag == "first" else 0)
+                calls.append((tag, event.name.value))
+
+            return handler
+
+        bus.register_handler(LibraryCreated, record("first"), serial=True)
+        bus.register_handler(LibraryCreated, record("second"), serial=True)
+
+        events = [
+            LibraryCreated(library_id=uuid4(), name=LibraryName(value="A")),
+            DocumentCreated(document_id=uuid4(), library_id=uuid4(), name=DocumentName("Doc")),
+            LibraryCreated(library_id=uuid4(), name=LibraryName(value="B")),
+        ]
+
+        # Act
+        await bus.handle_events(events)
+
+        # Assert
+        assert calls == [("first", "A"), ("second", "A"), ("first", "B"), ("second", "B")]
+        assert len(bus.handled_events) == 3
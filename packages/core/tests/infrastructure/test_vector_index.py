@@ -0,0 +1,55 @@
+"""Tests for the core in-memory VectorIndex."""
+
+import pytest
+from vdb_core.domain.value_objects import VectorIndexingStrategy, VectorSimilarityMetric
+from vdb_core.infrastructure.vector_index import VectorIndex, VectorIndexManager
+
+
+class TestVectorIndex:
+    """Test suite for VectorIndex removal."""
+
+    @pytest.fixture
+    def index(self) -> VectorIndex:
+        """Create a cosine index with eight axis-aligned vectors."""
+        index = VectorIndex(8, VectorIndexingStrategy.FLAT.value, VectorSimilarityMetric.COSINE)
+        for i in range(8):
+            vector = [0.0] * 8
+            vector[i] = 1.0
+            index.add(f"id{i}", vector)
+        return index
+
+    def test_remove_skips_row_without_compacting(self, index: VectorIndex) -> None:
+        """Test that a single removal only deactivates the row."""
+        assert index.remove("id0") is True
+        assert index.remove("id0") is False
+
+        assert index.count == 7
+        assert len(index.embedding_ids) == 8
+        ids, _ = index.search([1.0] + [0.0] * 7, k=8)
+        assert "id0" not in ids
+        assert len(ids) == 7
+
+    def test_remove_many_compacts_past_threshold(self, index: VectorIndex) -> None:
+        """Test that removing over a quarter of the rows compacts storage and ids."""
+        assert index.remove_many(["id1", "id3", "id5", "missing"]) == 3
+
+        assert index.count == 5
+        assert index.embedding_ids == ["id0", "id2", "id4", "id6", "id7"]
+        assert index.id_to_index == {eid: i for i, eid in enumerate(index.embedding_ids)}
+        assert index.vectors is not None
+        assert index.vectors.shape == (5, 8)
+        ids, scores = index.search([0.0, 0.0, 1.0] + [0.0] * 5, k=1)
+        assert ids == ["id2"]
+        assert scores[0] == pytest.approx(1.0)
+
+
+class TestVectorIndexManager:
+    """Test suite for VectorIndexManager removal."""
+
+    def test_remove_vectors_reports_not_found(self) -> None:
+        """Test that remove_vectors splits removed and unknown ids."""
+        manager = VectorIndexManager(metric=VectorSimilarityMetric.COSINE)
+        manager.add_vector("a", "lib", "cfg", [1.0, 0.0], 2, VectorIndexingStrategy.FLAT.value)
+        manager.add_vector("b", "lib", "cfg", [0.0, 1.0], 2, VectorIndexingStrategy.FLAT.value)
+
+        assert manager.remove_vectors("lib", "cfg", ["a", "missing"]) == (1, 1)
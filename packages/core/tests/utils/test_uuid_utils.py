@@ -0,0 +1,24 @@
+"""Tests for UUID utilities."""
+
+from uuid import UUID, uuid4
+
+import pytest
+from vdb_core.utils import parse_uuid
+
+
+def test_parse_uuid_returns_equal_uuid() -> None:
+    """Test that parse_uuid parses the same value as UUID()."""
+    value = str(uuid4())
+    assert parse_uuid(value) == UUID(value)
+
+
+def test_parse_uuid_reuses_parsed_instance() -> None:
+    """Test that repeated parses of the same string return the cached instance."""
+    value = str(uuid4())
+    assert parse_uuid(value) is parse_uuid(value)
+
+
+def test_parse_uuid_rejects_invalid_string() -> None:
+    """Test that invalid strings still raise ValueError."""
+    with pytest.raises(ValueError, match="badly formed"):
+        parse_uuid("not-a-uuid")
@@ -29,6 +29,9 @@ CREATE INDEX IF NOT EXISTS idx_embeddings_chunk
     ON embeddings(chunk_id);
 CREATE INDEX IF NOT EXISTS idx_embeddings_dimensions
     ON embeddings(dimensions);
+-- Keyset pagination for search service bootstrap
+CREATE INDEX IF NOT EXISTS idx_embeddings_library_config_id
+    ON embeddings(library_id, vectorization_config_id, id);
 
 -- GIN index on vector JSONB for fast lookups (optional)
 CREATE INDEX IF NOT EXISTS idx_embeddings_vector
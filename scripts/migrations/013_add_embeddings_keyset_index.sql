@@ -0,0 +1,21 @@
+-- Migration 013: Add composite index for keyset pagination over embeddings
+--
+-- The search service bootstraps its in-memory indices by paging through
+-- embeddings ordered by (library_id, vectorization_config_id, id). Using
+-- LIMIT/OFFSET made Postgres re-scan and discard every previous page, so a
+-- full bootstrap was quadratic in the number of rows. Keyset pagination
+-- resumes from the last seen key instead, which needs a matching btree index.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_embeddings_library_config_id
+    ON embeddings(library_id, vectorization_config_id, id);
+
+COMMIT;
+
+-- Log success
+DO $$
+BEGIN
+    RAISE NOTICE 'Migration 013: Added idx_embeddings_library_config_id';
+    RAISE NOTICE '  - Supports keyset pagination in search service bootstrap';
+END $$;